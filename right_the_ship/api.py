@@ -1,8 +1,24 @@
 from ninja import NinjaAPI
 from .core.api.user import router as user_router
 from .core.api.task import router as task_router
+from .core.api.sync import router as sync_router
+from .core.api.metrics import router as metrics_router
+from .core.api.leaderboard import router as leaderboard_router
+from .core.api.async_user import router as async_user_router
+from .core.api.async_task import router as async_task_router
+from .core.utils.request_metrics import TimedJSONRenderer
 
-api = NinjaAPI()
+api = NinjaAPI(renderer=TimedJSONRenderer())
 
 api.add_router("/users", user_router)
 api.add_router("/tasks", task_router)
+api.add_router("/sync", sync_router)
+api.add_router("/metrics", metrics_router)
+api.add_router("/leaderboard", leaderboard_router)
+
+# Async handlers for the hot routes, served under /api/async/ when running
+# under an ASGI server (see right_the_ship/asgi.py)
+async_api = NinjaAPI(urls_namespace="async_api", renderer=TimedJSONRenderer())
+
+async_api.add_router("/users", async_user_router)
+async_api.add_router("/tasks", async_task_router)
@@ -0,0 +1,153 @@
+"""
+Compares concurrent-request throughput of the sync (/api/) and async
+(/api/async/) stacks.
+
+In-process, against a throwaway test database:
+
+    python -m right_the_ship.benchmarks.bench_async --requests 2000 --concurrency 50
+
+Against a running server, e.g. `uvicorn right_the_ship.asgi:application --workers 1`:
+
+    python -m right_the_ship.benchmarks.bench_async \
+        --base-url http://127.0.0.1:8000 --user-id 1 --task-id 1
+
+Only the in-process numbers compare the handlers themselves; the live numbers
+also include the server, so run both stacks under the same one.
+"""
+
+import argparse
+import asyncio
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from right_the_ship.benchmarks.harness import (
+    setup_django,
+    throwaway_database,
+    write_results,
+)
+
+PREFIXES = {"sync": "/api", "async": "/api/async"}
+
+
+def route_paths(prefix: str, user_id: int, task_id: int):
+    return [
+        f"{prefix}/tasks/{task_id}/",
+        f"{prefix}/tasks/?user_id={user_id}&limit=50",
+        f"{prefix}/users/{user_id}/",
+    ]
+
+
+def summarize(started: float, statuses: list) -> dict:
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(statuses),
+        "errors": sum(status != 200 for status in statuses),
+        "seconds": elapsed,
+        "requests_per_second": len(statuses) / elapsed,
+    }
+
+
+def run_threaded(get, paths, requests: int, concurrency: int) -> dict:
+    """Issues `requests` blocking GETs from `concurrency` threads."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        statuses = list(pool.map(get, (paths[i % len(paths)] for i in range(requests))))
+    return summarize(started, statuses)
+
+
+async def run_async(client, paths, requests: int, concurrency: int) -> dict:
+    """Issues `requests` GETs with at most `concurrency` in flight on one loop."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def get(path):
+        async with semaphore:
+            return (await client.get(path)).status_code
+
+    started = time.perf_counter()
+    statuses = await asyncio.gather(
+        *(get(paths[i % len(paths)]) for i in range(requests))
+    )
+    return summarize(started, statuses)
+
+
+def seed(tasks: int):
+    from right_the_ship.core.models import CustomUser, Task
+
+    user = CustomUser.objects.create(username="bench", email="bench@example.com")
+    Task.objects.bulk_create(Task(user=user, title=f"Task {i}") for i in range(tasks))
+    return user.id, Task.objects.filter(user=user).values_list("id", flat=True)[0]
+
+
+def in_process(args) -> dict:
+    from django.test import AsyncClient, Client
+
+    with throwaway_database():
+        user_id, task_id = seed(args.tasks)
+
+        def sync_get(path):
+            return Client().get(path).status_code
+
+        return {
+            "sync": run_threaded(
+                sync_get,
+                route_paths(PREFIXES["sync"], user_id, task_id),
+                args.requests,
+                args.concurrency,
+            ),
+            "async": asyncio.run(
+                run_async(
+                    AsyncClient(),
+                    route_paths(PREFIXES["async"], user_id, task_id),
+                    args.requests,
+                    args.concurrency,
+                )
+            ),
+        }
+
+
+def live(args) -> dict:
+    def get(url):
+        with urllib.request.urlopen(url) as response:
+            return response.status
+
+    results = {}
+    for stack, prefix in PREFIXES.items():
+        urls = [
+            args.base_url.rstrip("/") + path
+            for path in route_paths(prefix, args.user_id, args.task_id)
+        ]
+        results[stack] = run_threaded(get, urls, args.requests, args.concurrency)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--base-url", help="Benchmark a running server instead.")
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--task-id", type=int, default=1)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    if args.base_url:
+        results = live(args)
+    else:
+        setup_django()
+        results = in_process(args)
+
+    results["concurrency"] = args.concurrency
+    for stack in PREFIXES:
+        print(
+            f"{stack:>5}: {results[stack]['requests_per_second']:8.1f} req/s "
+            f"({results[stack]['errors']} errors)"
+        )
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares the vectorized "due on a date" computation with expanding each rule
+on its own.
+
+    python -m right_the_ship.benchmarks.bench_occurrences --rules 500000
+"""
+
+import argparse
+import random
+from datetime import date, timedelta
+
+from right_the_ship.benchmarks.harness import measure, setup_django, write_results
+
+
+def synthetic_rules(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    frequencies = ["daily", "weekly", "monthly", "yearly"]
+    for task_id in range(1, count + 1):
+        frequency = rng.choice(frequencies)
+        start_date = date(2020, 1, 1) + timedelta(days=rng.randrange(2000))
+        end_date = (
+            start_date + timedelta(days=rng.randrange(30, 2000))
+            if rng.random() < 0.5
+            else None
+        )
+        day = {
+            "daily": None,
+            "weekly": rng.randrange(7),
+            "monthly": rng.randrange(1, 32),
+            "yearly": rng.randrange(1, 367),
+        }[frequency]
+        user_id = rng.randrange(1, count // 10 + 2)
+        yield task_id, user_id, frequency, start_date, end_date, day
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, default=200_000)
+    parser.add_argument("--date", type=date.fromisoformat, default=date(2024, 2, 29))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    from right_the_ship.core.utils.recurrence_batch import (
+        build_rule_arrays,
+        due_on,
+        due_on_per_row,
+    )
+
+    rows = list(synthetic_rules(args.rules))
+    rules = build_rule_arrays(rows)
+
+    vectorized_ids = sorted(due_on(rules, args.date)[0].tolist())
+    per_row_ids = sorted(task_id for task_id, _ in due_on_per_row(rows, args.date))
+    assert vectorized_ids == per_row_ids, "vectorized and per-row results differ"
+
+    results = {
+        "rules": args.rules,
+        "date": args.date,
+        "due": len(vectorized_ids),
+        "build_arrays": measure(lambda: build_rule_arrays(rows), repeat=args.repeat),
+        "vectorized": measure(lambda: due_on(rules, args.date), repeat=args.repeat),
+        "per_row": measure(lambda: due_on_per_row(rows, args.date), repeat=args.repeat),
+    }
+
+    print(f"{args.rules} rules, {results['due']} due on {args.date}")
+    for name in ("build_arrays", "vectorized", "per_row"):
+        print(f"  {name:<13} {results[name]['median'] * 1000:10.2f} ms")
+    print(
+        "  speedup       "
+        f"{results['per_row']['median'] / results['vectorized']['median']:10.1f}x"
+    )
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares the schema path for task responses (load models, build
+TaskDetailSchema/TaskPageSchema, validate and render them the way ninja
+does) with the fast path the read routes use (values() rows turned into
+dicts by task_detail_from_row and encoded by fast_json.dumps), at several
+page sizes, against a throwaway test database.
+
+    python -m right_the_ship.benchmarks.bench_serialization --sizes 1 100 10000
+
+"serialize" times encoding already fetched tasks; "fetch" adds the query.
+"""
+
+import argparse
+import json
+
+from right_the_ship.benchmarks.harness import (
+    measure,
+    setup_django,
+    throwaway_database,
+    write_results,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    from ninja.responses import NinjaJSONEncoder
+
+    from right_the_ship.core.api.task import generate_task_detail_schemas
+    from right_the_ship.core.models import Task
+    from right_the_ship.core.schemas.task import (
+        TASK_DETAIL_FIELDS,
+        TaskPageSchema,
+        task_detail_from_row,
+    )
+    from right_the_ship.core.utils.factories import seed_tasks, seed_users
+    from right_the_ship.core.utils.fast_json import dumps, orjson
+
+    def schema_page(tasks):
+        page = TaskPageSchema(items=generate_task_detail_schemas(tasks))
+        # Ninja validates the returned value against the route's schema again
+        # before rendering it
+        data = TaskPageSchema.model_validate(page.model_dump()).model_dump()
+        return json.dumps(data, cls=NinjaJSONEncoder).encode()
+
+    def fast_page(rows):
+        return dumps(
+            {"items": [task_detail_from_row(row) for row in rows], "next_cursor": None}
+        )
+
+    results = {"encoder": "orjson" if orjson else "json", "sizes": {}}
+    with throwaway_database():
+        user_id = seed_users(1, prefix="bench-serialization")[0]
+        seed_tasks(max(args.sizes), [user_id])
+        tasks = Task.objects.filter(user_id=user_id).order_by("id")
+
+        for size in args.sizes:
+            models = list(tasks.select_related("recurringtask")[:size])
+            rows = list(tasks.values(*TASK_DETAIL_FIELDS)[:size])
+            assert json.loads(schema_page(models)) == json.loads(fast_page(rows))
+
+            number = max(1, 1000 // size)
+            timings = {
+                "schema_serialize": measure(
+                    lambda: schema_page(models), args.repeat, number
+                ),
+                "fast_serialize": measure(lambda: fast_page(rows), args.repeat, number),
+                "schema_fetch": measure(
+                    lambda: schema_page(
+                        list(tasks.select_related("recurringtask")[:size])
+                    ),
+                    args.repeat,
+                    number,
+                ),
+                "fast_fetch": measure(
+                    lambda: fast_page(list(tasks.values(*TASK_DETAIL_FIELDS)[:size])),
+                    args.repeat,
+                    number,
+                ),
+            }
+            results["sizes"][str(size)] = timings
+
+            print(f"{size} tasks ({results['encoder']})")
+            for kind in ("serialize", "fetch"):
+                schema = timings[f"schema_{kind}"]["median"]
+                fast = timings[f"fast_{kind}"]["median"]
+                print(
+                    f"  {kind:<10} schema {schema * 1000:9.3f} ms  "
+                    f"fast {fast * 1000:9.3f} ms  {schema / fast:5.1f}x"
+                )
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measures signup throughput through POST /api/users/ for each password hasher
+and password pool size, against a throwaway test database.
+
+    python -m right_the_ship.benchmarks.bench_signup --signups 64 --workers 1 2 4
+
+Hasher costs come from settings (PBKDF2_ITERATIONS, SCRYPT_WORK_FACTOR,
+ARGON2_*), so export those to compare tunings. Argon2 is skipped unless
+argon2-cffi is installed.
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from right_the_ship.benchmarks.harness import (
+    setup_django,
+    throwaway_database,
+    write_results,
+)
+
+
+def run_signups(client_factory, signups: int, concurrency: int, prefix: str) -> dict:
+    def signup(i):
+        response = client_factory().post(
+            "/api/users/",
+            {
+                "username": f"{prefix}-{i}",
+                "password": "correct horse",
+                "email": f"{prefix}-{i}@example.com",
+            },
+            content_type="application/json",
+        )
+        return response.status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        statuses = list(pool.map(signup, range(signups)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "signups": signups,
+        "rejected": statuses.count(429),
+        "errors": sum(status not in (200, 429) for status in statuses),
+        "seconds": elapsed,
+        "signups_per_second": (signups - statuses.count(429)) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--signups", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count()])
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--hashers", nargs="+", default=["pbkdf2", "scrypt", "argon2"])
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.test import Client, override_settings
+
+    from right_the_ship.core.utils.password_pool import shutdown_password_pool
+
+    results = {"cpus": os.cpu_count(), "executor": args.executor, "runs": []}
+    with throwaway_database():
+        for hasher in args.hashers:
+            if hasher == "argon2" and importlib.util.find_spec("argon2") is None:
+                print("argon2: skipped, argon2-cffi is not installed")
+                continue
+
+            for workers in args.workers:
+                with override_settings(
+                    PASSWORD_HASHERS=[settings.PASSWORD_HASHER_CLASSES[hasher]],
+                    PASSWORD_HASH_EXECUTOR=args.executor,
+                    PASSWORD_HASH_WORKERS=workers,
+                    # Queue every signup so the run measures hashing, not 429s
+                    PASSWORD_HASH_QUEUE=args.signups,
+                ):
+                    shutdown_password_pool()
+                    run = run_signups(
+                        Client, args.signups, args.concurrency, f"{hasher}-{workers}"
+                    )
+                    shutdown_password_pool()
+
+                run.update(
+                    hasher=hasher,
+                    workers=workers,
+                    per_worker=run["signups_per_second"] / workers,
+                )
+                results["runs"].append(run)
+                print(
+                    f"{hasher:>6} x{workers:<3} {run['signups_per_second']:7.2f} "
+                    f"signups/s ({run['per_worker']:.2f} per worker)"
+                )
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Compares streak and completion-rate reads from the per-rule completion
+bitsets with the same history stored one TaskOccurrence row per occurrence,
+for daily rules with several years of history, against a throwaway test
+database.
+
+    python -m right_the_ship.benchmarks.bench_streaks --rules 200 --years 1 5
+
+"compute" times the streak math on already fetched history; "fetch" adds
+the query.
+"""
+
+import argparse
+import random
+from datetime import timedelta
+
+from right_the_ship.benchmarks.harness import (
+    measure,
+    setup_django,
+    throwaway_database,
+    write_results,
+)
+
+
+def row_streak(flags):
+    """Streaks over completion flags in date order, one row at a time."""
+    longest = run = completed = 0
+    for flag in flags:
+        run = run + 1 if flag else 0
+        longest = max(longest, run)
+        completed += flag
+    current = run
+    if current == 0:
+        # Today's open occurrence doesn't break the streak
+        for flag in reversed(flags[:-1]):
+            if not flag:
+                break
+            current += 1
+    return current, longest, completed, len(flags)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 5])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.utils import timezone
+
+    from right_the_ship.core.models import RecurringTask, Task, TaskOccurrence
+    from right_the_ship.core.utils.completion_bits import to_bytes
+    from right_the_ship.core.utils.factories import seed_users
+
+    rng = random.Random(0)
+    today = timezone.localdate()
+    results = {"rules": args.rules, "years": {}}
+
+    with throwaway_database():
+        user_id = seed_users(1, prefix="bench-streaks")[0]
+
+        for years in args.years:
+            days = 365 * years
+            start_date = today - timedelta(days=days - 1)
+            tasks = Task.objects.bulk_create(
+                Task(user_id=user_id, title=f"Daily {i}") for i in range(args.rules)
+            )
+
+            rules, rows = [], []
+            for task in tasks:
+                flags = [rng.random() < 0.8 for _ in range(days)]
+                value = sum(1 << index for index, flag in enumerate(flags) if flag)
+                rules.append(
+                    RecurringTask(
+                        task=task,
+                        frequency=RecurringTask.DAILY,
+                        start_date=start_date,
+                        completion_bits=to_bytes(value),
+                    )
+                )
+                rows.extend(
+                    TaskOccurrence(
+                        task=task,
+                        user_id=user_id,
+                        occurrence_date=start_date + timedelta(days=index),
+                        completed=flag,
+                    )
+                    for index, flag in enumerate(flags)
+                )
+            # bulk_create skips save(), so no window is materialized on top
+            RecurringTask.objects.bulk_create(rules)
+            TaskOccurrence.objects.bulk_create(rows, batch_size=5000)
+
+            task_ids = [task.id for task in tasks]
+            bit_rules = RecurringTask.objects.filter(task_id__in=task_ids).only(
+                "task_id",
+                "frequency",
+                "start_date",
+                "end_date",
+                "day",
+                "completion_bits",
+            )
+            occurrences = TaskOccurrence.objects.order_by("occurrence_date")
+
+            def bits_fetch():
+                return [rule.streak(today) for rule in bit_rules]
+
+            def rows_fetch():
+                return [
+                    row_streak(
+                        list(
+                            occurrences.filter(task_id=task_id).values_list(
+                                "completed", flat=True
+                            )
+                        )
+                    )
+                    for task_id in task_ids
+                ]
+
+            loaded_rules = list(bit_rules)
+            loaded_flags = [
+                list(
+                    occurrences.filter(task_id=task_id).values_list(
+                        "completed", flat=True
+                    )
+                )
+                for task_id in task_ids
+            ]
+            assert [tuple(s) for s in bits_fetch()] == rows_fetch()
+
+            timings = {
+                "bits_compute": measure(
+                    lambda: [rule.streak(today) for rule in loaded_rules],
+                    args.repeat,
+                ),
+                "rows_compute": measure(
+                    lambda: [row_streak(flags) for flags in loaded_flags],
+                    args.repeat,
+                ),
+                "bits_fetch": measure(bits_fetch, args.repeat),
+                "rows_fetch": measure(rows_fetch, args.repeat),
+                "bits_bytes_per_rule": (days + 7) // 8,
+                "rows_per_rule": days,
+            }
+            results["years"][str(years)] = timings
+
+            print(
+                f"{args.rules} daily rules, {years} years: {timings['rows_per_rule']} "
+                f"rows or {timings['bits_bytes_per_rule']} bytes each"
+            )
+            for kind in ("compute", "fetch"):
+                rows = timings[f"rows_{kind}"]["median"]
+                bits = timings[f"bits_{kind}"]["median"]
+                print(
+                    f"  {kind:<8} rows {rows * 1000:9.3f} ms  "
+                    f"bits {bits * 1000:9.3f} ms  {rows / bits:6.1f}x"
+                )
+
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
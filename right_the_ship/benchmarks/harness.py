@@ -0,0 +1,51 @@
+import contextlib
+import json
+import os
+import statistics
+import time
+
+import django
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "right_the_ship.settings")
+    django.setup()
+
+
+def measure(fn, repeat: int = 5, number: int = 1) -> dict:
+    """Times `number` calls of `fn`, `repeat` times, and summarizes per-call seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - started) / number)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def write_results(path: str, results: dict):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True, default=str)
+
+
+@contextlib.contextmanager
+def throwaway_database():
+    """Runs the block against a throwaway test database, like the test runner."""
+    from django.test.runner import DiscoverRunner
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    runner = DiscoverRunner(verbosity=0)
+    setup_test_environment()
+    old_config = runner.setup_databases()
+    try:
+        yield
+    finally:
+        runner.teardown_databases(old_config)
+        teardown_test_environment()
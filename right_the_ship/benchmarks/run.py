@@ -0,0 +1,156 @@
+"""
+Benchmarks the task and user API routes at several data scales and writes
+the timings as JSON for run-over-run comparison.
+
+Through the Django test client, seeding a throwaway database per scale:
+
+    python -m right_the_ship.benchmarks.run --scales 1000 100000 --output after.json
+    python -m right_the_ship.benchmarks.run --scales 1000 100000 --compare before.json
+
+Against a live server (e.g. `uvicorn right_the_ship.asgi:application`) that
+shares this checkout's database settings; the configured database is seeded
+first unless --no-seed is given:
+
+    python -m right_the_ship.benchmarks.run --base-url http://127.0.0.1:8000 --scales 100000
+
+Numbers are seconds per call. Delete calls use up the last probe user's
+tasks, so repeat * number must stay below TASKS_PER_USER.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+from right_the_ship.benchmarks.harness import (
+    measure,
+    setup_django,
+    throwaway_database,
+    write_results,
+)
+from right_the_ship.benchmarks.scenarios import (
+    ALL_SCENARIOS,
+    DEFAULT_SCENARIOS,
+    Scenarios,
+    http_caller,
+    django_client_caller,
+)
+
+
+def run_scenarios(call, dataset, names, repeat: int, number: int) -> dict:
+    scenarios = Scenarios(dataset)
+    results = {}
+    for name in names:
+        scenario = getattr(scenarios, name)
+        statuses = set()
+
+        def once():
+            statuses.add(scenario(call))
+
+        # One untimed call warms caches and catches broken scenarios early
+        once()
+        results[name] = measure(once, repeat=repeat, number=number)
+        if statuses != {200}:
+            raise RuntimeError(f"{name} returned {sorted(statuses)}")
+        print(f"  {name:<18} {results[name]['median'] * 1000:9.3f} ms")
+    return results
+
+
+def run_metadata(args) -> dict:
+    import django
+    from django.db import connection
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "target": args.base_url or "test-client",
+        "repeat": args.repeat,
+        "number": args.number,
+    }
+
+
+def compare(previous: dict, current: dict):
+    """Prints the median change of every scenario both runs measured."""
+    print("\nscale    scenario            before (ms)  after (ms)   change")
+    for scale, scenarios in current["results"].items():
+        for name, timing in scenarios.items():
+            before = previous.get("results", {}).get(scale, {}).get(name)
+            if before is None:
+                continue
+            change = timing["median"] / before["median"] - 1
+            print(
+                f"{scale:<8} {name:<18} {before['median'] * 1000:11.3f} "
+                f"{timing['median'] * 1000:11.3f} {change:+8.1%}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scales", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=ALL_SCENARIOS, default=DEFAULT_SCENARIOS
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--base-url", help="Benchmark a running server instead.")
+    parser.add_argument("--no-seed", action="store_true")
+    parser.add_argument("--output", help="Write results as JSON to this path.")
+    parser.add_argument("--compare", help="A previous --output file to compare with.")
+    args = parser.parse_args()
+
+    setup_django()
+    from right_the_ship.benchmarks.seed import load_dataset, seed_dataset
+
+    results = {"meta": run_metadata(args), "results": {}}
+
+    if args.base_url:
+        # One database behind the server, so only one scale per run
+        scale = args.scales[0]
+        dataset = load_dataset() if args.no_seed else seed_dataset(scale)
+        print(f"{dataset.tasks} tasks, {args.base_url}")
+        results["results"][str(dataset.tasks)] = run_scenarios(
+            http_caller(args.base_url),
+            dataset,
+            args.scenarios,
+            args.repeat,
+            args.number,
+        )
+    else:
+        for scale in args.scales:
+            with throwaway_database():
+                dataset = seed_dataset(scale)
+                print(f"{scale} tasks, test client")
+                results["results"][str(scale)] = run_scenarios(
+                    django_client_caller(),
+                    dataset,
+                    args.scenarios,
+                    args.repeat,
+                    args.number,
+                )
+
+    if args.output:
+        write_results(args.output, results)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+One call to an API route per scenario. Scenarios pick ids from the seeded
+Dataset and make their request through a `call(method, path, payload=None)
+-> status` function, so the same scenarios run through the Django test client
+and against a live server.
+"""
+
+import itertools
+import json
+import random
+import urllib.error
+import urllib.request
+from datetime import date, datetime, time, timedelta, timezone
+
+
+class Scenarios:
+    """Scenario callables bound to one dataset, with their own id cursors."""
+
+    def __init__(self, dataset, seed: int = 0):
+        self.dataset = dataset
+        self.rng = random.Random(seed)
+        self.victims = iter(dataset.victim_task_ids)
+        self.counter = itertools.count()
+
+    def user_id(self):
+        return self.rng.choice(self.dataset.probe_user_ids[:-1])
+
+    def task_id(self):
+        return self.rng.choice(self.dataset.probe_task_ids)
+
+    def get_task(self, call):
+        return call("GET", f"/api/tasks/{self.task_id()}/")
+
+    def list_tasks(self, call):
+        return call("GET", f"/api/tasks/?user_id={self.user_id()}&limit=50")
+
+    def list_occurrences(self, call):
+        start = date.today()
+        end = start + timedelta(days=30)
+        return call(
+            "GET",
+            f"/api/tasks/occurrences/?user_id={self.user_id()}&from={start}&to={end}",
+        )
+
+    def sync_tasks(self, call):
+        return call("GET", f"/api/sync/?user_id={self.user_id()}")
+
+    def create_task(self, call):
+        return call(
+            "POST",
+            "/api/tasks/",
+            {
+                "user_id": self.user_id(),
+                "title": f"Benchmark {next(self.counter)}",
+                # An aware midnight, the only time of day a due date accepts
+                "due_date": datetime.combine(
+                    date.today() + timedelta(days=7), time.min, timezone.utc
+                ).isoformat(),
+                "frequency": "weekly",
+                "start_date": str(date.today()),
+                "day": 3,
+            },
+        )
+
+    def update_task(self, call):
+        return call(
+            "PATCH",
+            f"/api/tasks/{self.task_id()}/",
+            {
+                "user_id": self.user_id(),
+                "title": f"Updated {next(self.counter)}",
+                "completed": True,
+            },
+        )
+
+    def delete_task(self, call):
+        return call("DELETE", f"/api/tasks/{next(self.victims)}/")
+
+    def get_user(self, call):
+        return call("GET", f"/api/users/{self.user_id()}/")
+
+    def update_user(self, call):
+        user_id = self.user_id()
+        return call(
+            "PATCH",
+            f"/api/users/{user_id}/",
+            {"username": f"bench-{user_id}-{next(self.counter)}"},
+        )
+
+    def create_user(self, call):
+        number = next(self.counter)
+        return call(
+            "POST",
+            "/api/users/",
+            {
+                "username": f"signup-{number}",
+                "password": "correct horse",
+                "email": f"signup-{number}@example.com",
+            },
+        )
+
+
+# create_user is left out by default: password hashing dominates it, and
+# bench_signup measures that on its own
+DEFAULT_SCENARIOS = [
+    "get_task",
+    "list_tasks",
+    "list_occurrences",
+    "sync_tasks",
+    "create_task",
+    "update_task",
+    "delete_task",
+    "get_user",
+    "update_user",
+]
+ALL_SCENARIOS = DEFAULT_SCENARIOS + ["create_user"]
+
+
+def django_client_caller():
+    from django.test import Client
+
+    client = Client()
+
+    def call(method, path, payload=None):
+        return client.generic(
+            method,
+            path,
+            json.dumps(payload) if payload is not None else "",
+            content_type="application/json",
+        ).status_code
+
+    return call
+
+
+def http_caller(base_url: str):
+    base_url = base_url.rstrip("/")
+
+    def call(method, path, payload=None):
+        request = urllib.request.Request(
+            base_url + path,
+            data=json.dumps(payload).encode() if payload is not None else None,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+    return call
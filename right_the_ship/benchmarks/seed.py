@@ -0,0 +1,88 @@
+from typing import List, NamedTuple
+
+from django.db import transaction
+
+# Users the benchmark scenarios read and write as. The last probe user's
+# tasks are the ones the delete scenario removes.
+PROBE_USERS = 10
+TASKS_PER_USER = 100
+
+
+class Dataset(NamedTuple):
+    tasks: int
+    probe_user_ids: List[int]
+    # Task ids of each probe user except the last, for reads and updates
+    probe_task_ids: List[int]
+    # Task ids of the last probe user, for deletes
+    victim_task_ids: List[int]
+
+
+def seed_dataset(
+    tasks: int,
+    recurring_ratio: float = 0.2,
+    batch_size: int = 5000,
+    seed: int = 0,
+) -> Dataset:
+    """
+    Bulk inserts `tasks` tasks spread over users (TASKS_PER_USER each) with
+    `recurring_ratio` of them recurring, then materializes the probe users'
+    occurrences.
+    """
+    from right_the_ship.core.models import RecurringTask, TaskOccurrence
+    from right_the_ship.core.utils.factories import seed_tasks, seed_users
+
+    users = max(PROBE_USERS, tasks // TASKS_PER_USER)
+    probe_tasks = min(tasks, PROBE_USERS * TASKS_PER_USER)
+
+    with transaction.atomic():
+        user_ids = seed_users(users, batch_size, seed, prefix=f"bench{seed}-user")
+        probe_user_ids = user_ids[:PROBE_USERS]
+
+        # Probe users get a full, predictable set of tasks each
+        for number, user_id in enumerate(probe_user_ids):
+            seed_tasks(
+                probe_tasks // PROBE_USERS,
+                [user_id],
+                recurring_ratio,
+                batch_size=batch_size,
+                seed=seed + number,
+            )
+        seed_tasks(
+            tasks - probe_tasks, user_ids, recurring_ratio, batch_size=batch_size
+        )
+
+    TaskOccurrence.objects.refresh(
+        RecurringTask.objects.filter(task__user_id__in=probe_user_ids)
+    )
+    return probe_dataset(tasks, probe_user_ids)
+
+
+def load_dataset() -> Dataset:
+    """Picks probe users from an already seeded database, for live runs."""
+    from right_the_ship.core.models import CustomUser, Task
+
+    probe_user_ids = list(
+        CustomUser.objects.filter(task__isnull=False)
+        .distinct()
+        .order_by("id")
+        .values_list("id", flat=True)[:PROBE_USERS]
+    )
+    return probe_dataset(Task.objects.count(), probe_user_ids)
+
+
+def probe_dataset(tasks: int, probe_user_ids: List[int]) -> Dataset:
+    from right_the_ship.core.models import Task
+
+    def task_ids(user_ids):
+        return list(
+            Task.objects.filter(user_id__in=user_ids)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    return Dataset(
+        tasks=tasks,
+        probe_user_ids=probe_user_ids,
+        probe_task_ids=task_ids(probe_user_ids[:-1]),
+        victim_task_ids=task_ids(probe_user_ids[-1:]),
+    )
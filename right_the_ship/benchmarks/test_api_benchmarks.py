@@ -0,0 +1,49 @@
+"""
+pytest-benchmark versions of the runner's scenarios:
+
+    pip install pytest-benchmark
+    BENCH_TASKS=100000 pytest right_the_ship/benchmarks/test_api_benchmarks.py \
+        --benchmark-json after.json --benchmark-compare
+
+Skipped when pytest-benchmark is not installed.
+"""
+
+import os
+
+import pytest
+
+from right_the_ship.benchmarks.harness import setup_django, throwaway_database
+from right_the_ship.benchmarks.scenarios import (
+    DEFAULT_SCENARIOS,
+    Scenarios,
+    django_client_caller,
+)
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+pytestmark = pytest.mark.skipif(
+    pytest_benchmark is None, reason="pytest-benchmark is not installed"
+)
+
+
+@pytest.fixture(scope="module")
+def scenarios():
+    setup_django()
+    from right_the_ship.benchmarks.seed import seed_dataset
+
+    with throwaway_database():
+        yield Scenarios(seed_dataset(int(os.environ.get("BENCH_TASKS", 1000))))
+
+
+@pytest.mark.parametrize("name", DEFAULT_SCENARIOS)
+def test_route(benchmark, scenarios, name):
+    call = django_client_caller()
+    scenario = getattr(scenarios, name)
+
+    # Bounded rounds, since deletes use up a fixed pool of tasks
+    status = benchmark.pedantic(scenario, args=(call,), rounds=20, iterations=1)
+
+    assert status == 200
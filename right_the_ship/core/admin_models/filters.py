@@ -0,0 +1,44 @@
+from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    A list filter rendered as a text box rather than one link per choice, for
+    columns with too many values to list, like the owning user.
+    """
+
+    template = "admin/input_filter.html"
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self):
+        return True
+
+    def choices(self, changelist):
+        # The "All" link, plus the other active parameters for the form to keep
+        query_parts = [
+            (name, value)
+            for name, values in changelist.get_filters_params().items()
+            if name != self.parameter_name
+            for value in values
+        ]
+        yield {
+            "selected": self.value() is None,
+            "query_string": changelist.get_query_string(remove=[self.parameter_name]),
+            "query_parts": query_parts,
+        }
+
+
+class UserIdFilter(InputFilter):
+    title = "user ID"
+    parameter_name = "user_id"
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if not value:
+            return queryset
+        if not value.isdigit():
+            raise IncorrectLookupParameters(f"Invalid user ID {value!r}.")
+        return queryset.filter(user_id=int(value))
@@ -0,0 +1,35 @@
+import json
+from typing import Optional
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap enough to run
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+def estimated_count(queryset) -> Optional[int]:
+    """
+    The planner's row estimate for `queryset`, or None where the database
+    has no cheap estimate to offer.
+    """
+    if connections[queryset.db].vendor != "postgresql":
+        return None
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Counts exactly when the result is small and falls back to the planner's
+    estimate for large ones, so paging a changelist over millions of rows
+    doesn't scan them all just to print the total.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is None or estimate < EXACT_COUNT_THRESHOLD:
+            return super().count
+        return estimate
@@ -1,5 +1,16 @@
 from django.contrib import admin
-from right_the_ship.core.models import Task, RecurringTask, SingleTask
+from django.db import transaction
+from django.utils import timezone
+
+from right_the_ship.core.admin_models.filters import UserIdFilter
+from right_the_ship.core.admin_models.paginator import EstimatedCountPaginator
+from right_the_ship.core.models import (
+    RecurringTask,
+    RewardLedgerEntry,
+    SingleTask,
+    Task,
+    TaskOccurrence,
+)
 
 
 class RecurringTaskInline(admin.StackedInline):
@@ -15,8 +26,42 @@ class SingleTaskInline(admin.StackedInline):
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
     list_display = ("title", "user", "due_date", "completed")
-    list_filter = ("completed", "due_date", "user")
-    search_fields = ("title", "description", "user__username")
-    date_hierarchy = "due_date"
-    ordering = ("due_date",)
+    list_select_related = ("user",)
+    # A user ID box instead of listing every user as a filter choice
+    list_filter = ("completed", "due_date", UserIdFilter)
+    # A title prefix search, which task_title_upper_idx can serve; contains
+    # searches over description and username scanned the whole table
+    search_fields = ("^title",)
+    # Newest first walks the primary key; sort by due date from the column
+    ordering = ("-id",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    raw_id_fields = ("user",)
+    actions = ["mark_complete", "soft_delete"]
     inlines = [RecurringTaskInline, SingleTaskInline]
+
+    def get_actions(self, request):
+        # The built-in delete loads every selected task to list what cascades
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+    @admin.action(description="Mark selected tasks as complete", permissions=["change"])
+    def mark_complete(self, request, queryset):
+        now = timezone.now()
+        with transaction.atomic():
+            # update() skips post_save, so reward the open ones first
+            RewardLedgerEntry.objects.award_on_time(
+                queryset.filter(completed=False), now
+            )
+            updated = queryset.update(completed=True, updated_at=now)
+        self.message_user(request, f"Marked {updated} tasks as complete.")
+
+    @admin.action(description="Delete selected tasks", permissions=["delete"])
+    def soft_delete(self, request, queryset):
+        # Soft delete, like the API, so offline clients sync the deletion
+        with transaction.atomic():
+            # Before the update, which takes the tasks out of `queryset`
+            TaskOccurrence.objects.clear_upcoming(task__in=queryset)
+            deleted = queryset.update(is_deleted=True, updated_at=timezone.now())
+        self.message_user(request, f"Deleted {deleted} tasks.")
@@ -0,0 +1,123 @@
+from datetime import date
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.shortcuts import aget_object_or_404
+from ninja import Router
+from ninja.decorators import decorate_view
+
+from right_the_ship.core.api.task import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    soft_delete_task,
+    task_detail_dict,
+    task_page,
+    task_page_queryset,
+)
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Task import Task, RecurringTask
+from right_the_ship.core.schemas.task import (
+    TASK_DETAIL_FIELDS,
+    task_detail_from_row,
+    TaskDetailSchema,
+    TaskInSchema,
+    TaskPageSchema,
+)
+from right_the_ship.core.utils.bulk_tasks import split_task_data
+from right_the_ship.core.utils.etag import async_condition, atask_etag
+from right_the_ship.core.utils.fast_json import fast_json
+from right_the_ship.core.utils.task_cache import (
+    acache_task_detail,
+    aget_cached_task_detail,
+    ainvalidate_task_details,
+)
+
+# Async twin of core/api/task.py, mounted under /api/async/. Behaviour and
+# responses match the sync routes; only the I/O model differs.
+router = Router()
+
+
+@router.get("/", response=TaskPageSchema)
+@fast_json
+async def list_tasks(
+    request,
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    completed: Optional[bool] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    is_recurring: Optional[bool] = None,
+):
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    tasks = task_page_queryset(
+        user_id, cursor, completed, due_from, due_to, is_recurring
+    )
+    rows = tasks.values(*TASK_DETAIL_FIELDS)[: limit + 1]
+    return task_page([row async for row in rows], limit)
+
+
+@router.post("/", response=TaskDetailSchema)
+async def create_task(request, data: TaskInSchema):
+    user_id, task_fields, recurring_data = split_task_data(data.dict())
+    user = await aget_object_or_404(CustomUser, id=user_id)
+
+    task = await Task.objects.acreate(user=user, **task_fields)
+
+    recurring_task = None
+    if recurring_data:
+        recurring_task = await RecurringTask.objects.acreate(
+            task=task, **recurring_data
+        )
+
+    return TaskDetailSchema(**task_detail_dict(task, recurring_task))
+
+
+@router.get("/{task_id}/", response=TaskDetailSchema)
+@decorate_view(async_condition(atask_etag))
+@fast_json
+async def get_task(request, task_id: int):
+    updated_at = await Task.objects.values_list("updated_at", flat=True).aget(
+        id=task_id
+    )
+    detail = await aget_cached_task_detail(task_id, updated_at)
+    if detail is None:
+        row = await Task.objects.values(*TASK_DETAIL_FIELDS, "updated_at").aget(
+            id=task_id
+        )
+        detail = task_detail_from_row(row)
+        await acache_task_detail(task_id, row["updated_at"], detail)
+    return detail
+
+
+@router.delete("/{task_id}/")
+async def delete_task(request, task_id: int):
+    task = await Task.objects.aget(id=task_id)
+    # Several writes in one transaction, which the async ORM can't span
+    await sync_to_async(soft_delete_task)(task)
+    return JsonResponse({"success": True})
+
+
+@router.patch("/{task_id}/", response=TaskDetailSchema)
+async def update_task(request, task_id: int, data: TaskInSchema):
+    user_id, task_fields, recurring_data = split_task_data(data.dict())
+    user = await aget_object_or_404(CustomUser, id=user_id)
+    task = await aget_object_or_404(
+        Task.objects.select_related("recurringtask"), id=task_id
+    )
+
+    task.user = user
+    for attr, value in task_fields.items():
+        setattr(task, attr, value)
+    await task.asave()
+
+    if recurring_data:
+        recurring_task, _ = await RecurringTask.objects.aupdate_or_create(
+            task=task, defaults=recurring_data
+        )
+    else:
+        recurring_task = getattr(task, "recurringtask", None)
+
+    await ainvalidate_task_details(task.id)
+    return TaskDetailSchema(**task_detail_dict(task, recurring_task))
@@ -0,0 +1,71 @@
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError
+from django.http import Http404, JsonResponse
+from django.shortcuts import aget_object_or_404
+from ninja import Router
+from ninja.decorators import decorate_view
+from ninja.errors import HttpError
+
+from right_the_ship.core.api.user import soft_delete_user
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.schemas.user import UserOut, UserUpdateIn, UserIn
+from right_the_ship.core.utils.handle_custom_user_integrity_error import (
+    handle_custom_user_integrity_error,
+)
+from right_the_ship.core.utils.etag import async_condition, auser_etag
+from right_the_ship.core.utils.password_pool import ahash_password
+
+# Async twin of core/api/user.py, mounted under /api/async/.
+router = Router()
+
+
+@router.post("/", response=UserOut)
+async def create_user(request, data: UserIn):
+    try:
+        user = CustomUser(
+            username=CustomUser.normalize_username(data.username),
+            email=CustomUser.objects.normalize_email(data.email),
+            password=await ahash_password(data.password),
+        )
+        await user.asave()
+        return JsonResponse(
+            UserOut(id=user.id, username=user.username, email=user.email).dict()
+        )
+    except IntegrityError as e:
+        handle_custom_user_integrity_error(e)
+
+
+@router.get("/{user_id}/", response=UserOut)
+@decorate_view(async_condition(auser_etag))
+async def get_user(request, user_id: int):
+    user = await aget_object_or_404(CustomUser, id=user_id)
+    return JsonResponse(
+        UserOut(id=user.id, username=user.username, email=user.email).dict()
+    )
+
+
+@router.patch("/{user_id}/", response=UserOut)
+async def update_user(request, user_id: int, data: UserUpdateIn):
+    user = await aget_object_or_404(CustomUser, id=user_id)
+    try:
+        fields = data.dict(exclude_unset=True)
+        if "password" in fields:
+            fields["password"] = await ahash_password(fields["password"])
+        for key, value in fields.items():
+            setattr(user, key, value)
+        await user.asave()
+        return JsonResponse(
+            UserOut(id=user.id, username=user.username, email=user.email).dict()
+        )
+    except IntegrityError as e:
+        handle_custom_user_integrity_error(e)
+
+
+@router.delete("/{user_id}/")
+async def delete_user(request, user_id: int):
+    try:
+        user = await aget_object_or_404(CustomUser, id=user_id)
+        await sync_to_async(soft_delete_user)(user)
+        return JsonResponse({"success": True})
+    except Http404:
+        raise HttpError(404, "User not found")
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from ninja import Router
+from ninja.errors import HttpError
+
+from right_the_ship.core.leaderboard.boards import BOARDS, leaderboards
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.schemas.leaderboard import LeaderboardSchema
+
+router = Router()
+
+DEFAULT_LEADERBOARD_SIZE = 10
+MAX_LEADERBOARD_SIZE = 100
+
+
+@router.get("/", response=LeaderboardSchema)
+def get_leaderboard(
+    request,
+    board: str = "points",
+    around: Optional[int] = None,
+    limit: int = DEFAULT_LEADERBOARD_SIZE,
+):
+    """
+    The top of the board, or with `around` the entries centered on that
+    user. Ranks count from 1; users without a score aren't ranked.
+    """
+    if board not in BOARDS:
+        raise HttpError(400, f"Unknown board. Use one of: {', '.join(BOARDS)}.")
+    limit = max(1, min(limit, MAX_LEADERBOARD_SIZE))
+
+    leaderboard = leaderboards.get(board)
+    if around is None:
+        entries = leaderboard.page(0, limit)
+    else:
+        entries = leaderboard.around(around, limit)
+        if entries is None:
+            raise HttpError(404, "User is not on this leaderboard")
+
+    usernames = dict(
+        CustomUser.objects.filter(
+            id__in=[entry.user_id for entry in entries]
+        ).values_list("id", "username")
+    )
+    return {
+        "board": board,
+        "total": len(leaderboard),
+        "entries": [
+            {
+                "rank": entry.rank + 1,
+                "user_id": entry.user_id,
+                "username": usernames.get(entry.user_id),
+                "score": entry.score,
+            }
+            for entry in entries
+        ],
+    }
@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from ninja import Router
+from ninja.errors import HttpError
+
+from right_the_ship.core.utils.request_metrics import render_prometheus
+
+router = Router()
+
+
+@router.get("/", include_in_schema=False)
+def get_metrics(request):
+    # Staff only; scrape with the session cookie of an admin user
+    if not request.user.is_staff:
+        raise HttpError(403, "Staff only.")
+
+    return HttpResponse(
+        render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
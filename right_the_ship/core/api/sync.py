@@ -0,0 +1,98 @@
+import heapq
+from datetime import timedelta
+from itertools import islice
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from ninja import Router
+from ninja.errors import HttpError
+
+from right_the_ship.core.models.Task import Task
+from right_the_ship.core.models.TaskTransfer import TaskTransfer
+from right_the_ship.core.schemas.sync import SyncSchema
+from right_the_ship.core.schemas.task import TASK_DETAIL_FIELDS, task_detail_from_row
+from right_the_ship.core.utils.fast_json import fast_json
+from right_the_ship.core.utils.keyset_cursor import (
+    encode_sync_token,
+    decode_sync_token,
+)
+
+router = Router()
+
+DEFAULT_SYNC_SIZE = 200
+MAX_SYNC_SIZE = 1000
+
+
+@router.get("/", response=SyncSchema)
+@fast_json
+def sync_tasks(
+    request,
+    user_id: int,
+    since: Optional[str] = None,
+    limit: int = DEFAULT_SYNC_SIZE,
+):
+    """
+    Returns the user's tasks changed after `since`, oldest change first, and
+    the ids of tasks deleted or moved to another user since then. Without a
+    token every live task is returned. Keep calling with `next_token` while
+    `has_more` is true, then store it for the next sync.
+
+    Tokens record when they were issued. Ones issued more than
+    TOMBSTONE_RETENTION_DAYS ago are refused with 410, since deletions after
+    them may have been purged; the client then syncs again without a token.
+    """
+    limit = max(1, min(limit, MAX_SYNC_SIZE))
+    # Taken before reading, so changes committed meanwhile are picked up later
+    now = timezone.now()
+
+    # all_objects, since tombstones are how clients learn about deletions
+    changes = Task.all_objects.filter(user_id=user_id).order_by("updated_at", "id")
+    transfers = TaskTransfer.objects.filter(from_user_id=user_id)
+    updated_at, last_id = None, 0
+    if since:
+        updated_at, last_id, synced_through = decode_sync_token(since)
+        retained = now - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+        if synced_through < retained:
+            raise HttpError(410, "Sync token has expired. Sync again without one.")
+    else:
+        changes = changes.filter(is_deleted=False)
+        transfers = transfers.none()
+
+    if updated_at is not None:
+        changes = changes.filter(
+            Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=last_id)
+        )
+        transfers = transfers.filter(
+            Q(transferred_at__gt=updated_at)
+            | Q(transferred_at=updated_at, task_id__gt=last_id)
+        )
+
+    rows = changes.values(*TASK_DETAIL_FIELDS, "is_deleted", "updated_at")
+    # Tasks moved to another user are gone as far as this one is concerned
+    moved = (
+        {"id": task_id, "is_deleted": True, "updated_at": transferred_at}
+        for transferred_at, task_id in transfers.order_by(
+            "transferred_at", "task_id"
+        ).values_list("transferred_at", "task_id")[: limit + 1]
+    )
+    merged = heapq.merge(
+        rows[: limit + 1], moved, key=lambda row: (row["updated_at"], row["id"])
+    )
+    page = list(islice(merged, limit + 1))
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    if page:
+        updated_at, last_id = page[-1]["updated_at"], page[-1]["id"]
+    # A full page leaves changes after it unseen, so it only counts as synced
+    # up to its last change
+    synced_through = updated_at if has_more else now
+
+    return {
+        "tasks": [task_detail_from_row(row) for row in page if not row["is_deleted"]],
+        "deleted": [row["id"] for row in page if row["is_deleted"]],
+        "next_token": encode_sync_token(updated_at, last_id, synced_through),
+        "has_more": has_more,
+    }
@@ -1,43 +1,115 @@
+import heapq
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
-from ninja import Router
+from django.utils import timezone
+from django.views.decorators.http import condition
+from ninja import File, Query, Router
+from ninja.files import UploadedFile
+from ninja.decorators import decorate_view
+from ninja.errors import HttpError
 
 from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Reward import UserRewardSummary
 from right_the_ship.core.models.Task import Task, RecurringTask
-from right_the_ship.core.schemas.task import TaskSchema, TaskDetailSchema, TaskInSchema
+from right_the_ship.core.models.TaskOccurrence import TaskOccurrence
+from right_the_ship.core.schemas.task import (
+    TASK_DETAIL_FIELDS,
+    task_detail_from_row,
+    TaskDetailSchema,
+    TaskInSchema,
+    TaskPageSchema,
+    OccurrenceSchema,
+    OccurrenceCompletionSchema,
+    StreakSchema,
+    TaskBulkUpdateSchema,
+    TaskBulkDeleteSchema,
+    TaskBulkResultSchema,
+    TaskImportResultSchema,
+)
+from right_the_ship.core.utils.bulk_tasks import (
+    create_tasks,
+    due_datetime,
+    prepare_new_task,
+    prepare_task_update,
+    resolve_users,
+    update_tasks,
+)
+from right_the_ship.core.utils.etag import task_etag
+from right_the_ship.core.utils.fast_json import fast_json
+from right_the_ship.core.utils.keyset_cursor import encode_cursor, decode_cursor
+from right_the_ship.core.utils.completion_bits import to_int
+from right_the_ship.core.utils.recurrence import (
+    expand_occurrences,
+    occurrences_through,
+)
+from right_the_ship.core.utils.task_import import (
+    IMPORT_FORMATS,
+    guess_import_format,
+    import_tasks,
+)
+from right_the_ship.core.utils.task_cache import (
+    cache_task_detail,
+    get_cached_task_detail,
+    invalidate_task_details,
+)
 
 router = Router()
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+MAX_OCCURRENCE_WINDOW_DAYS = 366
+MAX_BULK_ITEMS = 500
+
 # TODO
 """
     Recurring tasks -> Single tasks? Or just delete the recurring task and create a new one?
-    Factory for test data
     Add user authentication
 """
 
 
-def generate_task_detail_schema(task: Task) -> TaskDetailSchema:
-    recurring_task = getattr(task, "recurringtask", None)
+def task_detail_dict(task: Task, recurring_task: Optional[RecurringTask]) -> dict:
     is_recurring = recurring_task is not None
-    frequency = recurring_task.frequency if is_recurring else None
-    start_date = recurring_task.start_date if is_recurring else None
-    end_date = recurring_task.end_date if is_recurring else None
-    day = recurring_task.day if is_recurring else None
-
-    return TaskDetailSchema(
-        task=TaskSchema.from_orm(task),
-        is_recurring=is_recurring,
-        frequency=frequency,
-        start_date=start_date,
-        end_date=end_date,
-        day=day,
-    )
+
+    return {
+        "task": {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "due_date": task.due_date,
+            "completed": task.completed,
+        },
+        "is_recurring": is_recurring,
+        "frequency": recurring_task.frequency if is_recurring else None,
+        "start_date": recurring_task.start_date if is_recurring else None,
+        "end_date": recurring_task.end_date if is_recurring else None,
+        "day": recurring_task.day if is_recurring else None,
+    }
+
+
+def generate_task_detail_schemas(tasks: Iterable[Task]) -> List[dict]:
+    """
+    Serializes many tasks in one pass. Querysets get the recurring task joined
+    in, so the query count does not grow with the number of tasks.
+    """
+    if isinstance(tasks, QuerySet):
+        tasks = tasks.select_related("recurringtask")
+
+    return [
+        task_detail_dict(task, getattr(task, "recurringtask", None)) for task in tasks
+    ]
 
 
 @router.post("/", response=TaskDetailSchema)
 def create_task(request, data: TaskInSchema):
     task_data = data.dict()
     user_id = task_data.pop("user_id")
+    task_data["due_date"] = due_datetime(task_data["due_date"])
     user = get_object_or_404(CustomUser, id=user_id)
 
     frequency = task_data.pop("frequency", None)
@@ -47,8 +119,9 @@ def create_task(request, data: TaskInSchema):
 
     task = Task.objects.create(user=user, **task_data)
 
+    recurring_task = None
     if frequency and start_date:
-        RecurringTask.objects.create(
+        recurring_task = RecurringTask.objects.create(
             task=task,
             frequency=frequency,
             start_date=start_date,
@@ -56,19 +129,381 @@ def create_task(request, data: TaskInSchema):
             day=day,
         )
 
-    return generate_task_detail_schema(task)
+    return TaskDetailSchema(**task_detail_dict(task, recurring_task))
+
+
+def check_bulk_size(items: list):
+    if len(items) > MAX_BULK_ITEMS:
+        raise HttpError(400, f"At most {MAX_BULK_ITEMS} tasks per request.")
+
+
+def bulk_error(index: int, error: ValidationError, task_id: Optional[int] = None):
+    return {
+        "index": index,
+        "success": False,
+        "id": task_id,
+        "error": "; ".join(error.messages),
+    }
+
+
+def bulk_success(
+    index: int, task: Task, recurring_task: Optional[RecurringTask]
+) -> dict:
+    return {
+        "index": index,
+        "success": True,
+        "id": task.id,
+        "task": task_detail_dict(task, recurring_task),
+    }
+
+
+@router.post("/bulk/", response=List[TaskBulkResultSchema])
+def bulk_create_tasks(request, data: List[TaskInSchema]):
+    check_bulk_size(data)
+    items = [item.dict() for item in data]
+    users = resolve_users(items)
+
+    results = [None] * len(items)
+    prepared, prepared_indexes = [], []
+    for index, item in enumerate(items):
+        try:
+            prepared.append(prepare_new_task(item, users))
+            prepared_indexes.append(index)
+        except ValidationError as e:
+            results[index] = bulk_error(index, e)
+
+    create_tasks(prepared)
+
+    for index, (task, recurring_task) in zip(prepared_indexes, prepared):
+        results[index] = bulk_success(index, task, recurring_task)
+    return results
+
+
+@router.patch("/bulk/", response=List[TaskBulkResultSchema])
+def bulk_update_tasks(request, data: List[TaskBulkUpdateSchema]):
+    check_bulk_size(data)
+    items = [item.dict() for item in data]
+    users = resolve_users(items)
+    tasks = Task.objects.select_related("recurringtask").in_bulk(
+        {item["id"] for item in items}
+    )
+
+    results = [None] * len(items)
+    prepared, prepared_indexes = [], []
+    for index, item in enumerate(items):
+        task_id = item.pop("id")
+        try:
+            if task_id not in tasks:
+                raise ValidationError("Task not found.")
+            prepared.append(prepare_task_update(tasks[task_id], item, users))
+            prepared_indexes.append(index)
+        except ValidationError as e:
+            results[index] = bulk_error(index, e, task_id)
+
+    update_tasks(prepared)
+    invalidate_task_details(*(task.id for task, _ in prepared))
+
+    for index, (task, recurring_task) in zip(prepared_indexes, prepared):
+        # Untouched recurrences were loaded with select_related above
+        recurring_task = recurring_task or getattr(task, "recurringtask", None)
+        results[index] = bulk_success(index, task, recurring_task)
+    return results
+
+
+@router.delete("/bulk/", response=List[TaskBulkResultSchema])
+def bulk_delete_tasks(request, data: TaskBulkDeleteSchema):
+    check_bulk_size(data.ids)
+
+    with transaction.atomic():
+        found = set(Task.objects.filter(id__in=data.ids).values_list("id", flat=True))
+        Task.objects.filter(id__in=found).update(
+            is_deleted=True, updated_at=timezone.now()
+        )
+        TaskOccurrence.objects.clear_upcoming(task_id__in=found)
+    invalidate_task_details(*found)
+
+    return [
+        {
+            "index": index,
+            "success": task_id in found,
+            "id": task_id,
+            "error": None if task_id in found else "Task not found.",
+        }
+        for index, task_id in enumerate(data.ids)
+    ]
+
+
+@router.post("/import/", response=TaskImportResultSchema)
+def import_task_file(
+    request,
+    user_id: int,
+    file: UploadedFile = File(...),
+    format: Optional[str] = None,
+):
+    """
+    Imports tasks for a user from a CSV (header row with TaskInSchema field
+    names) or NDJSON upload. The format defaults to the file extension.
+    Invalid rows are skipped and listed by line in the report.
+    """
+    import_format = format or guess_import_format(file.name or "")
+    if import_format not in IMPORT_FORMATS:
+        raise HttpError(400, "Format must be 'csv' or 'ndjson'.")
+    user = get_object_or_404(CustomUser, id=user_id)
+
+    try:
+        return import_tasks(user, file, import_format)
+    except UnicodeDecodeError:
+        raise HttpError(400, "File must be UTF-8 encoded.")
+
+
+def start_of_day(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def task_page_queryset(
+    user_id: int,
+    cursor: Optional[str] = None,
+    completed: Optional[bool] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    is_recurring: Optional[bool] = None,
+) -> QuerySet:
+    # Keyset pagination on (due_date, id); undated tasks sort last.
+    tasks = (
+        Task.objects.filter(user_id=user_id)
+        .select_related("recurringtask")
+        .order_by(F("due_date").asc(nulls_last=True), "id")
+    )
+
+    if completed is not None:
+        tasks = tasks.filter(completed=completed)
+    if due_from:
+        tasks = tasks.filter(due_date__gte=start_of_day(due_from))
+    if due_to:
+        tasks = tasks.filter(due_date__lt=start_of_day(due_to + timedelta(days=1)))
+    if is_recurring is not None:
+        tasks = tasks.filter(recurringtask__isnull=not is_recurring)
+
+    if cursor:
+        due_date, last_id = decode_cursor(cursor)
+        if due_date is None:
+            tasks = tasks.filter(due_date__isnull=True, id__gt=last_id)
+        else:
+            tasks = tasks.filter(
+                Q(due_date__gt=due_date)
+                | Q(due_date=due_date, id__gt=last_id)
+                | Q(due_date__isnull=True)
+            )
+
+    return tasks
+
+
+def task_page(rows: List[dict], limit: int) -> dict:
+    """Builds a page from up to `limit + 1` TASK_DETAIL_FIELDS rows."""
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["due_date"], rows[-1]["id"])
+
+    return {
+        "items": [task_detail_from_row(row) for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/", response=TaskPageSchema)
+@fast_json
+def list_tasks(
+    request,
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    completed: Optional[bool] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    is_recurring: Optional[bool] = None,
+):
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    tasks = task_page_queryset(
+        user_id, cursor, completed, due_from, due_to, is_recurring
+    )
+    return task_page(list(tasks.values(*TASK_DETAIL_FIELDS)[: limit + 1]), limit)
+
+
+def tag_occurrences(
+    task_id: int,
+    title: str,
+    occurrences: Iterable[date],
+    first_index: int,
+    completion_bits: bytes,
+):
+    completed = to_int(completion_bits)
+    for index, occurrence in enumerate(occurrences, first_index):
+        yield occurrence, task_id, title, bool(completed >> index & 1)
+
+
+@router.get("/occurrences/", response=List[OccurrenceSchema])
+def list_occurrences(
+    request,
+    user_id: int,
+    window_start: date = Query(..., alias="from"),
+    window_end: date = Query(..., alias="to"),
+):
+    if window_end < window_start:
+        raise HttpError(400, "'to' must not be before 'from'.")
+    if (window_end - window_start).days >= MAX_OCCURRENCE_WINDOW_DAYS:
+        raise HttpError(
+            400, f"Window may span at most {MAX_OCCURRENCE_WINDOW_DAYS} days."
+        )
+
+    # Inside the materialized window the agenda is one index range scan
+    if TaskOccurrence.objects.is_materialized(window_start, window_end):
+        return list(
+            TaskOccurrence.objects.filter(
+                user_id=user_id, occurrence_date__range=(window_start, window_end)
+            )
+            .order_by("occurrence_date", "task_id")
+            .values(
+                "task_id",
+                "completed",
+                title=F("task__title"),
+                date=F("occurrence_date"),
+            )
+        )
+
+    rules = (
+        RecurringTask.objects.filter(
+            task__user_id=user_id,
+            task__is_deleted=False,
+            start_date__lte=window_end,
+        )
+        .filter(Q(end_date__isnull=True) | Q(end_date__gte=window_start))
+        .values_list(
+            "task_id",
+            "task__title",
+            "frequency",
+            "start_date",
+            "end_date",
+            "day",
+            "completion_bits",
+        )
+    )
+
+    # Each rule expands in date order, so a k-way merge keeps the output sorted
+    before_window = window_start - timedelta(days=1)
+    streams = [
+        tag_occurrences(
+            task_id,
+            title,
+            expand_occurrences(
+                frequency, start_date, end_date, day, window_start, window_end
+            ),
+            occurrences_through(frequency, start_date, day, before_window),
+            completion_bits,
+        )
+        for task_id, title, frequency, start_date, end_date, day, completion_bits in rules
+    ]
+
+    return [
+        {
+            "task_id": task_id,
+            "title": title,
+            "date": occurrence,
+            "completed": completed,
+        }
+        for occurrence, task_id, title, completed in heapq.merge(*streams)
+    ]
+
+
+def streak_response(rule: RecurringTask) -> dict:
+    streak = rule.streak(timezone.localdate())
+    return {
+        "task_id": rule.task_id,
+        "current_streak": streak.current,
+        "longest_streak": streak.longest,
+        "completed": streak.completed,
+        "due": streak.due,
+        "completion_rate": streak.completion_rate,
+    }
+
+
+@router.put("/{task_id}/occurrences/{occurrence_date}/", response=StreakSchema)
+def complete_occurrence(
+    request, task_id: int, occurrence_date: date, data: OccurrenceCompletionSchema
+):
+    """Marks one occurrence of a recurring task done (or not done)."""
+    if occurrence_date > timezone.localdate():
+        raise HttpError(400, "Occurrences can't be completed ahead of their date.")
+
+    with transaction.atomic():
+        rule = (
+            RecurringTask.objects.select_for_update(of=("self",))
+            .filter(task_id=task_id, task__is_deleted=False)
+            .annotate(owner_id=F("task__user_id"))
+            .first()
+        )
+        if rule is None:
+            raise HttpError(404, "Recurring task not found")
+        if rule.occurrence_index(occurrence_date) is None:
+            raise HttpError(400, "The task doesn't recur on that date.")
+
+        rule.set_completed(occurrence_date, data.completed)
+        # Not save(): a completion isn't a rule edit, so occurrences and the
+        # task's updated_at stay as they are
+        RecurringTask.objects.filter(pk=rule.pk).update(
+            completion_bits=rule.completion_bits
+        )
+        # Keeps the materialized agenda row, if there is one, in step
+        TaskOccurrence.objects.filter(
+            task_id=task_id, occurrence_date=occurrence_date
+        ).update(completed=data.completed)
+        # The streak leaderboard ranks users by their best streak
+        UserRewardSummary.objects.refresh_longest_streak(
+            rule.owner_id, timezone.localdate()
+        )
+
+    return streak_response(rule)
+
+
+@router.get("/{task_id}/streak/", response=StreakSchema)
+def get_streak(request, task_id: int):
+    rule = (
+        RecurringTask.objects.filter(task_id=task_id, task__is_deleted=False)
+        .only(
+            "task_id", "frequency", "start_date", "end_date", "day", "completion_bits"
+        )
+        .first()
+    )
+    if rule is None:
+        raise HttpError(404, "Recurring task not found")
+    return streak_response(rule)
+
+
+def soft_delete_task(task: Task):
+    with transaction.atomic():
+        task.soft_delete()
+        TaskOccurrence.objects.clear_upcoming(task=task)
+    invalidate_task_details(task.id)
 
 
 @router.get("/{task_id}/", response=TaskDetailSchema)
+@decorate_view(condition(etag_func=task_etag))
+@fast_json
 def get_task(request, task_id: int):
-    task = Task.objects.get(id=task_id)
-    return generate_task_detail_schema(task)
+    # Only the version is read up front; serialization only runs on a miss
+    updated_at = Task.objects.values_list("updated_at", flat=True).get(id=task_id)
+    detail = get_cached_task_detail(task_id, updated_at)
+    if detail is None:
+        row = Task.objects.values(*TASK_DETAIL_FIELDS, "updated_at").get(id=task_id)
+        detail = task_detail_from_row(row)
+        cache_task_detail(task_id, row["updated_at"], detail)
+    return detail
 
 
 @router.delete("/{task_id}/")
 def delete_task(request, task_id: int):
     task = Task.objects.get(id=task_id)
-    task.delete()
+    soft_delete_task(task)
     return JsonResponse({"success": True})
 
 
@@ -76,6 +511,7 @@ def delete_task(request, task_id: int):
 def update_task(request, task_id: int, data: TaskInSchema):
     task_data = data.dict()
     user_id = task_data.pop("user_id")
+    task_data["due_date"] = due_datetime(task_data["due_date"])
     user = get_object_or_404(CustomUser, id=user_id)
 
     frequency = task_data.pop("frequency", None)
@@ -91,7 +527,7 @@ def update_task(request, task_id: int, data: TaskInSchema):
     task.save()
 
     if frequency and start_date:
-        RecurringTask.objects.update_or_create(
+        recurring_task, _ = RecurringTask.objects.update_or_create(
             task=task,
             defaults={
                 "frequency": frequency,
@@ -100,5 +536,8 @@ def update_task(request, task_id: int, data: TaskInSchema):
                 "day": day,
             },
         )
+    else:
+        recurring_task = getattr(task, "recurringtask", None)
 
-    return generate_task_detail_schema(task)
+    invalidate_task_details(task.id)
+    return TaskDetailSchema(**task_detail_dict(task, recurring_task))
@@ -1,15 +1,27 @@
-from django.contrib.auth.models import User
-from django.db import IntegrityError
-from django.http import Http404, JsonResponse
+from django.db import IntegrityError, transaction
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition
 from ninja import Router
+from ninja.decorators import decorate_view
 from django.shortcuts import get_object_or_404
 from ninja.errors import HttpError
 
 from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Reward import (
+    UserRewardSummary,
+    notify_summaries_changed,
+)
+from right_the_ship.core.models.Task import Task
+from right_the_ship.core.models.TaskOccurrence import TaskOccurrence
+from right_the_ship.core.schemas.reward import RewardSummarySchema
 from right_the_ship.core.schemas.user import UserOut, UserUpdateIn, UserIn
+from right_the_ship.core.utils.etag import user_etag
 from right_the_ship.core.utils.handle_custom_user_integrity_error import (
     handle_custom_user_integrity_error,
 )
+from right_the_ship.core.utils.password_pool import hash_password
+from right_the_ship.core.utils.task_export import export_tasks_ndjson
 
 router = Router()
 
@@ -17,7 +29,12 @@ router = Router()
 @router.post("/", response=UserOut)
 def create_user(request, data: UserIn):
     try:
-        user = CustomUser.objects.create_user(**data.dict())
+        # Hashed on the password pool instead of inside create_user
+        user = CustomUser(
+            username=CustomUser.normalize_username(data.username),
+            email=CustomUser.objects.normalize_email(data.email),
+            password=hash_password(data.password),
+        )
         user.save()
         return JsonResponse(
             UserOut(id=user.id, username=user.username, email=user.email).dict()
@@ -27,6 +44,7 @@ def create_user(request, data: UserIn):
 
 
 @router.get("/{user_id}/", response=UserOut)
+@decorate_view(condition(etag_func=user_etag))
 def get_user(request, user_id: int):
     user = get_object_or_404(CustomUser, id=user_id)
     return JsonResponse(
@@ -39,7 +57,10 @@ def update_user(request, user_id: int, data: UserUpdateIn):
     user = get_object_or_404(CustomUser, id=user_id)
     try:
         # Filter out username or other unique fields if not provided
-        for key, value in data.dict(exclude_unset=True).items():
+        fields = data.dict(exclude_unset=True)
+        if "password" in fields:
+            fields["password"] = hash_password(fields["password"])
+        for key, value in fields.items():
             setattr(user, key, value)
         user.save()
         return JsonResponse(
@@ -49,11 +70,64 @@ def update_user(request, user_id: int, data: UserUpdateIn):
         handle_custom_user_integrity_error(e)
 
 
+@router.get("/{user_id}/export/")
+def export_user_tasks(request, user_id: int):
+    """
+    Streams every live task of the user as NDJSON, one TaskDetailSchema per
+    line, without loading them all into memory.
+    """
+    if not CustomUser.objects.filter(id=user_id).exists():
+        raise HttpError(404, "User not found")
+
+    response = StreamingHttpResponse(
+        export_tasks_ndjson(user_id), content_type="application/x-ndjson"
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="user-{user_id}-tasks.ndjson"'
+    )
+    return response
+
+
+@router.get("/{user_id}/rewards/", response=RewardSummarySchema)
+def get_user_rewards(request, user_id: int):
+    """The user's points and achievements, read from their summary row."""
+    summary = UserRewardSummary.objects.filter(
+        user_id=user_id, user__is_deleted=False
+    ).first()
+    if summary is None:
+        # Users who haven't earned anything yet have no summary row
+        if not CustomUser.objects.filter(id=user_id).exists():
+            raise HttpError(404, "User not found")
+        summary = UserRewardSummary(user_id=user_id)
+
+    return RewardSummarySchema(
+        user_id=user_id,
+        points=summary.points,
+        on_time_completions=summary.on_time_completions,
+        achievements=summary.achievements(),
+        updated_at=summary.updated_at,
+    )
+
+
+def soft_delete_user(user: CustomUser):
+    with transaction.atomic():
+        user.soft_delete()
+        Task.objects.filter(user_id=user.id).update(
+            is_deleted=True, updated_at=timezone.now()
+        )
+        TaskOccurrence.objects.clear_upcoming(user_id=user.id)
+        # So leaderboards notice the user is gone
+        UserRewardSummary.objects.filter(user_id=user.id).update(
+            updated_at=timezone.now()
+        )
+        notify_summaries_changed([user.id])
+
+
 @router.delete("/{user_id}/")
 def delete_user(request, user_id: int):
     try:
-        user = get_object_or_404(User, id=user_id)
-        user.delete()
+        user = get_object_or_404(CustomUser, id=user_id)
+        soft_delete_user(user)
         return JsonResponse({"success": True})
     except Http404:
         raise HttpError(404, "User not found")
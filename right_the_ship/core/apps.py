@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class CoreConfig(AppConfig):
+    name = "right_the_ship.core"
+
+    def ready(self):
+        from right_the_ship.core.leaderboard.boards import refresh_changed_summaries
+        from right_the_ship.core.models.Reward import summaries_changed
+        from right_the_ship.core.utils.request_metrics import install_query_recorder
+        from right_the_ship.core.utils.sqlite_pragmas import apply_sqlite_pragmas
+
+        connection_created.connect(
+            apply_sqlite_pragmas, dispatch_uid="core.apply_sqlite_pragmas"
+        )
+        connection_created.connect(
+            install_query_recorder, dispatch_uid="core.install_query_recorder"
+        )
+        summaries_changed.connect(
+            refresh_changed_summaries, dispatch_uid="core.refresh_leaderboards"
+        )
@@ -0,0 +1,155 @@
+"""
+Leaderboards for `GET /api/leaderboard/`, held in memory by each process.
+
+A board keeps every user with a positive score in a RankTree, so finding a
+user's rank or the page around it is O(log n) instead of sorting every user
+per request. The boards are built from UserRewardSummary, which is their
+persisted copy, on first use. After that they follow it incrementally:
+reward events in this process update the users they touched once they
+commit, and summaries written by other processes are pulled in by
+`updated_at` every LEADERBOARD_SYNC_SECONDS.
+"""
+
+import threading
+from datetime import timedelta
+from typing import Collection, Dict, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from right_the_ship.core.leaderboard.ranking import RankTree
+from right_the_ship.core.models import UserRewardSummary
+
+# Board name to the UserRewardSummary field it ranks by
+BOARDS = {
+    "points": "points",
+    "streak": "longest_streak",
+}
+
+# Re-read this much before the last sync, for writes that committed late
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class Entry(NamedTuple):
+    # Counting from 0
+    rank: int
+    user_id: int
+    score: int
+
+
+class Leaderboard:
+    """Users by score, highest first; equal scores rank by user id."""
+
+    def __init__(self, scores: Optional[Dict[int, int]] = None):
+        self.scores = {
+            user_id: score for user_id, score in (scores or {}).items() if score > 0
+        }
+        self.tree = RankTree.from_sorted(
+            sorted((-score, user_id) for user_id, score in self.scores.items())
+        )
+
+    def __len__(self):
+        return len(self.scores)
+
+    def set(self, user_id: int, score: int):
+        """Moves the user to `score`; a score of 0 takes them off the board."""
+        old = self.scores.pop(user_id, None)
+        if old is not None:
+            self.tree.remove((-old, user_id))
+        if score > 0:
+            self.scores[user_id] = score
+            self.tree.insert((-score, user_id))
+
+    def rank(self, user_id: int) -> Optional[int]:
+        score = self.scores.get(user_id)
+        if score is None:
+            return None
+        return self.tree.rank((-score, user_id))
+
+    def page(self, start: int, limit: int) -> List[Entry]:
+        return [
+            Entry(rank, user_id, -score)
+            for rank, (score, user_id) in enumerate(
+                self.tree.iter_from(start, limit), start
+            )
+        ]
+
+    def around(self, user_id: int, limit: int) -> Optional[List[Entry]]:
+        """
+        The `limit` entries centered on the user, shifted to stay on the
+        board, or None when the user isn't on it.
+        """
+        rank = self.rank(user_id)
+        if rank is None:
+            return None
+        start = max(0, min(rank - limit // 2, len(self) - limit))
+        return self.page(start, limit)
+
+
+class Leaderboards:
+    """This process's boards, built from the database on first use."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.boards = None
+        self.synced_at = None
+
+    def rows(self, summaries):
+        return summaries.values_list("user_id", "user__is_deleted", *BOARDS.values())
+
+    def rebuild(self):
+        synced_at = timezone.now()
+        scores = {name: {} for name in BOARDS}
+        summaries = UserRewardSummary.objects.filter(user__is_deleted=False)
+        for user_id, _, *values in self.rows(summaries).iterator(chunk_size=10_000):
+            for name, value in zip(BOARDS, values):
+                if value > 0:
+                    scores[name][user_id] = value
+        self.boards = {name: Leaderboard(scores[name]) for name in BOARDS}
+        self.synced_at = synced_at
+
+    def apply(self, rows):
+        for user_id, is_deleted, *values in rows:
+            for name, value in zip(BOARDS, values):
+                self.boards[name].set(user_id, 0 if is_deleted else value)
+
+    def get(self, name: str) -> Leaderboard:
+        """The named board, after pulling in changes from other processes."""
+        with self.lock:
+            now = timezone.now()
+            if self.boards is None:
+                self.rebuild()
+            elif now - self.synced_at >= timedelta(
+                seconds=settings.LEADERBOARD_SYNC_SECONDS
+            ):
+                since = self.synced_at - SYNC_OVERLAP
+                self.synced_at = now
+                self.apply(
+                    self.rows(UserRewardSummary.objects.filter(updated_at__gte=since))
+                )
+            return self.boards[name]
+
+    def refresh_users(self, user_ids: Collection[int]):
+        """Re-reads the users' summaries into boards that are already built."""
+        with self.lock:
+            if self.boards is None:
+                return
+            rows = list(
+                self.rows(UserRewardSummary.objects.filter(user_id__in=user_ids))
+            )
+            self.apply(rows)
+            # Users whose summary is gone drop off
+            found = {row[0] for row in rows}
+            for user_id in set(user_ids) - found:
+                for board in self.boards.values():
+                    board.set(user_id, 0)
+
+
+leaderboards = Leaderboards()
+
+
+def refresh_changed_summaries(sender, user_ids, **kwargs):
+    leaderboards.refresh_users(user_ids)
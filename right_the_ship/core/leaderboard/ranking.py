@@ -0,0 +1,178 @@
+"""
+An order-statistics treap: a binary search tree kept balanced by random heap
+priorities, where each node also counts its subtree. Inserting, removing,
+finding a key's rank and finding the key at a rank are all O(log n)
+expected; reading k keys from a rank is O(log n + k).
+"""
+
+import random
+from typing import Any, Iterator, List, Optional, Sequence
+
+
+class Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key, priority: float):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+def size(node: Optional[Node]) -> int:
+    return node.size if node else 0
+
+
+def resize(node: Node):
+    node.size = 1 + size(node.left) + size(node.right)
+
+
+def split(node: Optional[Node], key):
+    """Splits into the keys below `key` and the rest."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = split(node.right, key)
+        resize(node)
+        return node, right
+    left, node.left = split(node.left, key)
+    resize(node)
+    return left, node
+
+
+def merge(left: Optional[Node], right: Optional[Node]) -> Optional[Node]:
+    """Joins two treaps where every key in `left` is below those in `right`."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = merge(left.right, right)
+        resize(left)
+        return left
+    right.left = merge(left, right.left)
+    resize(right)
+    return right
+
+
+def remove(node: Node, key) -> Optional[Node]:
+    if node.key == key:
+        return merge(node.left, node.right)
+    if key < node.key:
+        node.left = remove(node.left, key)
+    else:
+        node.right = remove(node.right, key)
+    resize(node)
+    return node
+
+
+class RankTree:
+    """A sorted set of distinct, comparable keys, indexed by rank."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.root = None
+        self.random = random.Random(seed)
+
+    def __len__(self):
+        return size(self.root)
+
+    @classmethod
+    def from_sorted(cls, keys: Sequence[Any], seed: Optional[int] = None):
+        """
+        Builds a balanced tree from distinct, ascending keys in linear time.
+        Handing out descending priorities breadth first keeps the heap order
+        of a treap built by inserting them one by one.
+        """
+        tree = cls(seed)
+        priorities = sorted((tree.random.random() for _ in keys), reverse=True)
+        nodes = [None] * len(keys)
+
+        # Midpoints of each level's ranges, level by level
+        level = [(0, len(keys))]
+        assigned = 0
+        while level:
+            next_level = []
+            for start, stop in level:
+                if start >= stop:
+                    continue
+                middle = (start + stop) // 2
+                nodes[middle] = Node(keys[middle], priorities[assigned])
+                assigned += 1
+                next_level += [(start, middle), (middle + 1, stop)]
+            level = next_level
+
+        def link(start: int, stop: int) -> Optional[Node]:
+            if start >= stop:
+                return None
+            middle = (start + stop) // 2
+            node = nodes[middle]
+            node.left = link(start, middle)
+            node.right = link(middle + 1, stop)
+            resize(node)
+            return node
+
+        tree.root = link(0, len(keys))
+        return tree
+
+    def insert(self, key):
+        left, right = split(self.root, key)
+        node = Node(key, self.random.random())
+        self.root = merge(merge(left, node), right)
+
+    def remove(self, key):
+        """Removes `key`, which must be in the tree."""
+        self.root = remove(self.root, key)
+
+    def rank(self, key) -> int:
+        """How many keys sort before `key`."""
+        node, rank = self.root, 0
+        while node:
+            if node.key < key:
+                rank += size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def at(self, rank: int):
+        """The key at `rank`, counting from 0."""
+        node = self.root
+        while node:
+            left = size(node.left)
+            if rank < left:
+                node = node.left
+            elif rank == left:
+                return node.key
+            else:
+                rank -= left + 1
+                node = node.right
+        raise IndexError(rank)
+
+    def keys(self, start: int, limit: int) -> List[Any]:
+        """Up to `limit` keys in order, starting at rank `start`."""
+        return list(self.iter_from(start, limit))
+
+    def iter_from(self, start: int, limit: int) -> Iterator[Any]:
+        # The path to `start` leaves the nodes that come after it on the stack;
+        # from there it is an ordinary in-order walk
+        stack, node = [], self.root
+        while node:
+            left = size(node.left)
+            if start <= left:
+                stack.append(node)
+                if start == left:
+                    break
+                node = node.left
+            else:
+                start -= left + 1
+                node = node.right
+
+        while stack and limit > 0:
+            node = stack.pop()
+            yield node.key
+            limit -= 1
+            child = node.right
+            while child:
+                stack.append(child)
+                child = child.left
@@ -0,0 +1,37 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from right_the_ship.core.utils.recurrence_batch import due_on, load_rule_arrays
+
+
+class Command(BaseCommand):
+    help = "Lists every recurring task occurrence due on a date, across all users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            default=None,
+            help="Target date as yyyy-mm-dd. Defaults to tomorrow.",
+        )
+        parser.add_argument(
+            "--count",
+            action="store_true",
+            help="Only print the number of occurrences.",
+        )
+
+    def handle(self, *args, **options):
+        target = options["date"] or timezone.localdate() + timedelta(days=1)
+
+        rules = load_rule_arrays()
+        task_ids, user_ids = due_on(rules, target)
+
+        if not options["count"]:
+            for task_id, user_id in zip(task_ids.tolist(), user_ids.tolist()):
+                self.stdout.write(f"{user_id}\t{task_id}")
+
+        self.stderr.write(
+            f"{len(task_ids)} occurrences due {target} from {len(rules)} rules"
+        )
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from right_the_ship.core.models import CustomUser
+from right_the_ship.core.utils.task_import import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    guess_import_format,
+    import_tasks,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports tasks for a user from a CSV or NDJSON file, the same way "
+        "POST /api/tasks/import/ does, and prints the rows that failed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--user-id", type=int, required=True)
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        import_format = options["format"] or guess_import_format(options["path"])
+        if import_format is None:
+            raise CommandError(
+                "Can't tell the format from the extension; pass --format."
+            )
+
+        try:
+            user = CustomUser.objects.get(id=options["user_id"])
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"User {options['user_id']} not found.")
+
+        started = time.perf_counter()
+        try:
+            with open(options["path"], "rb") as f:
+                report = import_tasks(user, f, import_format, options["batch_size"])
+        except OSError as e:
+            raise CommandError(str(e))
+        except UnicodeDecodeError:
+            raise CommandError("File must be UTF-8 encoded.")
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(
+            f"Imported {report['imported']} tasks in "
+            f"{time.perf_counter() - started:.1f}s, {report['failed']} rows failed"
+        )
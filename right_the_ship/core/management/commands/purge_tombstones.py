@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from right_the_ship.core.models import CustomUser, Task, TaskTransfer
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard-deletes soft-deleted tasks and users, and records of tasks moving "
+        "between users, older than --days, in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=settings.TOMBSTONE_RETENTION_DAYS
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["days"] < settings.TOMBSTONE_RETENTION_DAYS:
+            # Sync tokens inside the retention period rely on these tombstones
+            raise CommandError(
+                f"--days must be at least TOMBSTONE_RETENTION_DAYS "
+                f"({settings.TOMBSTONE_RETENTION_DAYS})."
+            )
+        cutoff = timezone.now() - timedelta(days=options["days"])
+
+        # Tasks first so user batches don't cascade into huge task deletes
+        for model in (Task, CustomUser):
+            tombstones = model.all_objects.filter(
+                is_deleted=True, updated_at__lt=cutoff
+            )
+            purged = self.purge(tombstones, options["batch_size"])
+            self.stdout.write(f"Purged {purged} {model._meta.verbose_name_plural}")
+
+        # Sync reports these as deletions to the tasks' previous owners
+        transfers = TaskTransfer.objects.filter(transferred_at__lt=cutoff)
+        purged = self.purge(transfers, options["batch_size"])
+        self.stdout.write(f"Purged {purged} task transfers")
+
+    def purge(self, rows, batch_size):
+        purged = 0
+        while True:
+            batch = list(rows.values_list("id", flat=True)[:batch_size])
+            if not batch:
+                return purged
+            # The base manager sees tombstones too
+            rows.model._base_manager.filter(id__in=batch).delete()
+            purged += len(batch)
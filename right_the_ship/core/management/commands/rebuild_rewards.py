@@ -0,0 +1,93 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from right_the_ship.core.models import (
+    CustomUser,
+    RewardLedgerEntry,
+    UserRewardSummary,
+)
+from right_the_ship.core.models.Reward import notify_summaries_changed
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes every user's reward summary from the reward ledger and "
+        "their recurring tasks' streaks, a batch of users at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def rebuild(self, user_ids):
+        with transaction.atomic():
+            # Hold off awards to these users while their totals are recomputed
+            list(
+                UserRewardSummary.objects.select_for_update()
+                .filter(user_id__in=user_ids)
+                .order_by("user_id")
+                .values_list("user_id")
+            )
+            totals = {
+                row["user_id"]: row
+                for row in RewardLedgerEntry.objects.filter(user_id__in=user_ids)
+                .values("user_id")
+                .annotate(
+                    total_points=Sum("points"),
+                    on_time=Count("id", filter=Q(reason=RewardLedgerEntry.ON_TIME)),
+                )
+                .order_by()
+            }
+            streaks = UserRewardSummary.objects.longest_streaks(
+                user_ids, timezone.localdate()
+            )
+            summaries = []
+            for user_id in sorted(totals.keys() | streaks.keys()):
+                total = totals.get(user_id, {})
+                summaries.append(
+                    UserRewardSummary(
+                        user_id=user_id,
+                        points=total.get("total_points", 0),
+                        on_time_completions=total.get("on_time", 0),
+                        longest_streak=streaks.get(user_id, 0),
+                    )
+                )
+            UserRewardSummary.objects.bulk_create(
+                summaries,
+                update_conflicts=True,
+                unique_fields=["user"],
+                update_fields=[
+                    "points",
+                    "on_time_completions",
+                    "longest_streak",
+                    "updated_at",
+                ],
+            )
+            # Summaries with nothing behind them are zeroed rather than deleted,
+            # so leaderboard syncs see the change
+            UserRewardSummary.objects.filter(user_id__in=user_ids).exclude(
+                user_id__in=[summary.user_id for summary in summaries]
+            ).update(
+                points=0,
+                on_time_completions=0,
+                longest_streak=0,
+                updated_at=timezone.now(),
+            )
+            notify_summaries_changed(user_ids)
+        return len(summaries)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        users = CustomUser.all_objects.order_by("id").values_list("id", flat=True)
+
+        rebuilt = 0
+        last_id = 0
+        while True:
+            user_ids = list(users.filter(id__gt=last_id)[:batch_size])
+            if not user_ids:
+                break
+            rebuilt += self.rebuild(user_ids)
+            last_id = user_ids[-1]
+
+        self.stdout.write(f"Rebuilt reward summaries for {rebuilt} users")
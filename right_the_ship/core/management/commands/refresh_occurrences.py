@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from right_the_ship.core.models import RecurringTask, TaskOccurrence
+
+
+class Command(BaseCommand):
+    help = (
+        "Rolls the materialized occurrence window forward for every live "
+        "recurring task. Run daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        rules = RecurringTask.objects.filter(task__is_deleted=False).order_by("id")
+        # A run that crosses midnight still covers at least this far
+        window_start, window_end = TaskOccurrence.objects.rolling_window()
+
+        refreshed = 0
+        last_id = 0
+        while True:
+            batch = list(rules.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            TaskOccurrence.objects.refresh(batch)
+            refreshed += len(batch)
+            last_id = batch[-1].id
+
+        TaskOccurrence.objects.record_materialized_through(window_end)
+        self.stdout.write(
+            f"Refreshed {refreshed} recurring tasks for {window_start} to {window_end}"
+        )
@@ -0,0 +1,70 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from right_the_ship.core.reminders.backends import get_reminder_backend
+from right_the_ship.core.reminders.scheduler import ReminderScheduler
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs the reminder worker: fires reminders for task due dates and "
+        "recurring occurrences to the configured REMINDER_BACKEND."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backend",
+            help="A REMINDER_BACKEND_CLASSES name or dotted path. "
+            "Defaults to REMINDER_BACKEND.",
+        )
+        parser.add_argument(
+            "--lead-minutes", type=int, default=settings.REMINDER_LEAD_MINUTES
+        )
+        parser.add_argument(
+            "--horizon-hours", type=int, default=settings.REMINDER_HORIZON_HOURS
+        )
+        parser.add_argument(
+            "--poll-seconds", type=int, default=settings.REMINDER_POLL_SECONDS
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            help="Stop after this many seconds instead of running until killed.",
+        )
+
+    def handle(self, *args, **options):
+        backend = get_reminder_backend(options["backend"])
+        scheduler = ReminderScheduler(
+            backend.deliver,
+            horizon=timedelta(hours=options["horizon_hours"]),
+            lead=timedelta(minutes=options["lead_minutes"]),
+            poll_interval=timedelta(seconds=options["poll_seconds"]),
+        )
+        deadline = (
+            time.monotonic() + options["duration"] if options["duration"] else None
+        )
+
+        try:
+            scheduler.start()
+            self.stdout.write(
+                f"{len(scheduler.heap)} reminders scheduled for the next "
+                f"{options['horizon_hours']}h"
+            )
+            while True:
+                delay = scheduler.tick()
+                # The worker outlives CONN_MAX_AGE, so recycle like a request
+                close_old_connections()
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    delay = min(delay, remaining)
+                time.sleep(delay)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            backend.close()
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from right_the_ship.core.models import CustomUser
+from right_the_ship.core.utils.factories import seed_tasks, seed_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk inserts synthetic users, tasks and recurring tasks for load tests. "
+        "Run refresh_occurrences afterwards to materialize occurrences."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--tasks", type=int, default=100000)
+        parser.add_argument("--recurring-ratio", type=float, default=0.2)
+        parser.add_argument(
+            "--single-tasks",
+            action="store_true",
+            help="Also add SingleTask rows for tasks that don't recur.",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix", help="Username prefix. Defaults to seed<seed>-user."
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 1:
+            raise CommandError("--users must be at least 1.")
+
+        prefix = options["prefix"] or f"seed{options['seed']}-user"
+        if CustomUser.all_objects.filter(username__startswith=prefix).exists():
+            raise CommandError(
+                f"Users prefixed {prefix!r} already exist; pass another --seed "
+                "or --prefix."
+            )
+
+        started = time.perf_counter()
+        # One transaction, so SQLite syncs to disk once rather than per batch
+        with transaction.atomic():
+            user_ids = seed_users(
+                options["users"], options["batch_size"], options["seed"], prefix
+            )
+            recurring = seed_tasks(
+                options["tasks"],
+                user_ids,
+                options["recurring_ratio"],
+                options["single_tasks"],
+                options["batch_size"],
+                options["seed"],
+            )
+
+        self.stdout.write(
+            f"Seeded {len(user_ids)} users and {options['tasks']} tasks "
+            f"({recurring} recurring) in {time.perf_counter() - started:.1f}s"
+        )
@@ -0,0 +1,78 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from right_the_ship.core.utils.request_metrics import (
+    finish_request,
+    record_request,
+    start_request,
+)
+
+logger = logging.getLogger("right_the_ship.requests")
+
+
+class RequestMetricsMiddleware:
+    """
+    Records latency, query count, DB time and serialization time per route,
+    and logs requests slower than REQUEST_METRICS_SLOW_SECONDS with their SQL.
+    Works under both WSGI and ASGI; list it first in MIDDLEWARE.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        slow_seconds = settings.REQUEST_METRICS_SLOW_SECONDS
+        stats, token = start_request(capture_sql=slow_seconds is not None)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            finish_request(token)
+        self.record(request, response, time.perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        slow_seconds = settings.REQUEST_METRICS_SLOW_SECONDS
+        stats, token = start_request(capture_sql=slow_seconds is not None)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            finish_request(token)
+        self.record(request, response, time.perf_counter() - started, stats)
+        return response
+
+    def record(self, request, response, seconds, stats):
+        # The URL pattern, not the path, so ids don't explode the label set
+        match = request.resolver_match
+        route = match.route if match else "unmatched"
+        record_request(request.method, route, response.status_code, seconds, stats)
+
+        slow_seconds = settings.REQUEST_METRICS_SLOW_SECONDS
+        if slow_seconds is not None and seconds >= slow_seconds:
+            logger.warning(
+                "Slow request %s %s: %.3fs, %d queries (%.3fs), "
+                "serialization %.3fs\n%s",
+                request.method,
+                request.get_full_path(),
+                seconds,
+                stats.queries,
+                stats.db_seconds,
+                stats.serialization_seconds,
+                "\n".join(
+                    f"  {elapsed * 1000:.1f}ms {sql}"
+                    for elapsed, sql in stats.statements
+                ),
+            )
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.7 on 2026-10-18 08:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0004_recurringtask_day_alter_recurringtask_frequency"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "is_deleted", "due_date", "id"],
+                name="task_user_live_due_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.7 on 2026-10-18 08:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0005_task_user_live_due_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskOccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("occurrence_date", models.DateField()),
+                ("completed", models.BooleanField(default=False)),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="core.task"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.customuser",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "occurrence_date"],
+                        name="occurrence_user_date_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="taskoccurrence",
+            constraint=models.UniqueConstraint(
+                fields=("task", "occurrence_date"), name="occurrence_task_date_uniq"
+            ),
+        ),
+    ]
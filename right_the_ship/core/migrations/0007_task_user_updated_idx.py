@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-18 08:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0006_taskoccurrence"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["user", "updated_at", "id"], name="task_user_updated_idx"
+            ),
+        ),
+    ]
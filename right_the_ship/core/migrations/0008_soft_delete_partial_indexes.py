@@ -0,0 +1,61 @@
+# Generated by Django 5.0.7 on 2026-10-18 08:31
+
+import django.contrib.auth.models
+import right_the_ship.core.mixins.SoftDelete
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("core", "0007_task_user_updated_idx"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="customuser",
+            managers=[
+                (
+                    "objects",
+                    right_the_ship.core.mixins.SoftDelete.SoftDeleteUserManager(),
+                ),
+                ("all_objects", django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="task_user_live_due_idx",
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["id"],
+                name="customuser_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                condition=models.Q(("is_deleted", True)),
+                fields=["updated_at"],
+                name="customuser_tombstone_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["user", "due_date", "id"],
+                name="task_user_live_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", True)),
+                fields=["updated_at"],
+                name="task_tombstone_idx",
+            ),
+        ),
+    ]
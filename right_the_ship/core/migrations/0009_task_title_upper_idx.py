@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:07
+
+import django.db.models.functions.text
+import right_the_ship.core.utils.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0008_soft_delete_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=right_the_ship.core.utils.indexes.PatternOpsIndex(
+                django.db.models.functions.text.Upper("title"),
+                name="task_title_upper_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_task_title_upper_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("completed", False), ("is_deleted", False)),
+                fields=["due_date"],
+                name="task_open_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["updated_at"], name="task_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="taskoccurrence",
+            index=models.Index(
+                condition=models.Q(("completed", False)),
+                fields=["occurrence_date"],
+                name="occurrence_open_date_idx",
+            ),
+        ),
+    ]
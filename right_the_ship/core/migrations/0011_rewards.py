@@ -0,0 +1,73 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_reminder_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserRewardSummary",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to="core.customuser",
+                    ),
+                ),
+                ("points", models.IntegerField(default=0)),
+                ("on_time_completions", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RewardLedgerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "reason",
+                    models.CharField(
+                        choices=[("on_time", "Completed on time")], max_length=20
+                    ),
+                ),
+                ("points", models.IntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "task",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="core.task",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core.customuser",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="rewardledgerentry",
+            constraint=models.UniqueConstraint(
+                fields=("task", "reason"), name="reward_task_reason_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:17
+
+from django.db import migrations, models
+
+from right_the_ship.core.utils.recurrence import occurrence_index
+
+
+def backfill_completion_bits(apps, schema_editor):
+    # Carries completed materialized occurrences over into the bitsets
+    RecurringTask = apps.get_model("core", "RecurringTask")
+    TaskOccurrence = apps.get_model("core", "TaskOccurrence")
+
+    completed = {}
+    for task_id, occurrence in TaskOccurrence.objects.filter(
+        completed=True
+    ).values_list("task_id", "occurrence_date"):
+        completed.setdefault(task_id, []).append(occurrence)
+
+    rules = RecurringTask.objects.filter(task_id__in=completed)
+    for rule in rules.iterator():
+        value = 0
+        for occurrence in completed[rule.task_id]:
+            index = occurrence_index(
+                rule.frequency, rule.start_date, rule.day, occurrence
+            )
+            if index is not None:
+                value |= 1 << index
+        rule.completion_bits = value.to_bytes((value.bit_length() + 7) // 8, "little")
+        rule.save(update_fields=["completion_bits"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_rewards"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recurringtask",
+            name="completion_bits",
+            field=models.BinaryField(default=b""),
+        ),
+        migrations.RunPython(backfill_completion_bits, migrations.RunPython.noop),
+    ]
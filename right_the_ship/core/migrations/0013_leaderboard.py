@@ -0,0 +1,23 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_recurringtask_completion_bits"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="userrewardsummary",
+            name="longest_streak",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="userrewardsummary",
+            index=models.Index(
+                fields=["updated_at"], name="reward_summary_updated_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_leaderboard"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OccurrenceWindow",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("materialized_through", models.DateField()),
+            ],
+        ),
+    ]
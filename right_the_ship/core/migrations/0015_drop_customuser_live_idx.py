@@ -0,0 +1,16 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0014_occurrence_window"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="customuser",
+            name="customuser_live_idx",
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0015_drop_customuser_live_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskTransfer",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("transferred_at", models.DateTimeField()),
+                (
+                    "from_user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="core.customuser",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="core.task"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["from_user", "transferred_at", "task"],
+                        name="tasktransfer_sync_idx",
+                    ),
+                    models.Index(
+                        fields=["transferred_at"], name="tasktransfer_purge_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
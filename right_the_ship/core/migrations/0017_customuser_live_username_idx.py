@@ -0,0 +1,21 @@
+# Generated by Django 5.0.7 on 2026-10-18 09:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("core", "0016_task_transfer"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["username"],
+                name="customuser_live_username_idx",
+            ),
+        ),
+    ]
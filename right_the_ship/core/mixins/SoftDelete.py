@@ -1,8 +1,32 @@
+from django.contrib.auth.models import UserManager
 from django.db import models
 
 
+class SoftDeleteManagerMixin:
+    """Hides soft-deleted rows. Combine with any manager class."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
+class SoftDeleteManager(SoftDeleteManagerMixin, models.Manager):
+    pass
+
+
+class SoftDeleteUserManager(SoftDeleteManagerMixin, UserManager):
+    pass
+
+
 class SoftDeleteMixin(models.Model):
     is_deleted = models.BooleanField(default=False)
 
+    # `objects` only sees live rows; `all_objects` includes tombstones
+    objects = SoftDeleteManager()
+    all_objects = models.Manager()
+
     class Meta:
         abstract = True
+
+    def soft_delete(self):
+        self.is_deleted = True
+        self.save()
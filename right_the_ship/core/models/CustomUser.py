@@ -1,7 +1,11 @@
-from django.contrib.auth.models import AbstractUser, Group, Permission
+from django.contrib.auth.models import AbstractUser, Group, Permission, UserManager
 from django.db import models
+from django.db.models import Q
 
-from right_the_ship.core.mixins.SoftDelete import SoftDeleteMixin
+from right_the_ship.core.mixins.SoftDelete import (
+    SoftDeleteMixin,
+    SoftDeleteUserManager,
+)
 from right_the_ship.core.mixins.Timestamp import TimestampMixin
 
 
@@ -23,3 +27,23 @@ class CustomUser(AbstractUser, TimestampMixin, SoftDeleteMixin):
         help_text="Specific permissions for this user.",
         verbose_name="user permissions",
     )
+
+    # AbstractUser's manager would otherwise win over the mixin's
+    objects = SoftDeleteUserManager()
+    all_objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Logins look users up by username through the soft-delete manager
+            models.Index(
+                fields=["username"],
+                condition=Q(is_deleted=False),
+                name="customuser_live_username_idx",
+            ),
+            # Lets the tombstone purge find old deletions without a scan
+            models.Index(
+                fields=["updated_at"],
+                condition=Q(is_deleted=True),
+                name="customuser_tombstone_idx",
+            ),
+        ]
@@ -0,0 +1,195 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Collection, Dict, Iterable
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Task import RecurringTask, Task
+
+# Sent with `user_ids` once changes to their summaries have committed
+summaries_changed = Signal()
+
+
+def notify_summaries_changed(user_ids: Collection[int]):
+    transaction.on_commit(
+        lambda: summaries_changed.send(UserRewardSummary, user_ids=user_ids)
+    )
+
+
+def completed_on_time(task: Task, completed_at: datetime) -> bool:
+    # due_date is a day; completing at any point during it is on time
+    due = task.due_date
+    if due is None:
+        return False
+    if isinstance(due, datetime):
+        # Tasks updated from a schema hold a plain date until reloaded
+        due = timezone.localdate(due)
+    return timezone.localdate(completed_at) <= due
+
+
+class RewardLedgerManager(models.Manager):
+    def award_on_time(self, tasks: Iterable[Task], completed_at=None) -> int:
+        """
+        Appends an entry for each of the newly completed `tasks` finished on
+        time and adds it to the owner's summary, in one transaction. A task
+        is only ever rewarded once, however often it is reopened. Returns the
+        number of entries written.
+        """
+        completed_at = completed_at or timezone.now()
+        owners = {
+            task.id: task.user_id
+            for task in tasks
+            if completed_on_time(task, completed_at)
+        }
+        if not owners:
+            return 0
+
+        points = settings.REWARD_ON_TIME_POINTS
+        user_ids = set(owners.values())
+        with transaction.atomic():
+            UserRewardSummary.objects.create_missing(user_ids)
+            # Locking the summaries serializes awards per user, which makes the
+            # check for earlier entries below safe
+            list(
+                UserRewardSummary.objects.select_for_update()
+                .filter(user_id__in=user_ids)
+                .order_by("user_id")
+                .values_list("user_id")
+            )
+            rewarded = set(
+                self.filter(
+                    task_id__in=owners, reason=RewardLedgerEntry.ON_TIME
+                ).values_list("task_id", flat=True)
+            )
+            entries = self.bulk_create(
+                self.model(
+                    user_id=user_id,
+                    task_id=task_id,
+                    reason=RewardLedgerEntry.ON_TIME,
+                    points=points,
+                )
+                for task_id, user_id in owners.items()
+                if task_id not in rewarded
+            )
+
+            # One update per distinct count instead of one per user
+            counts = defaultdict(int)
+            for entry in entries:
+                counts[entry.user_id] += 1
+            users_by_count = defaultdict(list)
+            for user_id, count in counts.items():
+                users_by_count[count].append(user_id)
+            for count, users in users_by_count.items():
+                UserRewardSummary.objects.filter(user_id__in=users).update(
+                    points=F("points") + count * points,
+                    on_time_completions=F("on_time_completions") + count,
+                    updated_at=timezone.now(),
+                )
+            notify_summaries_changed(set(counts))
+        return len(entries)
+
+
+class RewardLedgerEntry(models.Model):
+    """An append-only record of points earned. Entries are never changed."""
+
+    ON_TIME = "on_time"
+
+    REASON_CHOICES = [
+        (ON_TIME, "Completed on time"),
+    ]
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    # Kept when the task is purged so the ledger still adds up
+    task = models.ForeignKey(Task, on_delete=models.SET_NULL, null=True)
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES)
+    points = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = RewardLedgerManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "reason"], name="reward_task_reason_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} +{self.points} ({self.reason})"
+
+
+class UserRewardSummaryManager(models.Manager):
+    def create_missing(self, user_ids: Collection[int]):
+        self.bulk_create(
+            [self.model(user_id=user_id) for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+
+    def longest_streaks(self, user_ids: Collection[int], today: date) -> Dict[int, int]:
+        """Each user's longest streak across their live recurring tasks."""
+        streaks = defaultdict(int)
+        rules = (
+            RecurringTask.objects.filter(
+                task__user_id__in=user_ids, task__is_deleted=False
+            )
+            .only("frequency", "start_date", "end_date", "day", "completion_bits")
+            .annotate(owner_id=F("task__user_id"))
+        )
+        for rule in rules:
+            longest = rule.streak(today).longest
+            streaks[rule.owner_id] = max(streaks[rule.owner_id], longest)
+        return streaks
+
+    def refresh_longest_streak(self, user_id: int, today: date):
+        longest = self.longest_streaks([user_id], today).get(user_id, 0)
+        with transaction.atomic():
+            self.create_missing([user_id])
+            self.filter(user_id=user_id).update(
+                longest_streak=longest, updated_at=timezone.now()
+            )
+            notify_summaries_changed([user_id])
+
+
+class UserRewardSummary(models.Model):
+    """
+    A user's ledger totals and best streak, kept up to date as they change so
+    the profile reads one row. `python manage.py rebuild_rewards` recomputes
+    them.
+    """
+
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, primary_key=True)
+    points = models.IntegerField(default=0)
+    on_time_completions = models.IntegerField(default=0)
+    # The longest streak of any of the user's recurring tasks
+    longest_streak = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = UserRewardSummaryManager()
+
+    class Meta:
+        indexes = [
+            # Lets each process's leaderboards pick up recent changes
+            models.Index(fields=["updated_at"], name="reward_summary_updated_idx"),
+        ]
+
+    def achievements(self):
+        return [
+            name
+            for name, threshold in settings.REWARD_ACHIEVEMENTS.items()
+            if self.on_time_completions >= threshold
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}: {self.points} points"
+
+
+@receiver(post_save, sender=Task)
+def reward_task_completion(sender, instance, created=False, raw=False, **kwargs):
+    if not (raw or created) and instance.newly_completed():
+        RewardLedgerEntry.objects.award_on_time([instance])
@@ -1,10 +1,27 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 
 from right_the_ship.core.mixins.SoftDelete import SoftDeleteMixin
 from right_the_ship.core.mixins.Timestamp import TimestampMixin
 from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.utils.indexes import PatternOpsIndex
+from right_the_ship.core.utils.completion_bits import (
+    Streak,
+    set_completed,
+    streak,
+    to_bytes,
+    to_int,
+)
+from right_the_ship.core.utils.recurrence import (
+    expand_occurrences,
+    occurrence_at,
+    occurrence_index,
+    occurrences_through,
+)
+from right_the_ship.core.utils.task_cache import invalidate_task_details
 
 
 class Task(TimestampMixin, SoftDeleteMixin):
@@ -14,6 +31,68 @@ class Task(TimestampMixin, SoftDeleteMixin):
     completed = models.BooleanField(default=False)
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Backs the keyset-paginated task listing; partial, so tombstones
+            # never bloat it
+            models.Index(
+                fields=["user", "due_date", "id"],
+                condition=Q(is_deleted=False),
+                name="task_user_live_due_idx",
+            ),
+            # Backs delta sync, which pages through a user's changes in order
+            models.Index(
+                fields=["user", "updated_at", "id"], name="task_user_updated_idx"
+            ),
+            models.Index(
+                fields=["updated_at"],
+                condition=Q(is_deleted=True),
+                name="task_tombstone_idx",
+            ),
+            # Back the reminder worker: its window of open due tasks and its
+            # poll for recently written ones
+            models.Index(
+                fields=["due_date"],
+                condition=Q(is_deleted=False, completed=False),
+                name="task_open_due_idx",
+            ),
+            models.Index(fields=["updated_at"], name="task_updated_idx"),
+            # Backs the admin's case-insensitive title prefix search
+            PatternOpsIndex(Upper("title"), name="task_title_upper_idx"),
+        ]
+
+    # `completed` and `user_id` as last read from or written to the database;
+    # None until then
+    _completed_in_db = None
+    _user_id_in_db = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        if "completed" in field_names:
+            task._completed_in_db = task.completed
+        if "user_id" in field_names:
+            task._user_id_in_db = task.user_id
+        return task
+
+    def newly_completed(self) -> bool:
+        """Whether saving would flip a stored, open task to completed."""
+        return self.completed and self._completed_in_db is False
+
+    def reassigned(self) -> bool:
+        """Whether saving would move a stored task to another user."""
+        return self._user_id_in_db is not None and self.user_id != self._user_id_in_db
+
+    def save(self, *args, **kwargs):
+        if self.newly_completed() and self.due_date is not None:
+            # May be rewarded from post_save, which must commit with it
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+        self._completed_in_db = self.completed
+        self._user_id_in_db = self.user_id
+
     def __str__(self):
         return self.title
 
@@ -36,10 +115,67 @@ class RecurringTask(models.Model):
     start_date = models.DateField(default=timezone.now)
     end_date = models.DateField(blank=True, null=True)
     day = models.IntegerField(blank=True, null=True)
+    # One bit per occurrence, see utils.completion_bits
+    completion_bits = models.BinaryField(default=b"")
+
+    # The (frequency, start_date, day) completion_bits is indexed by
+    _indexed_by = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        rule = super().from_db(db, field_names, values)
+        if {"frequency", "start_date", "day"}.issubset(field_names):
+            rule._indexed_by = rule.indexing()
+        return rule
 
     def __str__(self):
         return f"{self.task.title} - {self.get_frequency_display()}"
 
+    def indexing(self):
+        return self.frequency, self.start_date, self.day
+
+    def realign_completions(self) -> bool:
+        """
+        Moves completion bits to the occurrence indexes of the edited rule,
+        dropping ones for dates it no longer falls on. Returns whether the
+        bits changed.
+        """
+        indexed_by, self._indexed_by = self._indexed_by, self.indexing()
+        if indexed_by is None or indexed_by == self._indexed_by:
+            return False
+
+        old, new = to_int(self.completion_bits), 0
+        while old:
+            index = old.bit_length() - 1
+            old ^= 1 << index
+            occurrence = occurrence_at(*indexed_by, index)
+            new_index = occurrence_index(*self._indexed_by, occurrence)
+            if new_index is not None:
+                new |= 1 << new_index
+        changed = new != to_int(self.completion_bits)
+        self.completion_bits = to_bytes(new)
+        return changed
+
+    def occurrence_index(self, occurrence):
+        """The bit of `occurrence`, or None if the rule doesn't fall on it."""
+        if self.end_date and occurrence > self.end_date:
+            return None
+        return occurrence_index(self.frequency, self.start_date, self.day, occurrence)
+
+    def set_completed(self, occurrence, completed=True):
+        self.completion_bits = set_completed(
+            self.completion_bits, self.occurrence_index(occurrence), completed
+        )
+
+    def streak(self, today) -> Streak:
+        until = min(today, self.end_date) if self.end_date else today
+        due = occurrences_through(self.frequency, self.start_date, self.day, until)
+        return streak(
+            self.completion_bits,
+            due,
+            last_is_today=self.occurrence_index(today) is not None,
+        )
+
     def clean(self):
         if self.start_date and self.end_date and self.start_date > self.end_date:
             raise ValidationError("Start date must be before end date")
@@ -60,12 +196,34 @@ class RecurringTask(models.Model):
         if self.frequency == self.MONTHLY and (self.day < 1 or self.day > 31):
             raise ValidationError("Day must be between 1 and 31 for monthly tasks")
 
-        if self.frequency == self.YEARLY and (self.day < 1 or self.day > 366):
+        # Yearly rules without a day recur on the start date's day of the year
+        if (
+            self.frequency == self.YEARLY
+            and self.day is not None
+            and (self.day < 1 or self.day > 366)
+        ):
             raise ValidationError("Day must be between 1 and 366 for yearly tasks")
 
     def save(self, *args, **kwargs):
         self.clean()
+        update_fields = kwargs.get("update_fields")
+        if self.realign_completions() and update_fields is not None:
+            # update_or_create only saves the fields it was given
+            kwargs["update_fields"] = {*update_fields, "completion_bits"}
         super(RecurringTask, self).save(*args, **kwargs)
+        # Recurrence changes are task changes as far as sync and caches go
+        Task.objects.filter(pk=self.task_id).update(updated_at=timezone.now())
+        invalidate_task_details(self.task_id)
+
+    def occurrences(self, window_start, window_end):
+        return expand_occurrences(
+            self.frequency,
+            self.start_date,
+            self.end_date,
+            self.day,
+            window_start,
+            window_end,
+        )
 
 
 class SingleTask(models.Model):
@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Task import Task, RecurringTask
+
+
+class TaskOccurrenceManager(models.Manager):
+    def rolling_window(self):
+        """The date range refreshes materialize: today plus the rolling horizon."""
+        today = timezone.localdate()
+        return today, today + timedelta(days=settings.OCCURRENCE_HORIZON_DAYS - 1)
+
+    def materialized_through(self):
+        """
+        The date `refresh_occurrences` last materialized every rule through,
+        or None before it first runs. Rules saved since were materialized on
+        save, so any window from today up to it can be read from the rows.
+        """
+        return OccurrenceWindow.objects.values_list(
+            "materialized_through", flat=True
+        ).first()
+
+    def is_materialized(self, window_start, window_end) -> bool:
+        if window_start < timezone.localdate():
+            return False
+        through = self.materialized_through()
+        return through is not None and window_end <= through
+
+    def record_materialized_through(self, through):
+        OccurrenceWindow.objects.update_or_create(
+            pk=OccurrenceWindow.SINGLETON_ID,
+            defaults={"materialized_through": through},
+        )
+
+    def clear_upcoming(self, **lookups):
+        """Drops not-yet-due occurrences, e.g. of tasks that were deleted."""
+        window_start, _ = self.rolling_window()
+        self.filter(occurrence_date__gte=window_start, **lookups).delete()
+
+    def reassign(self, tasks):
+        """Moves the occurrences of the given tasks to their current owner."""
+        task_ids = {}
+        for task in tasks:
+            task_ids.setdefault(task.user_id, []).append(task.id)
+
+        for user_id, ids in task_ids.items():
+            self.filter(task_id__in=ids).exclude(user_id=user_id).update(
+                user_id=user_id
+            )
+
+    def refresh(self, recurring_tasks):
+        """
+        Regenerates the materialized occurrences of the given rules inside the
+        rolling window. Occurrences that still apply keep their completion
+        state; ones the rule no longer produces are removed, and ones left
+        with a previous owner of the task are moved to its current one. Past
+        rows are left alone so completion history survives rule edits.
+        """
+        window_start, window_end = self.rolling_window()
+        rules = {rule.task_id: rule for rule in recurring_tasks}
+        if not rules:
+            return
+
+        # Rules of deleted tasks produce nothing, which clears their rows
+        user_ids = dict(
+            Task.objects.filter(id__in=rules, is_deleted=False).values_list(
+                "id", "user_id"
+            )
+        )
+        wanted = {
+            (task_id, occurrence)
+            for task_id in user_ids
+            for occurrence in rules[task_id].occurrences(window_start, window_end)
+        }
+        existing = {
+            (task_id, occurrence): user_id
+            for task_id, occurrence, user_id in self.filter(
+                task_id__in=rules, occurrence_date__gte=window_start
+            ).values_list("task_id", "occurrence_date", "user_id")
+        }
+
+        stale = {}
+        for task_id, occurrence in existing.keys() - wanted:
+            stale.setdefault(task_id, []).append(occurrence)
+        moved = {
+            task_id
+            for (task_id, _), user_id in existing.items()
+            if task_id in user_ids and user_id != user_ids[task_id]
+        }
+
+        with transaction.atomic():
+            for task_id, occurrences in stale.items():
+                self.filter(task_id=task_id, occurrence_date__in=occurrences).delete()
+
+            self.reassign(
+                Task(id=task_id, user_id=user_ids[task_id]) for task_id in moved
+            )
+
+            self.bulk_create(
+                (
+                    TaskOccurrence(
+                        task_id=task_id,
+                        user_id=user_ids[task_id],
+                        occurrence_date=occurrence,
+                    )
+                    for task_id, occurrence in wanted - existing.keys()
+                ),
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+
+
+class TaskOccurrence(models.Model):
+    task = models.ForeignKey(Task, on_delete=models.CASCADE)
+    # Denormalized from task so an agenda read is one range scan on one index
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
+    occurrence_date = models.DateField()
+    completed = models.BooleanField(default=False)
+
+    objects = TaskOccurrenceManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "occurrence_date"], name="occurrence_task_date_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "occurrence_date"], name="occurrence_user_date_idx"
+            ),
+            # Backs the reminder worker's window of open occurrences
+            models.Index(
+                fields=["occurrence_date"],
+                condition=models.Q(completed=False),
+                name="occurrence_open_date_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} - {self.occurrence_date}"
+
+
+class OccurrenceWindow(models.Model):
+    """A single row: the date `refresh_occurrences` last materialized through."""
+
+    SINGLETON_ID = 1
+
+    materialized_through = models.DateField()
+
+    def __str__(self):
+        return f"Materialized through {self.materialized_through}"
+
+
+@receiver(post_save, sender=Task)
+def move_reassigned_task_occurrences(sender, instance, raw=False, **kwargs):
+    if not raw and instance.reassigned():
+        TaskOccurrence.objects.reassign([instance])
+
+
+@receiver(post_save, sender=RecurringTask)
+def refresh_recurring_task_occurrences(sender, instance, raw=False, **kwargs):
+    if not raw:
+        TaskOccurrence.objects.refresh([instance])
@@ -0,0 +1,57 @@
+from typing import Iterable
+
+from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from right_the_ship.core.models.CustomUser import CustomUser
+from right_the_ship.core.models.Task import Task
+
+
+class TaskTransferManager(models.Manager):
+    def record(self, tasks: Iterable[Task]):
+        """Records the previous owner of each task that is being reassigned."""
+        self.bulk_create(
+            TaskTransfer(
+                task_id=task.id,
+                from_user_id=task._user_id_in_db,
+                transferred_at=task.updated_at,
+            )
+            for task in tasks
+            if task.reassigned()
+        )
+
+
+class TaskTransfer(models.Model):
+    """
+    A task moving away from a user. The task no longer shows up among the
+    user's own, so sync reports it to them as deleted instead.
+    """
+
+    task = models.ForeignKey(Task, on_delete=models.CASCADE)
+    from_user = models.ForeignKey(
+        CustomUser, on_delete=models.CASCADE, related_name="+"
+    )
+    # The task's updated_at as of the transfer, so it sorts among its changes
+    transferred_at = models.DateTimeField()
+
+    objects = TaskTransferManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["from_user", "transferred_at", "task"],
+                name="tasktransfer_sync_idx",
+            ),
+            # Lets the tombstone purge find old transfers without a scan
+            models.Index(fields=["transferred_at"], name="tasktransfer_purge_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.task_id} from {self.from_user_id}"
+
+
+@receiver(post_save, sender=Task)
+def record_task_transfer(sender, instance, raw=False, **kwargs):
+    if not raw and instance.reassigned():
+        TaskTransfer.objects.record([instance])
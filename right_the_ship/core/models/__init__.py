@@ -1,2 +1,5 @@
 from .CustomUser import CustomUser
 from .Task import Task, RecurringTask, SingleTask
+from .TaskOccurrence import TaskOccurrence, OccurrenceWindow
+from .TaskTransfer import TaskTransfer
+from .Reward import RewardLedgerEntry, UserRewardSummary
@@ -0,0 +1,52 @@
+import logging
+from typing import List
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from right_the_ship.core.reminders.scheduler import Reminder
+from right_the_ship.core.utils.fast_json import dumps
+
+logger = logging.getLogger("right_the_ship.reminders")
+
+
+class ReminderBackend:
+    """Delivers fired reminders. Subclasses implement `deliver`."""
+
+    def deliver(self, reminders: List[Reminder]):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LogBackend(ReminderBackend):
+    """Logs each reminder to the right_the_ship.reminders logger."""
+
+    def deliver(self, reminders):
+        for reminder in reminders:
+            logger.info(
+                "Reminder for user %s: %r due %s",
+                reminder.user_id,
+                reminder.title,
+                reminder.due,
+            )
+
+
+class FileBackend(ReminderBackend):
+    """Appends reminders to settings.REMINDER_FILE as NDJSON."""
+
+    def __init__(self, path=None):
+        self.file = open(path or settings.REMINDER_FILE, "ab")
+
+    def deliver(self, reminders):
+        self.file.write(b"".join(dumps(r._asdict()) + b"\n" for r in reminders))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def get_reminder_backend(name: str = None) -> ReminderBackend:
+    name = name or settings.REMINDER_BACKEND
+    return import_string(settings.REMINDER_BACKEND_CLASSES.get(name, name))()
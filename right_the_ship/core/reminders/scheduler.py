@@ -0,0 +1,265 @@
+"""
+Reminder scheduling for `manage.py run_reminders`.
+
+Reminders for the next `horizon` are kept in a heap ordered by fire time, so
+the worker sleeps until the earliest one instead of scanning the task table.
+The window slides forward as time passes, loading only the newly covered
+range. Edits are picked up by polling tasks whose `updated_at` moved past
+the last poll; every write path stamps it, including RecurringTask.save and
+the bulk routes. Each fired batch is checked against the database once more,
+which also drops occurrences completed since they were scheduled (those
+don't touch the task's `updated_at`).
+"""
+
+import heapq
+import itertools
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from django.utils import timezone
+
+from right_the_ship.core.models import Task, TaskOccurrence
+
+# Re-read this much before the last poll, for writes that committed late
+POLL_OVERLAP = timedelta(seconds=5)
+
+# Fired reminders are re-checked against the database this many at a time
+CHECK_BATCH_SIZE = 500
+
+ReminderKey = Tuple[int, Optional[date]]
+
+
+class Reminder(NamedTuple):
+    fire_at: datetime
+    task_id: int
+    user_id: int
+    title: str
+    due: datetime
+    # Set for recurring task occurrences, None for a task's own due date
+    occurrence_date: Optional[date] = None
+
+    @property
+    def key(self) -> ReminderKey:
+        return self.task_id, self.occurrence_date
+
+
+class ReminderHeap:
+    """
+    A min-heap of reminders by fire time. Replaced and cancelled reminders
+    are left in the heap and skipped when they surface, so both are O(1)
+    apart from the heap push.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._live: Dict[ReminderKey, Reminder] = {}
+        self._task_keys: Dict[int, Set[ReminderKey]] = {}
+
+    def __len__(self):
+        return len(self._live)
+
+    def push(self, reminder: Reminder):
+        self._live[reminder.key] = reminder
+        self._task_keys.setdefault(reminder.task_id, set()).add(reminder.key)
+        heapq.heappush(self._heap, (reminder.fire_at, next(self._counter), reminder))
+        if len(self._heap) > 2 * len(self._live) + 1000:
+            self._compact()
+
+    def discard_task(self, task_id: int):
+        for key in self._task_keys.pop(task_id, ()):
+            self._live.pop(key, None)
+
+    def _forget(self, reminder: Reminder):
+        del self._live[reminder.key]
+        keys = self._task_keys[reminder.task_id]
+        keys.discard(reminder.key)
+        if not keys:
+            del self._task_keys[reminder.task_id]
+
+    def _is_live(self, reminder: Reminder) -> bool:
+        return self._live.get(reminder.key) is reminder
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._is_live(entry[2])]
+        heapq.heapify(self._heap)
+
+    def next_fire_at(self) -> Optional[datetime]:
+        while self._heap and not self._is_live(self._heap[0][2]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Reminder]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, reminder = heapq.heappop(self._heap)
+            if self._is_live(reminder):
+                self._forget(reminder)
+                due.append(reminder)
+        return due
+
+
+def start_of_day(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+class ReminderScheduler:
+    """
+    Keeps the reminders firing in [now, now + horizon) in a ReminderHeap and
+    hands due ones to `deliver`. Call `start` once, then `tick` in a loop;
+    it returns how many seconds the caller can sleep.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[List[Reminder]], None],
+        horizon: timedelta,
+        lead: timedelta,
+        poll_interval: timedelta,
+        clock: Callable[[], datetime] = timezone.now,
+    ):
+        self.deliver = deliver
+        self.horizon = horizon
+        self.lead = lead
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.heap = ReminderHeap()
+        self.loaded_until = None
+        self.polled_at = None
+        # What fired since the last poll, so the poll doesn't fire it again
+        self.fired: Set[Tuple[ReminderKey, datetime]] = set()
+
+    def start(self):
+        now = self.clock()
+        self.polled_at = now
+        self.loaded_until = now
+        self.extend_window(now)
+
+    def tick(self) -> float:
+        now = self.clock()
+        # The database is only read at the poll interval, not per reminder
+        if now - self.polled_at >= self.poll_interval:
+            self.poll_changes(now)
+            self.extend_window(now)
+        self.fire_due(now)
+
+        wake_at = self.polled_at + self.poll_interval
+        next_fire_at = self.heap.next_fire_at()
+        if next_fire_at is not None:
+            wake_at = min(wake_at, next_fire_at)
+        return max(0.0, (wake_at - self.clock()).total_seconds())
+
+    def task_reminder(self, task_id, user_id, title, due_date) -> Reminder:
+        return Reminder(due_date - self.lead, task_id, user_id, title, due_date)
+
+    def occurrence_reminder(self, task_id, user_id, title, occurrence) -> Reminder:
+        due = start_of_day(occurrence)
+        return Reminder(due - self.lead, task_id, user_id, title, due, occurrence)
+
+    def schedule(self, reminders: Iterable[Reminder], start: datetime, end: datetime):
+        for reminder in reminders:
+            if start <= reminder.fire_at < end:
+                self.heap.push(reminder)
+
+    def load_reminders(
+        self, start: datetime, end: datetime, updated_since: Optional[datetime] = None
+    ) -> List[Reminder]:
+        """
+        Reminders firing in [start, end), optionally only of tasks written
+        since `updated_since`.
+        """
+        tasks = Task.objects.filter(
+            completed=False,
+            due_date__gte=start + self.lead,
+            due_date__lt=end + self.lead,
+        )
+        occurrences = TaskOccurrence.objects.filter(
+            completed=False,
+            task__is_deleted=False,
+            occurrence_date__gte=(start + self.lead).date(),
+            occurrence_date__lte=(end + self.lead).date(),
+        )
+        if updated_since is not None:
+            tasks = tasks.filter(updated_at__gte=updated_since)
+            occurrences = occurrences.filter(task__updated_at__gte=updated_since)
+
+        reminders = [
+            self.task_reminder(*row)
+            for row in tasks.values_list("id", "user_id", "title", "due_date")
+        ]
+        reminders += [
+            self.occurrence_reminder(*row)
+            for row in occurrences.values_list(
+                "task_id", "user_id", "task__title", "occurrence_date"
+            )
+        ]
+        return reminders
+
+    def extend_window(self, now: datetime):
+        end = now + self.horizon
+        if end > self.loaded_until:
+            self.schedule(
+                self.load_reminders(self.loaded_until, end), self.loaded_until, end
+            )
+            self.loaded_until = end
+
+    def poll_changes(self, now: datetime):
+        """Reschedules tasks written since the last poll."""
+        last_poll = self.polled_at
+        since = last_poll - POLL_OVERLAP
+        self.polled_at = now
+        changed = Task.all_objects.filter(updated_at__gte=since).values_list(
+            "id", flat=True
+        )
+        for task_id in changed.iterator():
+            self.heap.discard_task(task_id)
+        # From the last poll on, so a change made since then whose reminder is
+        # already due still fires, just late; ones that already fired don't
+        fired, self.fired = self.fired, set()
+        self.schedule(
+            (
+                reminder
+                for reminder in self.load_reminders(last_poll, self.loaded_until, since)
+                if (reminder.key, reminder.due) not in fired
+            ),
+            last_poll,
+            self.loaded_until,
+        )
+
+    def still_due(self, reminders: List[Reminder]) -> List[Reminder]:
+        """Drops reminders whose task or occurrence was closed meanwhile."""
+        task_ids = {r.task_id for r in reminders}
+        open_tasks = set(
+            Task.objects.filter(id__in=task_ids, completed=False).values_list(
+                "id", "due_date"
+            )
+        )
+        occurrence_dates = {r.occurrence_date for r in reminders if r.occurrence_date}
+        open_occurrences = set(
+            TaskOccurrence.objects.filter(
+                task_id__in=task_ids,
+                occurrence_date__in=occurrence_dates,
+                completed=False,
+            ).values_list("task_id", "occurrence_date")
+        )
+        return [
+            reminder
+            for reminder in reminders
+            if (
+                reminder.key in open_occurrences
+                if reminder.occurrence_date
+                else (reminder.task_id, reminder.due) in open_tasks
+            )
+        ]
+
+    def fire_due(self, now: datetime) -> int:
+        """Delivers every reminder due by `now` and returns how many fired."""
+        due = self.heap.pop_due(now)
+        fired = 0
+        for start in range(0, len(due), CHECK_BATCH_SIZE):
+            reminders = self.still_due(due[start : start + CHECK_BATCH_SIZE])
+            if reminders:
+                self.fired.update((r.key, r.due) for r in reminders)
+                self.deliver(reminders)
+                fired += len(reminders)
+        return fired
@@ -1,2 +1,18 @@
 from .user import UserIn, UserUpdateIn, UserOut
-from .task import TaskInSchema, TaskDetailSchema, TaskSchema
+from .task import (
+    TaskInSchema,
+    TaskDetailSchema,
+    TaskSchema,
+    TaskPageSchema,
+    OccurrenceSchema,
+    OccurrenceCompletionSchema,
+    StreakSchema,
+    TaskBulkUpdateSchema,
+    TaskBulkDeleteSchema,
+    TaskBulkResultSchema,
+    TaskImportErrorSchema,
+    TaskImportResultSchema,
+)
+from .sync import SyncSchema
+from .reward import RewardSummarySchema
+from .leaderboard import LeaderboardEntrySchema, LeaderboardSchema
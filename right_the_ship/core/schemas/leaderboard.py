@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from ninja import Schema
+
+
+class LeaderboardEntrySchema(Schema):
+    rank: int
+    user_id: int
+    username: Optional[str] = None
+    score: int
+
+
+class LeaderboardSchema(Schema):
+    board: str
+    total: int
+    entries: List[LeaderboardEntrySchema]
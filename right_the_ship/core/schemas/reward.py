@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import List, Optional
+
+from ninja import Schema
+
+
+class RewardSummarySchema(Schema):
+    user_id: int
+    points: int
+    on_time_completions: int
+    achievements: List[str]
+    updated_at: Optional[datetime] = None
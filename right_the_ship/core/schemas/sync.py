@@ -0,0 +1,12 @@
+from typing import List, Optional
+
+from ninja import Schema
+
+from right_the_ship.core.schemas.task import TaskDetailSchema
+
+
+class SyncSchema(Schema):
+    tasks: List[TaskDetailSchema]
+    deleted: List[int]
+    next_token: Optional[str] = None
+    has_more: bool
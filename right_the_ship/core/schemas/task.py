@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 from ninja import Schema
 from pydantic import Field
@@ -17,6 +17,14 @@ class TaskInSchema(Schema):
     day: Optional[int] = Field(None, gte=0, lt=32)
 
 
+class TaskBulkUpdateSchema(TaskInSchema):
+    id: int = Field(..., gt=0)
+
+
+class TaskBulkDeleteSchema(Schema):
+    ids: List[int] = Field(..., min_length=1)
+
+
 class TaskSchema(Schema):
     id: Optional[int]
     title: str
@@ -32,3 +40,82 @@ class TaskDetailSchema(Schema):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     day: Optional[int] = None
+
+
+# values() fields for building TaskDetailSchema-shaped dicts without loading
+# models or validating them again; keep both in step with the schema above
+TASK_DETAIL_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "due_date",
+    "completed",
+    "recurringtask__id",
+    "recurringtask__frequency",
+    "recurringtask__start_date",
+    "recurringtask__end_date",
+    "recurringtask__day",
+)
+
+
+def task_detail_from_row(row: dict) -> dict:
+    due_date = row["due_date"]
+    return {
+        "task": {
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            # Stored as midnight datetimes, served as dates
+            "due_date": due_date.date() if due_date else None,
+            "completed": row["completed"],
+        },
+        "is_recurring": row["recurringtask__id"] is not None,
+        "frequency": row["recurringtask__frequency"],
+        "start_date": row["recurringtask__start_date"],
+        "end_date": row["recurringtask__end_date"],
+        "day": row["recurringtask__day"],
+    }
+
+
+class TaskPageSchema(Schema):
+    items: List[TaskDetailSchema]
+    next_cursor: Optional[str] = None
+
+
+class OccurrenceSchema(Schema):
+    task_id: int
+    title: str
+    date: date
+    completed: bool = False
+
+
+class OccurrenceCompletionSchema(Schema):
+    completed: bool = Field(True)
+
+
+class StreakSchema(Schema):
+    task_id: int
+    current_streak: int
+    longest_streak: int
+    completed: int
+    due: int
+    completion_rate: float
+
+
+class TaskBulkResultSchema(Schema):
+    index: int
+    success: bool
+    id: Optional[int] = None
+    task: Optional[TaskDetailSchema] = None
+    error: Optional[str] = None
+
+
+class TaskImportErrorSchema(Schema):
+    line: int
+    error: str
+
+
+class TaskImportResultSchema(Schema):
+    imported: int
+    failed: int
+    errors: List[TaskImportErrorSchema]
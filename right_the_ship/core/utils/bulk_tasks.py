@@ -0,0 +1,148 @@
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from right_the_ship.core.models import (
+    CustomUser,
+    RecurringTask,
+    RewardLedgerEntry,
+    Task,
+    TaskOccurrence,
+    TaskTransfer,
+)
+
+TASK_FIELDS = ("title", "description", "due_date", "completed")
+RECURRING_FIELDS = ("frequency", "start_date", "end_date", "day")
+
+PreparedTask = Tuple[Task, Optional[RecurringTask]]
+
+
+def due_datetime(due_date: Optional[date]) -> Optional[datetime]:
+    # Due dates are stored as aware midnights; a plain date makes
+    # DateTimeField warn on every write
+    if due_date is None:
+        return None
+    return timezone.make_aware(datetime.combine(due_date, time.min))
+
+
+def split_task_data(task_data: dict) -> Tuple[int, dict, Optional[dict]]:
+    """
+    Splits validated TaskInSchema data into the user id, the Task fields and,
+    when the task recurs, the RecurringTask fields.
+    """
+    task_data = dict(task_data)
+    user_id = task_data.pop("user_id")
+    if "due_date" in task_data:
+        task_data["due_date"] = due_datetime(task_data["due_date"])
+    recurring_data = {field: task_data.pop(field, None) for field in RECURRING_FIELDS}
+
+    if not (recurring_data["frequency"] and recurring_data["start_date"]):
+        recurring_data = None
+
+    return user_id, task_data, recurring_data
+
+
+def resolve_users(items: Iterable[dict]) -> Dict[int, CustomUser]:
+    return CustomUser.objects.in_bulk({item["user_id"] for item in items})
+
+
+def build_recurring_task(
+    task: Task, recurring_data: dict, recurring_task: Optional[RecurringTask] = None
+) -> RecurringTask:
+    """Applies and validates recurrence fields without saving them."""
+    recurring_task = recurring_task or RecurringTask()
+    recurring_task.task = task
+    for attr, value in recurring_data.items():
+        setattr(recurring_task, attr, value)
+    recurring_task.clean()
+    return recurring_task
+
+
+def prepare_new_task(task_data: dict, users: Dict[int, CustomUser]) -> PreparedTask:
+    """Builds an unsaved Task (and RecurringTask). Raises ValidationError."""
+    user_id, task_fields, recurring_data = split_task_data(task_data)
+    if user_id not in users:
+        raise ValidationError("User not found.")
+
+    task = Task(user=users[user_id], **task_fields)
+    recurring_task = (
+        build_recurring_task(task, recurring_data) if recurring_data else None
+    )
+    return task, recurring_task
+
+
+def prepare_task_update(
+    task: Task, task_data: dict, users: Dict[int, CustomUser]
+) -> PreparedTask:
+    """
+    Applies an update to a loaded Task without saving. The returned
+    RecurringTask is None when the update leaves the recurrence untouched.
+    Raises ValidationError.
+    """
+    user_id, task_fields, recurring_data = split_task_data(task_data)
+    if user_id not in users:
+        raise ValidationError("User not found.")
+
+    task.user = users[user_id]
+    for attr, value in task_fields.items():
+        setattr(task, attr, value)
+
+    if not recurring_data:
+        return task, None
+
+    recurring_task = getattr(task, "recurringtask", None)
+    return task, build_recurring_task(task, recurring_data, recurring_task)
+
+
+def create_tasks(prepared: List[PreparedTask]):
+    """Inserts prepared tasks and their recurrences with two bulk inserts."""
+    with transaction.atomic():
+        Task.objects.bulk_create([task for task, _ in prepared])
+
+        recurring_tasks = []
+        for task, recurring_task in prepared:
+            if recurring_task:
+                # Re-assign so the now-populated task id is picked up
+                recurring_task.task = task
+                recurring_tasks.append(recurring_task)
+        RecurringTask.objects.bulk_create(recurring_tasks)
+
+        TaskOccurrence.objects.refresh(recurring_tasks)
+
+
+def update_tasks(prepared: List[PreparedTask]):
+    """Writes prepared task updates with bulk updates and one bulk insert."""
+    now = timezone.now()
+    tasks = []
+    for task, _ in prepared:
+        # bulk_update skips auto_now, so stamp updated_at ourselves
+        task.updated_at = now
+        tasks.append(task)
+
+    # bulk_update skips post_save, so completions are rewarded here
+    newly_completed = [task for task in tasks if task.newly_completed()]
+    reassigned = [task for task in tasks if task.reassigned()]
+    recurring_tasks = [rule for _, rule in prepared if rule]
+    new_rules = [rule for rule in recurring_tasks if rule.pk is None]
+    changed_rules = [rule for rule in recurring_tasks if rule.pk is not None]
+    for rule in changed_rules:
+        rule.realign_completions()
+
+    with transaction.atomic():
+        Task.objects.bulk_update(tasks, [*TASK_FIELDS, "user", "updated_at"])
+        RewardLedgerEntry.objects.award_on_time(newly_completed, now)
+        RecurringTask.objects.bulk_create(new_rules)
+        RecurringTask.objects.bulk_update(
+            changed_rules, [*RECURRING_FIELDS, "completion_bits"]
+        )
+
+        TaskOccurrence.objects.reassign(reassigned)
+        TaskTransfer.objects.record(reassigned)
+        TaskOccurrence.objects.refresh(recurring_tasks)
+
+    for task in tasks:
+        task._completed_in_db = task.completed
+        task._user_id_in_db = task.user_id
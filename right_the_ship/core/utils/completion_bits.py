@@ -0,0 +1,90 @@
+"""
+Completion history of recurring tasks as a bitset: bit i is set when the
+rule's i-th occurrence (see recurrence.occurrence_index) was completed. The
+bytes are a little-endian Python int, so masking and counting run over
+machine words in C; a daily task costs 46 bytes a year instead of 365 rows.
+"""
+
+from typing import NamedTuple, Tuple
+
+
+def to_int(bits: bytes) -> int:
+    # Accepts the memoryview PostgreSQL hands back for binary columns
+    return int.from_bytes(bits, "little")
+
+
+def to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def is_completed(bits: bytes, index: int) -> bool:
+    return bool(to_int(bits) >> index & 1)
+
+
+def set_completed(bits: bytes, index: int, completed: bool = True) -> bytes:
+    value = to_int(bits)
+    value = value | 1 << index if completed else value & ~(1 << index)
+    return to_bytes(value)
+
+
+def first_bits(value: int, count: int) -> int:
+    return value & ((1 << count) - 1)
+
+
+def trailing_run(value: int, count: int) -> int:
+    """The run of set bits ending at bit `count - 1`."""
+    gaps = ~value & ((1 << count) - 1)
+    return count - gaps.bit_length()
+
+
+def byte_runs(byte: int) -> Tuple[int, int, int]:
+    """A byte's run of set bits from bit 0, run into bit 7, and longest run."""
+    bits = [byte >> i & 1 for i in range(8)]
+    low = bits.index(0) if 0 in bits else 8
+    high = bits[::-1].index(0) if 0 in bits else 8
+    longest = run = 0
+    for bit in bits:
+        run = run + 1 if bit else 0
+        longest = max(longest, run)
+    return low, high, longest
+
+
+BYTE_RUNS = [byte_runs(byte) for byte in range(256)]
+
+
+def longest_run(value: int, count: int) -> int:
+    """The longest run of set bits among the first `count`, a byte at a time."""
+    longest = run = 0
+    for byte in to_bytes(first_bits(value, count)):
+        if byte == 0xFF:
+            run += 8
+            continue
+        low, high, inner = BYTE_RUNS[byte]
+        longest = max(longest, run + low, inner)
+        run = high
+    return max(longest, run)
+
+
+class Streak(NamedTuple):
+    current: int
+    longest: int
+    completed: int
+    # Occurrences so far, including today's
+    due: int
+
+    @property
+    def completion_rate(self) -> float:
+        return self.completed / self.due if self.due else 0.0
+
+
+def streak(bits: bytes, due: int, last_is_today: bool = False) -> Streak:
+    """
+    Streaks over the first `due` occurrences. When the last of them is today
+    and still open, the current streak runs up to yesterday's instead of
+    being broken by it.
+    """
+    value = first_bits(to_int(bits), due)
+    current = trailing_run(value, due)
+    if current == 0 and last_is_today:
+        current = trailing_run(value, due - 1)
+    return Streak(current, longest_run(value, due), value.bit_count(), due)
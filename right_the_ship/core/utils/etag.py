@@ -0,0 +1,72 @@
+from functools import wraps
+from typing import Optional
+
+from django.db.models import QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+from right_the_ship.core.models import CustomUser, Task
+
+
+def updated_at_etag(queryset: QuerySet, pk: int) -> Optional[str]:
+    """
+    Builds a strong ETag from a row's updated_at with a single primary key
+    lookup that never loads or serializes the object.
+    """
+    updated_at = queryset.filter(pk=pk).values_list("updated_at", flat=True).first()
+    return version_etag(pk, updated_at)
+
+
+async def aupdated_at_etag(queryset: QuerySet, pk: int) -> Optional[str]:
+    updated_at = (
+        await queryset.filter(pk=pk).values_list("updated_at", flat=True).afirst()
+    )
+    return version_etag(pk, updated_at)
+
+
+def version_etag(pk: int, updated_at) -> Optional[str]:
+    if updated_at is None:
+        return None
+    return f"{pk}-{updated_at.timestamp():.6f}"
+
+
+def task_etag(request, task_id: int) -> Optional[str]:
+    return updated_at_etag(Task.objects, task_id)
+
+
+def user_etag(request, user_id: int) -> Optional[str]:
+    return updated_at_etag(CustomUser.objects, user_id)
+
+
+async def atask_etag(request, task_id: int) -> Optional[str]:
+    return await aupdated_at_etag(Task.objects, task_id)
+
+
+async def auser_etag(request, user_id: int) -> Optional[str]:
+    return await aupdated_at_etag(CustomUser.objects, user_id)
+
+
+def async_condition(etag_func):
+    """
+    `condition(etag_func=...)` for async views. Django's decorator calls
+    `etag_func` synchronously, and a query can't run on the event loop, so
+    this one awaits it instead.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            etag = await etag_func(request, *args, **kwargs)
+            etag = quote_etag(etag) if etag is not None else None
+
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+
+            if etag and request.method in ("GET", "HEAD"):
+                response.headers.setdefault("ETag", etag)
+            return response
+
+        return inner
+
+    return decorator
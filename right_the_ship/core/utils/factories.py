@@ -0,0 +1,189 @@
+"""
+Factories for realistic synthetic rows, for tests, benchmarks and `manage.py
+seed`. `build` returns an unsaved instance, `create` saves it through the
+model (validation and signals included), and `bulk_create` inserts batches
+with `bulk_create`, which skips `save()`. Every user built by one
+UserFactory shares a single password hash.
+"""
+
+import itertools
+import random
+from datetime import date, timedelta
+from typing import Iterator, List, Optional, Sequence
+
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from right_the_ship.core.models import CustomUser, RecurringTask, SingleTask, Task
+
+TASK_VERBS = ["Clean", "Call", "Email", "Pay", "Water", "Book", "Review", "Fix"]
+TASK_OBJECTS = [
+    "the kitchen",
+    "mom",
+    "the landlord",
+    "rent",
+    "the plants",
+    "a dentist appointment",
+    "the budget",
+    "the bike",
+]
+
+
+class Factory:
+    model = None
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.sequence = itertools.count()
+
+    def fields(self, number: int, **overrides) -> dict:
+        raise NotImplementedError
+
+    def build(self, **overrides):
+        fields = self.fields(next(self.sequence), **overrides)
+        return self.model(**{**fields, **overrides})
+
+    def create(self, **overrides):
+        instance = self.build(**overrides)
+        instance.save()
+        return instance
+
+    def bulk_create(
+        self, count: int, batch_size: int = 5000, **overrides
+    ) -> Iterator[list]:
+        """Inserts `count` rows, yielding each saved batch."""
+        for start in range(0, count, batch_size):
+            yield self.model.objects.bulk_create(
+                self.build(**overrides) for _ in range(min(batch_size, count - start))
+            )
+
+
+class UserFactory(Factory):
+    model = CustomUser
+
+    def __init__(self, seed: int = 0, prefix: str = "user", password: str = "password"):
+        super().__init__(seed)
+        self.prefix = prefix
+        self.password_hash = make_password(password)
+
+    def fields(self, number: int, **overrides) -> dict:
+        username = f"{self.prefix}{number}"
+        return {
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": self.password_hash,
+        }
+
+
+class TaskFactory(Factory):
+    model = Task
+
+    def __init__(self, seed: int = 0, user_ids: Optional[Sequence[int]] = None):
+        super().__init__(seed)
+        self.user_ids = user_ids
+        self.today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def fields(self, number: int, **overrides) -> dict:
+        fields = {
+            "title": f"{self.rng.choice(TASK_VERBS)} {self.rng.choice(TASK_OBJECTS)}",
+            "description": f"Synthetic task {number}",
+            # Whole days, as the API stores them; some tasks have none
+            "due_date": (
+                self.today + timedelta(days=self.rng.randrange(-30, 365))
+                if self.rng.random() < 0.8
+                else None
+            ),
+            "completed": self.rng.random() < 0.3,
+        }
+        if "user" not in overrides and "user_id" not in overrides:
+            fields["user_id"] = self.rng.choice(self.user_ids)
+        return fields
+
+
+class RecurringTaskFactory(Factory):
+    """Always produces rules RecurringTask.clean accepts."""
+
+    model = RecurringTask
+
+    def fields(self, number: int, **overrides) -> dict:
+        frequency = overrides.get("frequency") or self.rng.choice(
+            [
+                RecurringTask.DAILY,
+                RecurringTask.WEEKLY,
+                RecurringTask.MONTHLY,
+                RecurringTask.YEARLY,
+            ]
+        )
+        start_date = date.today() - timedelta(days=self.rng.randrange(365))
+        return {
+            "frequency": frequency,
+            "start_date": start_date,
+            "end_date": (
+                start_date + timedelta(days=self.rng.randrange(30, 730))
+                if self.rng.random() < 0.3
+                else None
+            ),
+            "day": {
+                RecurringTask.DAILY: None,
+                RecurringTask.WEEKLY: self.rng.randrange(1, 7),
+                RecurringTask.MONTHLY: self.rng.randrange(1, 32),
+                RecurringTask.YEARLY: self.rng.randrange(1, 367),
+            }[frequency],
+        }
+
+    def for_tasks(self, tasks: List[Task]) -> List[RecurringTask]:
+        return RecurringTask.objects.bulk_create(
+            self.build(task=task) for task in tasks
+        )
+
+
+class SingleTaskFactory(Factory):
+    model = SingleTask
+
+    def fields(self, number: int, **overrides) -> dict:
+        return {}
+
+    def for_tasks(self, tasks: List[Task]) -> List[SingleTask]:
+        return SingleTask.objects.bulk_create(self.build(task=task) for task in tasks)
+
+
+def seed_users(
+    count: int, batch_size: int = 5000, seed: int = 0, prefix: str = "user"
+) -> List[int]:
+    """Bulk inserts `count` users and returns their ids."""
+    factory = UserFactory(seed, prefix=prefix)
+    return [
+        user.id for batch in factory.bulk_create(count, batch_size) for user in batch
+    ]
+
+
+def seed_tasks(
+    count: int,
+    user_ids: Sequence[int],
+    recurring_ratio: float = 0.2,
+    single_tasks: bool = False,
+    batch_size: int = 5000,
+    seed: int = 0,
+) -> int:
+    """
+    Bulk inserts `count` tasks spread over `user_ids`, about `recurring_ratio`
+    of them recurring, and returns how many recur. Occurrences are not
+    materialized; run refresh_occurrences afterwards.
+    """
+    tasks = TaskFactory(seed, user_ids=user_ids)
+    recurring_tasks = RecurringTaskFactory(seed)
+    single = SingleTaskFactory(seed)
+
+    recurring = 0
+    for batch in tasks.bulk_create(count, batch_size):
+        is_recurring = [tasks.rng.random() < recurring_ratio for _ in batch]
+        recurring += len(
+            recurring_tasks.for_tasks(
+                [task for task, recurs in zip(batch, is_recurring) if recurs]
+            )
+        )
+        if single_tasks:
+            single.for_tasks(
+                [task for task, recurs in zip(batch, is_recurring) if not recurs]
+            )
+    return recurring
@@ -0,0 +1,72 @@
+"""
+A faster response path for hot read routes. A route decorated with
+`fast_json` returns plain dicts and lists (see TASK_DETAIL_FIELDS and
+task_detail_from_row in core/schemas/task.py) which are encoded straight to
+the response, skipping the validation ninja runs against the route's
+response schema. orjson is used when installed, the standard library json
+module otherwise. The schema stays on the route for the OpenAPI docs, so
+the dicts must keep matching it.
+"""
+
+import functools
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from pydantic import BaseModel
+
+from right_the_ship.core.utils.request_metrics import record_serialization
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # Schemas still turn up from the cache and other shared helpers
+        if isinstance(o, BaseModel):
+            return o.model_dump()
+        return super().default(o)
+
+
+_encoder = FastJSONEncoder(separators=(",", ":"))
+
+
+if orjson is not None:
+
+    def dumps(data) -> bytes:
+        return orjson.dumps(data, default=_encoder.default)
+
+else:
+
+    def dumps(data) -> bytes:
+        return _encoder.encode(data).encode()
+
+
+class FastJSONResponse(HttpResponse):
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        started = time.perf_counter()
+        content = dumps(data)
+        record_serialization(time.perf_counter() - started)
+        super().__init__(content, **kwargs)
+
+
+def fast_json(view):
+    """Route decorator sending the view's result through FastJSONResponse."""
+    if iscoroutinefunction(view):
+
+        @functools.wraps(view)
+        async def async_wrapper(*args, **kwargs):
+            return FastJSONResponse(await view(*args, **kwargs))
+
+        return async_wrapper
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        return FastJSONResponse(view(*args, **kwargs))
+
+    return wrapper
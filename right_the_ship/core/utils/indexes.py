@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class PatternOpsIndex(models.Index):
+    """
+    A functional index LIKE 'prefix%' lookups can use. PostgreSQL only uses a
+    b-tree for LIKE under the C collation unless the index is built with the
+    text_pattern_ops operator class, so it is added there; other databases
+    get a plain functional index.
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor == "postgresql" and self.expressions:
+            from django.contrib.postgres.indexes import OpClass
+
+            _, expressions, options = self.deconstruct()
+            index = models.Index(
+                *(OpClass(e, "text_pattern_ops") for e in expressions), **options
+            )
+            return index.create_sql(model, schema_editor, using, **kwargs)
+        return super().create_sql(model, schema_editor, using, **kwargs)
@@ -0,0 +1,44 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from ninja.errors import HttpError
+
+
+def encode_cursor(value: Optional[datetime], pk: int) -> str:
+    payload = json.dumps([value.isoformat() if value else None, pk])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (datetime.fromisoformat(value) if value else None), int(pk)
+    except (ValueError, TypeError):
+        raise HttpError(400, "Invalid cursor.")
+
+
+def encode_sync_token(
+    value: Optional[datetime], pk: int, synced_through: datetime
+) -> str:
+    """
+    A cursor plus the time the client is known to be in sync through, which
+    is when the token was issued unless more changes are still to come.
+    """
+    payload = json.dumps(
+        [value.isoformat() if value else None, pk, synced_through.isoformat()]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_sync_token(token: str) -> Tuple[Optional[datetime], int, datetime]:
+    try:
+        value, pk, synced_through = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return (
+            datetime.fromisoformat(value) if value else None,
+            int(pk),
+            datetime.fromisoformat(synced_through),
+        )
+    except (ValueError, TypeError):
+        raise HttpError(400, "Invalid sync token.")
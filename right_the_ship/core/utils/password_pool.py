@@ -0,0 +1,73 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from ninja.errors import HttpError
+
+_pool = None
+_slots = None
+_pool_lock = threading.Lock()
+
+
+def _setup_worker():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "right_the_ship.settings")
+    django.setup()
+
+
+def password_pool():
+    """
+    The executor that hashes passwords, created on first use, and the
+    semaphore bounding how many hashes may be running or queued on it.
+    """
+    global _pool, _slots
+    with _pool_lock:
+        if _pool is None:
+            workers = settings.PASSWORD_HASH_WORKERS
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                _pool = ProcessPoolExecutor(workers, initializer=_setup_worker)
+            else:
+                # The stdlib hashers and argon2-cffi release the GIL
+                _pool = ThreadPoolExecutor(workers, thread_name_prefix="password")
+            _slots = threading.BoundedSemaphore(workers + settings.PASSWORD_HASH_QUEUE)
+        return _pool, _slots
+
+
+def shutdown_password_pool():
+    """Stops the pool; the next hash builds a new one from current settings."""
+    global _pool, _slots
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = _slots = None
+
+
+def submit_password_hash(raw_password: str) -> Future:
+    """
+    Queues `raw_password` for hashing. Raises HttpError 429 instead of
+    queueing when the pool is full, so a signup burst can't tie up every
+    request worker waiting on hashes.
+    """
+    pool, slots = password_pool()
+    if not slots.acquire(blocking=False):
+        raise HttpError(429, "Too many password changes in progress, try again.")
+
+    try:
+        future = pool.submit(make_password, raw_password)
+    except BaseException:
+        slots.release()
+        raise
+
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+def hash_password(raw_password: str) -> str:
+    return submit_password_hash(raw_password).result()
+
+
+async def ahash_password(raw_password: str) -> str:
+    return await asyncio.wrap_future(submit_password_hash(raw_password))
@@ -0,0 +1,157 @@
+import calendar
+from datetime import date, timedelta
+from typing import Iterator, Optional
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+YEARLY = "yearly"
+
+
+def normalized_day(frequency: str, start_date: date, day: Optional[int]) -> int:
+    """
+    Returns the rule's day as an offset the expansion can use directly:
+    a Python weekday (Monday is 0) for weekly rules, the day of the month for
+    monthly rules and the day of the year for yearly rules. Rules saved
+    without a day fall back to the day their start date lands on.
+    """
+    if frequency == WEEKLY:
+        # Stored days count from Sunday (0), Python weekdays from Monday (0)
+        return (day - 1) % 7 if day is not None else start_date.weekday()
+    if frequency == MONTHLY:
+        return day if day else start_date.day
+    if frequency == YEARLY:
+        return day if day else start_date.timetuple().tm_yday
+    return 0
+
+
+def days_in_year(year: int) -> int:
+    return 366 if calendar.isleap(year) else 365
+
+
+def month_occurrence(year: int, month: int, day: int) -> date:
+    # day=31 lands on the last day of shorter months
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def year_occurrence(year: int, day: int) -> date:
+    # day=366 lands on December 31st outside leap years
+    return date(year, 1, 1) + timedelta(days=min(day, days_in_year(year)) - 1)
+
+
+def expand_occurrences(
+    frequency: str,
+    start_date: date,
+    end_date: Optional[date],
+    day: Optional[int],
+    window_start: date,
+    window_end: date,
+) -> Iterator[date]:
+    """
+    Yields the dates a recurring rule falls on within [window_start, window_end]
+    in ascending order. Work is proportional to the number of occurrences
+    (or months/years spanned), never to the size of the window in days.
+    """
+    first = max(start_date, window_start)
+    last = min(end_date, window_end) if end_date else window_end
+    if first > last:
+        return
+
+    if frequency == DAILY:
+        for offset in range((last - first).days + 1):
+            yield first + timedelta(days=offset)
+
+    elif frequency == WEEKLY:
+        weekday = normalized_day(frequency, start_date, day)
+        current = first + timedelta(days=(weekday - first.weekday()) % 7)
+        while current <= last:
+            yield current
+            current += timedelta(days=7)
+
+    elif frequency == MONTHLY:
+        month_day = normalized_day(frequency, start_date, day)
+        year, month = first.year, first.month
+        while (year, month) <= (last.year, last.month):
+            current = month_occurrence(year, month, month_day)
+            if first <= current <= last:
+                yield current
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    elif frequency == YEARLY:
+        year_day = normalized_day(frequency, start_date, day)
+        for year in range(first.year, last.year + 1):
+            current = year_occurrence(year, year_day)
+            if first <= current <= last:
+                yield current
+
+
+def first_occurrence(
+    frequency: str, start_date: date, day: Optional[int]
+) -> Optional[date]:
+    """The first date the rule falls on, on or after its start date."""
+    return next(
+        expand_occurrences(frequency, start_date, None, day, start_date, date.max),
+        None,
+    )
+
+
+def months_between(first: date, last: date) -> int:
+    return (last.year - first.year) * 12 + last.month - first.month
+
+
+def occurrences_through(
+    frequency: str, start_date: date, day: Optional[int], until: date
+) -> int:
+    """
+    How many times the rule falls on or before `until`, ignoring its end
+    date. Constant time for every frequency.
+    """
+    first = first_occurrence(frequency, start_date, day)
+    if first is None or until < first:
+        return 0
+
+    if frequency == DAILY:
+        return (until - first).days + 1
+    if frequency == WEEKLY:
+        return (until - first).days // 7 + 1
+
+    day = normalized_day(frequency, start_date, day)
+    if frequency == MONTHLY:
+        passed = months_between(first, until)
+        latest = month_occurrence(until.year, until.month, day)
+    else:
+        passed = until.year - first.year
+        latest = year_occurrence(until.year, day)
+    # Whether this month's (or year's) occurrence has come yet
+    return passed + (latest <= until)
+
+
+def occurrence_index(
+    frequency: str, start_date: date, day: Optional[int], occurrence: date
+) -> Optional[int]:
+    """
+    The position of `occurrence` among the rule's occurrences, counting from
+    0, or None when the rule doesn't fall on that date.
+    """
+    count = occurrences_through(frequency, start_date, day, occurrence)
+    before = occurrences_through(
+        frequency, start_date, day, occurrence - timedelta(days=1)
+    )
+    return count - 1 if count > before else None
+
+
+def occurrence_at(
+    frequency: str, start_date: date, day: Optional[int], index: int
+) -> date:
+    """The rule's occurrence at `index`; the inverse of occurrence_index."""
+    first = first_occurrence(frequency, start_date, day)
+    if frequency == DAILY:
+        return first + timedelta(days=index)
+    if frequency == WEEKLY:
+        return first + timedelta(days=7 * index)
+
+    day = normalized_day(frequency, start_date, day)
+    if frequency == MONTHLY:
+        year, month = divmod(first.year * 12 + first.month - 1 + index, 12)
+        return month_occurrence(year, month + 1, day)
+    return year_occurrence(first.year + index, day)
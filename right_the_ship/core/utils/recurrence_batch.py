@@ -0,0 +1,136 @@
+import calendar
+from datetime import date
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from right_the_ship.core.models.Task import RecurringTask
+from right_the_ship.core.utils.recurrence import (
+    DAILY,
+    WEEKLY,
+    MONTHLY,
+    YEARLY,
+    expand_occurrences,
+)
+
+FREQUENCY_CODES = {DAILY: 0, WEEKLY: 1, MONTHLY: 2, YEARLY: 3}
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Open-ended rules get a far-future end so the range mask needs no NaT checks
+OPEN_END_ORDINAL = date.max.toordinal()
+
+RULE_FIELDS = ("task_id", "task__user_id", "frequency", "start_date", "end_date", "day")
+
+RuleRow = Tuple[int, int, str, date, Optional[date], Optional[int]]
+
+
+class RuleArrays(NamedTuple):
+    task_ids: np.ndarray
+    user_ids: np.ndarray
+    frequency: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    day: np.ndarray
+
+    def __len__(self):
+        return len(self.task_ids)
+
+
+def build_rule_arrays(rows: Iterable[RuleRow]) -> RuleArrays:
+    """
+    Converts (task_id, user_id, frequency, start_date, end_date, day) rows into
+    columnar arrays, normalizing `day` the same way `normalized_day` does so
+    matching a date is a handful of vectorized comparisons.
+    """
+    task_ids, user_ids, frequencies, starts, ends, days = [], [], [], [], [], []
+    for task_id, user_id, frequency, start_date, end_date, day in rows:
+        task_ids.append(task_id)
+        user_ids.append(user_id)
+        frequencies.append(FREQUENCY_CODES.get(frequency, -1))
+        # Ordinals avoid numpy's slow per-object date conversion
+        starts.append(start_date.toordinal())
+        ends.append(end_date.toordinal() if end_date else OPEN_END_ORDINAL)
+        days.append(-1 if day is None else day)
+
+    start = (np.array(starts, dtype=np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+    end = (np.array(ends, dtype=np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+    frequency = np.array(frequencies, dtype=np.int8)
+    raw_day = np.array(days, dtype=np.int16)
+
+    start_days = start.astype(np.int64)
+    # 1970-01-01 was a Thursday, which is weekday 3 counting from Monday
+    start_weekday = (start_days + 3) % 7
+    start_month_day = (start - start.astype("datetime64[M]")).astype(np.int64) + 1
+    start_year_day = (start - start.astype("datetime64[Y]")).astype(np.int64) + 1
+
+    day = np.zeros(len(raw_day), dtype=np.int16)
+    weekly = frequency == FREQUENCY_CODES[WEEKLY]
+    monthly = frequency == FREQUENCY_CODES[MONTHLY]
+    yearly = frequency == FREQUENCY_CODES[YEARLY]
+    has_day = raw_day > 0
+    day[weekly] = np.where(raw_day >= 0, (raw_day - 1) % 7, start_weekday)[weekly]
+    day[monthly] = np.where(has_day, raw_day, start_month_day)[monthly]
+    day[yearly] = np.where(has_day, raw_day, start_year_day)[yearly]
+
+    return RuleArrays(
+        task_ids=np.array(task_ids, dtype=np.int64),
+        user_ids=np.array(user_ids, dtype=np.int64),
+        frequency=frequency,
+        start=start,
+        end=end,
+        day=day,
+    )
+
+
+def load_rule_arrays(chunk_size: int = 10_000) -> RuleArrays:
+    rows = (
+        RecurringTask.objects.filter(task__is_deleted=False)
+        .values_list(*RULE_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+    return build_rule_arrays(rows)
+
+
+def due_mask(rules: RuleArrays, target: date) -> np.ndarray:
+    """Boolean mask of the rules that have an occurrence on `target`."""
+    when = np.datetime64(target, "D")
+    month_length = calendar.monthrange(target.year, target.month)[1]
+    year_length = 366 if calendar.isleap(target.year) else 365
+    year_day = target.timetuple().tm_yday
+
+    active = (rules.start <= when) & (when <= rules.end)
+    matches = (
+        (rules.frequency == FREQUENCY_CODES[DAILY])
+        | (
+            (rules.frequency == FREQUENCY_CODES[WEEKLY])
+            & (rules.day == target.weekday())
+        )
+        | (
+            (rules.frequency == FREQUENCY_CODES[MONTHLY])
+            & (np.minimum(rules.day, month_length) == target.day)
+        )
+        | (
+            (rules.frequency == FREQUENCY_CODES[YEARLY])
+            & (np.minimum(rules.day, year_length) == year_day)
+        )
+    )
+    return active & matches
+
+
+def due_on(rules: RuleArrays, target: date) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (task_ids, user_ids) of every occurrence falling on `target`."""
+    mask = due_mask(rules, target)
+    return rules.task_ids[mask], rules.user_ids[mask]
+
+
+def due_on_per_row(rows: Iterable[RuleRow], target: date) -> list:
+    """Reference implementation that expands each rule on its own."""
+    return [
+        (task_id, user_id)
+        for task_id, user_id, frequency, start_date, end_date, day in rows
+        if next(
+            expand_occurrences(frequency, start_date, end_date, day, target, target),
+            None,
+        )
+    ]
@@ -0,0 +1,203 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from ninja.renderers import JSONRenderer
+
+from right_the_ship.core.utils.task_cache import task_cache_stats
+
+# Upper bounds, in seconds, of the request latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Statements kept per request for the slow request log
+MAX_LOGGED_STATEMENTS = 50
+
+
+class RequestStats:
+    """What one request spent, filled in while it runs."""
+
+    __slots__ = ("queries", "db_seconds", "serialization_seconds", "statements")
+
+    def __init__(self, capture_sql: bool):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.statements: Optional[List[Tuple[float, str]]] = [] if capture_sql else None
+
+
+class RouteMetrics:
+    __slots__ = (
+        "buckets",
+        "count",
+        "seconds",
+        "queries",
+        "db_seconds",
+        "serialization_seconds",
+        "statuses",
+    )
+
+    def __init__(self):
+        # One extra bucket for requests slower than the last bound (+Inf)
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.statuses = {}
+
+    def copy(self) -> "RouteMetrics":
+        metrics = RouteMetrics()
+        for attr in self.__slots__:
+            setattr(metrics, attr, getattr(self, attr))
+        metrics.buckets = self.buckets[:]
+        metrics.statuses = dict(self.statuses)
+        return metrics
+
+
+# Stats of the request being handled. Context variables follow the request
+# into sync_to_async threads, so async views are measured too.
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+_routes = {}
+_routes_lock = threading.Lock()
+
+
+def start_request(capture_sql: bool = False):
+    """Starts collecting stats; pass the token to finish_request."""
+    stats = RequestStats(capture_sql)
+    return stats, _current.set(stats)
+
+
+def finish_request(token):
+    _current.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper adding each query to the current request."""
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if (
+            stats.statements is not None
+            and len(stats.statements) < MAX_LOGGED_STATEMENTS
+        ):
+            stats.statements.append((elapsed, sql))
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created receiver that wraps every connection with record_query."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def record_request(
+    method: str, route: str, status: int, seconds: float, stats: RequestStats
+):
+    bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+    with _routes_lock:
+        metrics = _routes.get((method, route))
+        if metrics is None:
+            metrics = _routes[(method, route)] = RouteMetrics()
+
+        metrics.buckets[bucket] += 1
+        metrics.count += 1
+        metrics.seconds += seconds
+        metrics.queries += stats.queries
+        metrics.db_seconds += stats.db_seconds
+        metrics.serialization_seconds += stats.serialization_seconds
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+
+
+def record_serialization(seconds: float):
+    """Adds response encoding time to the current request, if one is measured."""
+    stats = _current.get()
+    if stats is not None:
+        stats.serialization_seconds += seconds
+
+
+def reset_request_metrics():
+    with _routes_lock:
+        _routes.clear()
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """Ninja's JSON renderer, adding its time to the current request's stats."""
+
+    def render(self, request, data, *, response_status):
+        started = time.perf_counter()
+        try:
+            return super().render(request, data, response_status=response_status)
+        finally:
+            record_serialization(time.perf_counter() - started)
+
+
+def _labels(**labels) -> str:
+    escaped = (
+        (name, str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _family(lines: list, name: str, kind: str, help_text: str):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_prometheus() -> str:
+    """All request metrics and task cache counters in Prometheus text format."""
+    with _routes_lock:
+        routes = [(key, metrics.copy()) for key, metrics in _routes.items()]
+    routes.sort(key=lambda route: route[0])
+
+    prefix = settings.REQUEST_METRICS_PREFIX
+    lines = []
+
+    name = f"{prefix}_request_duration_seconds"
+    _family(lines, name, "histogram", "Request latency by route.")
+    for (method, route), metrics in routes:
+        cumulative = 0
+        for bound, observed in zip(LATENCY_BUCKETS + ("+Inf",), metrics.buckets):
+            cumulative += observed
+            labels = _labels(method=method, route=route, le=bound)
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _labels(method=method, route=route)
+        lines.append(f"{name}_sum{labels} {metrics.seconds}")
+        lines.append(f"{name}_count{labels} {metrics.count}")
+
+    name = f"{prefix}_requests_total"
+    _family(lines, name, "counter", "Requests by route and status code.")
+    for (method, route), metrics in routes:
+        for status, count in sorted(metrics.statuses.items()):
+            labels = _labels(method=method, route=route, status=status)
+            lines.append(f"{name}{labels} {count}")
+
+    for attr, help_text in (
+        ("queries", "SQL queries issued by route."),
+        ("db_seconds", "Time spent in SQL queries by route."),
+        ("serialization_seconds", "Time spent rendering JSON by route."),
+    ):
+        name = f"{prefix}_request_{attr}_total"
+        _family(lines, name, "counter", help_text)
+        for (method, route), metrics in routes:
+            labels = _labels(method=method, route=route)
+            lines.append(f"{name}{labels} {getattr(metrics, attr)}")
+
+    for stat, value in sorted(task_cache_stats().items()):
+        name = f"{prefix}_task_cache_{stat}_total"
+        _family(lines, name, "counter", f"Task detail cache {stat}.")
+        lines.append(f"{name} {value}")
+
+    return "\n".join(lines) + "\n"
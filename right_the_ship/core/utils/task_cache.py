@@ -0,0 +1,70 @@
+import threading
+from datetime import datetime
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(stat: str, amount: int = 1):
+    with _stats_lock:
+        _stats[stat] += amount
+
+
+def task_cache():
+    """The cache backend configured under settings.TASK_CACHE_ALIAS."""
+    return caches[settings.TASK_CACHE_ALIAS]
+
+
+def cache_key(task_id: int) -> str:
+    return f"task-detail:{task_id}"
+
+
+def get_cached_task_detail(task_id: int, updated_at: datetime) -> Optional[dict]:
+    """
+    Returns the cached detail of a task if it was cached for this exact
+    `updated_at`. Entries for older versions are treated as misses, so writes
+    that skip invalidation can never serve stale data.
+    """
+    return current_detail(task_cache().get(cache_key(task_id)), updated_at)
+
+
+async def aget_cached_task_detail(task_id: int, updated_at: datetime) -> Optional[dict]:
+    return current_detail(await task_cache().aget(cache_key(task_id)), updated_at)
+
+
+def current_detail(entry, updated_at: datetime) -> Optional[dict]:
+    if entry is not None and entry[0] == updated_at:
+        _count("hits")
+        return entry[1]
+
+    _count("misses")
+    return None
+
+
+def cache_task_detail(task_id: int, updated_at: datetime, detail: dict):
+    task_cache().set(cache_key(task_id), (updated_at, detail))
+
+
+async def acache_task_detail(task_id: int, updated_at: datetime, detail: dict):
+    await task_cache().aset(cache_key(task_id), (updated_at, detail))
+
+
+def invalidate_task_details(*task_ids: int):
+    if task_ids:
+        task_cache().delete_many([cache_key(task_id) for task_id in task_ids])
+        _count("invalidations", len(task_ids))
+
+
+async def ainvalidate_task_details(*task_ids: int):
+    if task_ids:
+        await task_cache().adelete_many([cache_key(task_id) for task_id in task_ids])
+        _count("invalidations", len(task_ids))
+
+
+def task_cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
@@ -0,0 +1,37 @@
+"""
+Streams a user's tasks as NDJSON, one TaskDetailSchema-shaped object per
+line. Rows come from `values()` over a chunked cursor (server-side on
+PostgreSQL) with the recurring task LEFT JOINed in, so memory stays flat no
+matter how many tasks the user has.
+"""
+
+from typing import Iterator
+
+from right_the_ship.core.models.Task import Task
+from right_the_ship.core.schemas.task import TASK_DETAIL_FIELDS, task_detail_from_row
+from right_the_ship.core.utils.fast_json import dumps
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def export_task_rows(user_id: int, chunk_size: int = EXPORT_CHUNK_SIZE):
+    return (
+        Task.objects.filter(user_id=user_id)
+        .order_by("id")
+        .values(*TASK_DETAIL_FIELDS)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def export_tasks_ndjson(
+    user_id: int, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yields one bytestring per chunk of rows rather than one per task."""
+    lines = []
+    for row in export_task_rows(user_id, chunk_size):
+        lines.append(dumps(task_detail_from_row(row)))
+        if len(lines) == chunk_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
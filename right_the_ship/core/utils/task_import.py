@@ -0,0 +1,139 @@
+"""
+Imports tasks from CSV or NDJSON files. Rows are parsed one at a time from
+the file, validated against TaskInSchema and RecurringTask.clean, and
+inserted `batch_size` at a time through bulk_tasks.create_tasks, each batch
+in its own transaction. Rows that fail validation are skipped and reported
+by line number; batches inserted before a fatal error stay imported.
+"""
+
+import csv
+import io
+import json
+from typing import IO, Iterator, List, Optional, Tuple
+
+import pydantic
+from django.core.exceptions import ValidationError
+
+from right_the_ship.core.models import CustomUser
+from right_the_ship.core.schemas.task import TaskInSchema
+from right_the_ship.core.utils.bulk_tasks import create_tasks, prepare_new_task
+
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_BATCH_SIZE = 5000
+# The report keeps counting past this, but only lists the first errors
+MAX_REPORTED_ERRORS = 1000
+
+ImportRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def guess_import_format(filename: str) -> Optional[str]:
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension in ("ndjson", "jsonl"):
+        return "ndjson"
+    if extension == "csv":
+        return "csv"
+    return None
+
+
+def read_csv_rows(stream: IO[str]) -> Iterator[ImportRow]:
+    """Yields (line, row, error). Empty cells fall back to schema defaults."""
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {
+            key: value for key, value in row.items() if key and value != ""
+        }, None
+
+
+def read_ndjson_rows(stream: IO[str]) -> Iterator[ImportRow]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON."
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Expected a JSON object."
+            continue
+        yield line_number, row, None
+
+
+def read_import_rows(stream: IO[bytes], import_format: str) -> Iterator[ImportRow]:
+    # utf-8-sig drops the byte order mark spreadsheet exports start with
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if import_format == "csv":
+        return read_csv_rows(text)
+    return read_ndjson_rows(text)
+
+
+def schema_error_message(error: pydantic.ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+class TaskImport:
+    """Accumulates the import report while rows stream through."""
+
+    def __init__(self, user: CustomUser, batch_size: int = IMPORT_BATCH_SIZE):
+        self.users = {user.id: user}
+        self.user_id = user.id
+        self.batch_size = batch_size
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.batch = []
+
+    def fail(self, line: int, error: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+    def add(self, line: int, row: dict):
+        # Every row belongs to the importing user, whatever the file says
+        row["user_id"] = self.user_id
+        try:
+            item = TaskInSchema(**row).dict()
+        except pydantic.ValidationError as e:
+            self.fail(line, schema_error_message(e))
+            return
+        try:
+            self.batch.append(prepare_new_task(item, self.users))
+        except ValidationError as e:
+            self.fail(line, "; ".join(e.messages))
+            return
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            create_tasks(self.batch)
+            self.imported += len(self.batch)
+            self.batch = []
+
+    def run(self, rows: Iterator[ImportRow]) -> dict:
+        for line, row, error in rows:
+            if error:
+                self.fail(line, error)
+            else:
+                self.add(line, row)
+        self.flush()
+        return self.report()
+
+    def report(self) -> dict:
+        return {"imported": self.imported, "failed": self.failed, "errors": self.errors}
+
+
+def import_tasks(
+    user: CustomUser,
+    stream: IO[bytes],
+    import_format: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> dict:
+    """
+    Imports every valid row of `stream` for `user` and returns the report.
+    Raises UnicodeDecodeError when the file is not UTF-8.
+    """
+    return TaskImport(user, batch_size).run(read_import_rows(stream, import_format))
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "right_the_ship.core.middleware.RequestMetrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -73,14 +75,81 @@ WSGI_APPLICATION = "right_the_ship.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+#
+# DB_ENGINE=postgres switches to PostgreSQL (needs psycopg). Connections are
+# kept open for DB_CONN_MAX_AGE seconds and health-checked before reuse, so
+# requests don't pay for a new connection each time. Django 5.0 has no
+# built-in pool; for many processes put PgBouncer in front and set
+# DB_DISABLE_SERVER_SIDE_CURSORS=1 if it runs in transaction mode.
+#
+# SQLite (the default) gets the SQLITE_PRAGMAS below on every new connection.
+
+DB_ENGINE = os.environ.get("DB_ENGINE", "sqlite")
+
+if DB_ENGINE == "postgres":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get("DB_NAME", "right_the_ship"),
+            "USER": os.environ.get("DB_USER", "postgres"),
+            "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+            "HOST": os.environ.get("DB_HOST", "localhost"),
+            "PORT": os.environ.get("DB_PORT", "5432"),
+            "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 600)),
+            "CONN_HEALTH_CHECKS": True,
+            "DISABLE_SERVER_SIDE_CURSORS": bool(
+                int(os.environ.get("DB_DISABLE_SERVER_SIDE_CURSORS", 0))
+            ),
+            "OPTIONS": {
+                "connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", 5)),
+            },
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get("DB_NAME", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 600)),
+            "CONN_HEALTH_CHECKS": True,
+            # Seconds a writer waits on a locked database before failing
+            "OPTIONS": {"timeout": int(os.environ.get("DB_BUSY_TIMEOUT", 20))},
+        }
+    }
+
+# Applied by core/utils/sqlite_pragmas.py. WAL lets reads run alongside a
+# write, and synchronous=normal is safe under WAL (a power loss can only drop
+# the last commits, never corrupt the file).
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    "cache_size": -int(os.environ.get("SQLITE_CACHE_KB", 20000)),
+    "temp_store": "memory",
+}
+
 
-DATABASES = {
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+#
+# Task details are cached under their own alias so the backend can be swapped
+# (e.g. for Redis) independently. LocMemCache evicts least recently used
+# entries once MAX_ENTRIES is reached and expires them after TIMEOUT seconds.
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "tasks": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "task-details",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
 }
 
+TASK_CACHE_ALIAS = "tasks"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -100,6 +169,32 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing. PASSWORD_HASHER picks the hasher for new passwords
+# ("argon2" needs argon2-cffi); the rest stay listed so older hashes verify.
+# Hashing runs on a bounded pool of PASSWORD_HASH_WORKERS threads (or
+# processes), with up to PASSWORD_HASH_QUEUE more waiting; beyond that
+# requests that hash get a 429.
+
+PASSWORD_HASHER_CLASSES = {
+    "pbkdf2": "right_the_ship.core.utils.hashers.PBKDF2PasswordHasher",
+    "scrypt": "right_the_ship.core.utils.hashers.ScryptPasswordHasher",
+    "argon2": "right_the_ship.core.utils.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHER = os.environ.get("PASSWORD_HASHER", "pbkdf2")
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+
+PBKDF2_ITERATIONS = int(os.environ.get("PBKDF2_ITERATIONS", 720000))
+SCRYPT_WORK_FACTOR = int(os.environ.get("SCRYPT_WORK_FACTOR", 2**14))
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", 102400))
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", 8))
+
+PASSWORD_HASH_EXECUTOR = os.environ.get("PASSWORD_HASH_EXECUTOR", "thread")
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", os.cpu_count()))
+PASSWORD_HASH_QUEUE = int(os.environ.get("PASSWORD_HASH_QUEUE", 16))
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -122,3 +217,71 @@ STATIC_URL = "static/"
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Recurring task occurrences are materialized this many days ahead. Run
+# `python manage.py refresh_occurrences` daily to roll the window forward.
+
+OCCURRENCE_HORIZON_DAYS = 90
+
+
+# Soft deletes. `python manage.py purge_tombstones` hard-deletes tombstones
+# older than TOMBSTONE_RETENTION_DAYS, so sync tokens older than that are
+# rejected and the client syncs again from scratch.
+
+TOMBSTONE_RETENTION_DAYS = int(os.environ.get("TOMBSTONE_RETENTION_DAYS", 30))
+
+
+# Reminders. `python manage.py run_reminders` fires one REMINDER_LEAD_MINUTES
+# before each open task's due date and each upcoming recurring occurrence,
+# keeping the next REMINDER_HORIZON_HOURS in memory and polling for changed
+# tasks every REMINDER_POLL_SECONDS. REMINDER_BACKEND names a backend below
+# or is a dotted path to a ReminderBackend subclass.
+
+REMINDER_BACKEND_CLASSES = {
+    "log": "right_the_ship.core.reminders.backends.LogBackend",
+    "file": "right_the_ship.core.reminders.backends.FileBackend",
+}
+REMINDER_BACKEND = os.environ.get("REMINDER_BACKEND", "log")
+REMINDER_FILE = os.environ.get("REMINDER_FILE", BASE_DIR / "reminders.ndjson")
+REMINDER_LEAD_MINUTES = int(os.environ.get("REMINDER_LEAD_MINUTES", 0))
+REMINDER_HORIZON_HOURS = int(os.environ.get("REMINDER_HORIZON_HOURS", 24))
+REMINDER_POLL_SECONDS = int(os.environ.get("REMINDER_POLL_SECONDS", 30))
+
+
+# Rewards. Completing a task on or before its due date appends
+# REWARD_ON_TIME_POINTS to the user's reward ledger; REWARD_ACHIEVEMENTS maps
+# each achievement to the number of on-time completions that unlocks it.
+
+REWARD_ON_TIME_POINTS = int(os.environ.get("REWARD_ON_TIME_POINTS", 10))
+REWARD_ACHIEVEMENTS = {
+    "first_on_time": 1,
+    "ten_on_time": 10,
+    "hundred_on_time": 100,
+    "thousand_on_time": 1000,
+}
+
+
+# Leaderboards. Each process ranks users in memory and pulls in reward
+# summaries changed by other processes every LEADERBOARD_SYNC_SECONDS.
+
+LEADERBOARD_SYNC_SECONDS = int(os.environ.get("LEADERBOARD_SYNC_SECONDS", 5))
+
+
+# Request metrics, served in Prometheus format at /api/metrics/ to staff
+# users. Requests slower than REQUEST_METRICS_SLOW_SECONDS are logged with
+# their SQL; set it to "off" to stop capturing statements.
+
+REQUEST_METRICS_PREFIX = "right_the_ship"
+_slow_seconds = os.environ.get("REQUEST_METRICS_SLOW_SECONDS", "1.0")
+REQUEST_METRICS_SLOW_SECONDS = None if _slow_seconds == "off" else float(_slow_seconds)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "right_the_ship.requests": {"handlers": ["console"], "level": "WARNING"},
+        "right_the_ship.reminders": {"handlers": ["console"], "level": "INFO"},
+    },
+}
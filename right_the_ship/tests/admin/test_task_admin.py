@@ -0,0 +1,129 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from right_the_ship.core.admin_models.paginator import (
+    EXACT_COUNT_THRESHOLD,
+    EstimatedCountPaginator,
+)
+from right_the_ship.core.models import (
+    CustomUser,
+    RecurringTask,
+    RewardLedgerEntry,
+    Task,
+    TaskOccurrence,
+    UserRewardSummary,
+)
+
+CHANGELIST = "/admin/core/task/"
+
+
+class TestTaskAdmin(TestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.force_login(admin)
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        other_user = CustomUser.objects.create(
+            username="otheruser", password="password", email="other@example.com"
+        )
+        self.tasks = [
+            Task.objects.create(user=self.user, title=f"Water plant {i}")
+            for i in range(3)
+        ]
+        Task.objects.create(user=other_user, title="Water the lawn")
+
+    def test_changelist_filters_by_user_id_and_title_prefix(self):
+        # Session, admin user, count and the page with its users joined in
+        with self.assertNumQueries(4):
+            response = self.client.get(f"{CHANGELIST}?user_id={self.user.id}&q=wat")
+
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == 3
+        assert b'name="user_id"' in response.content
+
+    def test_invalid_user_id(self):
+        response = self.client.get(f"{CHANGELIST}?user_id=abc")
+
+        assert response.status_code == 302
+        assert response["Location"].endswith("?e=1")
+
+    def test_mark_complete(self):
+        response = self.client.post(
+            CHANGELIST,
+            {"action": "mark_complete", "_selected_action": [self.tasks[0].id]},
+        )
+
+        assert response.status_code == 302
+        assert list(Task.objects.filter(completed=True)) == [self.tasks[0]]
+
+    def test_mark_complete_rewards_tasks_completed_on_time(self):
+        Task.objects.filter(id=self.tasks[0].id).update(due_date=timezone.now())
+
+        self.client.post(
+            CHANGELIST,
+            {
+                "action": "mark_complete",
+                "_selected_action": [task.id for task in self.tasks],
+            },
+        )
+
+        summary = UserRewardSummary.objects.get(user=self.user)
+        assert summary.on_time_completions == 1
+        assert RewardLedgerEntry.objects.get().task_id == self.tasks[0].id
+
+    def test_soft_delete_clears_upcoming_occurrences(self):
+        RecurringTask.objects.create(
+            task=self.tasks[0], frequency=RecurringTask.DAILY, start_date=date.today()
+        )
+        before = self.tasks[0].updated_at
+
+        self.client.post(
+            CHANGELIST,
+            {
+                "action": "soft_delete",
+                "_selected_action": [self.tasks[0].id, self.tasks[1].id],
+            },
+        )
+
+        deleted = Task.all_objects.get(id=self.tasks[0].id)
+        assert deleted.is_deleted
+        assert deleted.updated_at > before
+        assert Task.objects.filter(user=self.user).count() == 1
+        assert not TaskOccurrence.objects.filter(task=self.tasks[0]).exists()
+
+    def test_delete_selected_is_not_offered(self):
+        response = self.client.get(CHANGELIST)
+
+        choices = response.context["action_form"].fields["action"].choices
+        assert [name for name, _ in choices] == ["", "mark_complete", "soft_delete"]
+
+
+class TestEstimatedCountPaginator(TestCase):
+    def paginator(self):
+        return EstimatedCountPaginator(Task.objects.order_by("id"), 100)
+
+    def test_counts_exactly_without_an_estimate(self):
+        with patch(
+            "right_the_ship.core.admin_models.paginator.estimated_count",
+            return_value=None,
+        ):
+            assert self.paginator().count == 0
+
+    def test_uses_large_estimates(self):
+        with patch(
+            "right_the_ship.core.admin_models.paginator.estimated_count",
+            return_value=EXACT_COUNT_THRESHOLD * 100,
+        ), self.assertNumQueries(0):
+            assert self.paginator().count == EXACT_COUNT_THRESHOLD * 100
+
+    def test_counts_small_results_exactly(self):
+        with patch(
+            "right_the_ship.core.admin_models.paginator.estimated_count",
+            return_value=5,
+        ), self.assertNumQueries(1):
+            assert self.paginator().count == 0
@@ -0,0 +1,139 @@
+import json
+from datetime import date, timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from right_the_ship.core.api.sync import sync_tasks
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.core.utils.keyset_cursor import encode_sync_token
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestSync(QueryBudgetMixin, TestCase):
+    # Changed tasks, then tasks moved to other users since the token
+    query_budgets = {"sync_tasks": 2}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+        self.tasks = [
+            Task.objects.create(user=self.user, title=f"Task {i}") for i in range(3)
+        ]
+        self.other_user = CustomUser.objects.create(
+            username="otheruser", password="password", email="other@example.com"
+        )
+        Task.objects.create(user=self.other_user, title="Someone else's task")
+
+    def sync(self, **params):
+        return json.loads(sync_tasks(None, user_id=self.user.id, **params).content)
+
+    def titles(self, response):
+        return [detail["task"]["title"] for detail in response["tasks"]]
+
+    def test_first_sync_returns_every_live_task(self):
+        Task.objects.filter(id=self.tasks[0].id).update(is_deleted=True)
+
+        response = self.sync()
+
+        assert self.titles(response) == ["Task 1", "Task 2"]
+        assert response["deleted"] == []
+        assert response["has_more"] is False
+
+    def test_sync_only_returns_changes_since_token(self):
+        token = self.sync()["next_token"]
+
+        self.tasks[1].title = "Renamed"
+        self.tasks[1].save()
+
+        response = self.sync(since=token)
+
+        assert self.titles(response) == ["Renamed"]
+
+        response = self.sync(since=response["next_token"])
+
+        assert response["tasks"] == []
+
+    def test_recurrence_changes_and_deletions_are_synced(self):
+        token = self.sync()["next_token"]
+
+        RecurringTask.objects.create(
+            task=self.tasks[0],
+            frequency=RecurringTask.DAILY,
+            start_date=date(2021, 1, 1),
+        )
+        self.tasks[2].is_deleted = True
+        self.tasks[2].save()
+
+        response = self.sync(since=token)
+
+        assert self.titles(response) == ["Task 0"]
+        assert response["tasks"][0]["is_recurring"] is True
+        assert response["deleted"] == [self.tasks[2].id]
+
+    def test_reassigned_tasks_are_removed_from_the_previous_owner(self):
+        token = self.sync()["next_token"]
+
+        self.tasks[0].user = self.other_user
+        self.tasks[0].save()
+        self.tasks[1].title = "Renamed"
+        self.tasks[1].save()
+
+        response = self.sync(since=token)
+
+        assert self.titles(response) == ["Renamed"]
+        assert response["deleted"] == [self.tasks[0].id]
+        assert self.sync(since=response["next_token"])["deleted"] == []
+
+        # Moving it back shows it again
+        self.tasks[0].user = self.user
+        self.tasks[0].save()
+
+        response = self.sync(since=response["next_token"])
+
+        assert self.titles(response) == ["Task 0"]
+        assert response["deleted"] == []
+
+    def test_paging_through_changes(self):
+        first = self.sync(limit=2)
+        second = self.sync(since=first["next_token"], limit=2)
+
+        assert first["has_more"] is True
+        assert second["has_more"] is False
+        assert self.titles(first) + self.titles(second) == [
+            "Task 0",
+            "Task 1",
+            "Task 2",
+        ]
+
+    @override_settings(TOMBSTONE_RETENTION_DAYS=30)
+    def test_tokens_issued_before_the_retention_period_are_refused(self):
+        # Tombstones after this token may already have been purged
+        issued = timezone.now() - timedelta(days=31)
+        expired = encode_sync_token(issued, self.tasks[0].id, issued)
+
+        with self.assertRaises(HttpError) as raised:
+            self.sync(since=expired)
+
+        assert raised.exception.status_code == 410
+
+    @override_settings(TOMBSTONE_RETENTION_DAYS=30)
+    def test_tokens_of_users_without_recent_changes_stay_valid(self):
+        Task.all_objects.filter(user=self.user).update(
+            updated_at=timezone.now() - timedelta(days=40)
+        )
+
+        token = self.sync()["next_token"]
+        response = self.sync(since=token)
+
+        assert response["tasks"] == []
+        assert self.sync(since=response["next_token"])["tasks"] == []
+
+    def test_empty_first_sync_returns_a_token(self):
+        Task.objects.filter(user=self.user).delete()
+
+        token = self.sync()["next_token"]
+        Task.objects.create(user=self.user, title="First")
+
+        assert token is not None
+        assert self.titles(self.sync(since=token)) == ["First"]
@@ -0,0 +1,128 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from right_the_ship.core.api.task import (
+    bulk_create_tasks,
+    bulk_update_tasks,
+    bulk_delete_tasks,
+)
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.core.schemas import (
+    TaskInSchema,
+    TaskBulkUpdateSchema,
+    TaskBulkDeleteSchema,
+)
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestBulkTasks(QueryBudgetMixin, TestCase):
+    query_budgets = {
+        "bulk_create_tasks": 9,
+        "bulk_update_tasks": 10,
+        "bulk_delete_tasks": 5,
+    }
+
+    single_task = {
+        "title": "Single Task",
+        "description": "Single Task Description",
+        "due_date": "2021-01-01",
+        "completed": False,
+    }
+
+    recurring_task = {
+        "title": "Recurring Task",
+        "description": "Recurring Task Description",
+        "completed": False,
+        "frequency": "daily",
+        "start_date": "2021-01-01",
+        "end_date": "2021-01-31",
+    }
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+
+    def create(self, *items):
+        return bulk_create_tasks(
+            None,
+            [TaskInSchema(**{"user_id": self.user.id, **item}) for item in items],
+        )
+
+    def test_bulk_create_reports_each_item(self):
+        results = self.create(
+            self.single_task,
+            self.recurring_task,
+            {**self.recurring_task, "frequency": "invalid"},
+            {**self.single_task, "user_id": 999},
+        )
+
+        assert [result["success"] for result in results] == [True, True, False, False]
+        assert results[0]["task"]["is_recurring"] is False
+        assert results[1]["task"]["frequency"] == "daily"
+        assert results[2]["error"] == "Invalid frequency"
+        assert results[3]["error"] == "User not found."
+        assert Task.objects.count() == 2
+        assert RecurringTask.objects.get().task_id == results[1]["id"]
+
+    def test_bulk_create_yearly_task_without_a_day(self):
+        yearly = {**self.recurring_task, "frequency": "yearly"}
+
+        results = self.create(
+            self.single_task,
+            yearly,
+            {**yearly, "frequency": "invalid"},
+            self.recurring_task,
+        )
+
+        assert [result["success"] for result in results] == [True, True, False, True]
+        assert results[2]["error"] == "Invalid frequency"
+        assert RecurringTask.objects.get(task_id=results[1]["id"]).day is None
+        assert Task.objects.count() == 3
+
+    def test_bulk_create_query_count_does_not_grow_with_items(self):
+        with CaptureQueriesContext(connection) as few:
+            self.create(*[self.single_task, self.recurring_task] * 5)
+
+        with CaptureQueriesContext(connection) as many:
+            self.create(*[self.single_task, self.recurring_task] * 50)
+
+        assert len(few) == len(many)
+
+    def test_bulk_update(self):
+        single_id, recurring_id = (
+            result["id"]
+            for result in self.create(self.single_task, self.recurring_task)
+        )
+
+        results = bulk_update_tasks(
+            None,
+            [
+                TaskBulkUpdateSchema(
+                    id=single_id,
+                    user_id=self.user.id,
+                    **{**self.single_task, "completed": True},
+                ),
+                TaskBulkUpdateSchema(
+                    id=recurring_id,
+                    user_id=self.user.id,
+                    **{**self.recurring_task, "frequency": "weekly", "day": 3},
+                ),
+                TaskBulkUpdateSchema(id=999, user_id=self.user.id, **self.single_task),
+            ],
+        )
+
+        assert [result["success"] for result in results] == [True, True, False]
+        assert results[2]["error"] == "Task not found."
+        assert Task.objects.get(id=single_id).completed is True
+        recurring_task = RecurringTask.objects.get(task_id=recurring_id)
+        assert recurring_task.frequency == "weekly"
+        assert recurring_task.day == 3
+
+    def test_bulk_delete(self):
+        task_id = self.create(self.recurring_task)[0]["id"]
+
+        results = bulk_delete_tasks(None, TaskBulkDeleteSchema(ids=[task_id, 999]))
+
+        assert [result["success"] for result in results] == [True, False]
+        assert not Task.objects.filter(id=task_id).exists()
+        assert Task.all_objects.get(id=task_id).is_deleted is True
@@ -6,9 +6,12 @@ from django.test import TestCase
 from right_the_ship.core.api.task import create_task
 from right_the_ship.core.models import CustomUser, Task, RecurringTask
 from right_the_ship.core.schemas import TaskInSchema
+from right_the_ship.tests.query_budget import QueryBudgetMixin
 
 
-class TestCreateTask(TestCase):
+class TestCreateTask(QueryBudgetMixin, TestCase):
+    query_budgets = {"create_task": 8}
+
     single_task = {
         "title": "Single Task",
         "description": "Single Task Description",
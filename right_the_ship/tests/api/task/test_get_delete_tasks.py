@@ -6,9 +6,12 @@ from django.test import TestCase
 from right_the_ship.core.api.task import create_task, get_task, delete_task
 from right_the_ship.core.models import CustomUser, Task, RecurringTask
 from right_the_ship.core.schemas import TaskInSchema
+from right_the_ship.tests.query_budget import QueryBudgetMixin
 
 
-class TestGetDeleteTask(TestCase):
+class TestGetDeleteTask(QueryBudgetMixin, TestCase):
+    query_budgets = {"create_task": 7, "get_task": 2, "delete_task": 5}
+
     single_task = {
         "title": "Single Task",
         "description": "Single Task Description",
@@ -56,7 +59,7 @@ class TestGetDeleteTask(TestCase):
         task_id = response.dict()["task"]["id"]
 
         response = get_task(None, task_id)
-        response_data = response.dict()
+        response_data = json.loads(response.content)
 
         assert response_data["task"]["title"] == self.single_task["title"]
         assert response_data["task"]["description"] == self.single_task["description"]
@@ -73,7 +76,7 @@ class TestGetDeleteTask(TestCase):
         task_id = response.dict()["task"]["id"]
 
         response = get_task(None, task_id)
-        response_data = response.dict()
+        response_data = json.loads(response.content)
 
         assert response_data["task"]["title"] == self.recurring_task["title"]
         assert (
@@ -96,6 +99,7 @@ class TestGetDeleteTask(TestCase):
         assert response_data["success"] is True
         with self.assertRaises(Task.DoesNotExist):
             Task.objects.get(id=task_id)
+        assert Task.all_objects.get(id=task_id).is_deleted is True
 
     def test_delete_recurring_task(self):
         self.recurring_task["user_id"] = self.user.id
@@ -108,3 +112,4 @@ class TestGetDeleteTask(TestCase):
         assert response_data["success"] is True
         with self.assertRaises(Task.DoesNotExist):
             Task.objects.get(id=task_id)
+        assert Task.all_objects.get(id=task_id).is_deleted is True
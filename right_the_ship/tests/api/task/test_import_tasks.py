@@ -0,0 +1,112 @@
+import json
+from datetime import date
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser, RecurringTask, Task
+from right_the_ship.core.utils.task_import import import_tasks
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+# Spreadsheet exports often start with a byte order mark
+CSV_IMPORT = """\ufefftitle,description,due_date,completed,frequency,start_date,end_date,day
+Water the plants,,2024-08-10,false,,,,
+Leg day,Lift them weights.,,,weekly,2024-08-01,2024-12-31,1
+No,,,,,,,
+Rent,,,,monthly,2024-08-01,,40
+"""
+
+
+class TestImportTasks(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+
+    def upload(self, name, content: bytes, query=""):
+        return self.client.post(
+            f"/api/tasks/import/?user_id={self.user.id}{query}",
+            {"file": SimpleUploadedFile(name, content)},
+        )
+
+    def test_import_csv(self):
+        response = self.upload("tasks.csv", CSV_IMPORT.encode())
+
+        assert response.status_code == 200
+        report = response.json()
+        assert report["imported"] == 2
+        assert report["failed"] == 2
+        assert [error["line"] for error in report["errors"]] == [4, 5]
+        assert report["errors"][0]["error"].startswith("title:")
+
+        water = Task.objects.get(title="Water the plants")
+        assert water.user == self.user
+        assert water.due_date.date() == date(2024, 8, 10)
+        recurring = RecurringTask.objects.get(task__title="Leg day")
+        assert recurring.frequency == "weekly"
+        assert recurring.end_date == date(2024, 12, 31)
+
+    def test_import_ndjson_in_batches(self):
+        other = CustomUser.objects.create(
+            username="other", password="password", email="other@example.com"
+        )
+        lines = [
+            json.dumps({"title": f"Task {i}", "user_id": other.id}) for i in range(5)
+        ]
+        lines[2] = "{not json"
+        stream = SimpleUploadedFile("tasks.ndjson", "\n".join(lines).encode())
+
+        # The user lookup happens in the route; each batch of two is its own
+        # transaction with the task and recurring task inserts
+        with self.assertQueryBudget(12):
+            report = import_tasks(self.user, stream, "ndjson", batch_size=2)
+
+        assert report == {
+            "imported": 4,
+            "failed": 1,
+            "errors": [{"line": 3, "error": "Invalid JSON."}],
+        }
+        # Rows always go to the importing user
+        assert Task.objects.filter(user=self.user).count() == 4
+
+    def test_import_yearly_rows_without_a_day(self):
+        content = (
+            "title,frequency,start_date,day\n"
+            "Birthday,yearly,2025-03-14,\n"
+            "Taxes,yearly,2024-04-15,400\n"
+            "Dentist,,,\n"
+        )
+
+        report = self.upload("tasks.csv", content.encode()).json()
+
+        assert report["imported"] == 2
+        assert [error["line"] for error in report["errors"]] == [3]
+        birthday = RecurringTask.objects.get(task__title="Birthday")
+        assert birthday.day is None
+        assert list(birthday.occurrences(date(2026, 1, 1), date(2026, 12, 31))) == [
+            date(2026, 3, 14)
+        ]
+
+    def test_import_rejects_unknown_format(self):
+        response = self.upload("tasks.txt", b"title\nSomething\n")
+
+        assert response.status_code == 400
+
+    def test_import_format_parameter_overrides_extension(self):
+        response = self.upload("tasks.txt", b"title\nSomething\n", "&format=csv")
+
+        assert response.status_code == 200
+        assert response.json()["imported"] == 1
+
+    def test_import_rejects_non_utf8(self):
+        response = self.upload("tasks.csv", "title\nCaf\xe9\n".encode("latin-1"))
+
+        assert response.status_code == 400
+
+    def test_import_unknown_user(self):
+        response = self.client.post(
+            "/api/tasks/import/?user_id=999",
+            {"file": SimpleUploadedFile("tasks.csv", b"title\nSomething\n")},
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,195 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from right_the_ship.core.api.task import (
+    bulk_update_tasks,
+    list_occurrences,
+    update_task,
+)
+from right_the_ship.core.models import (
+    CustomUser,
+    Task,
+    RecurringTask,
+    TaskOccurrence,
+    OccurrenceWindow,
+)
+from right_the_ship.core.schemas import TaskInSchema, TaskBulkUpdateSchema
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestListOccurrences(QueryBudgetMixin, TestCase):
+    query_budgets = {"list_occurrences": 2}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+
+        weekly = Task.objects.create(user=self.user, title="Leg day")
+        RecurringTask.objects.create(
+            task=weekly,
+            frequency=RecurringTask.WEEKLY,
+            start_date=date(2024, 8, 1),
+            day=1,
+        )
+        monthly = Task.objects.create(user=self.user, title="Rent")
+        RecurringTask.objects.create(
+            task=monthly,
+            frequency=RecurringTask.MONTHLY,
+            start_date=date(2024, 1, 1),
+            day=5,
+        )
+        ended = Task.objects.create(user=self.user, title="Ended")
+        RecurringTask.objects.create(
+            task=ended,
+            frequency=RecurringTask.DAILY,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 7, 31),
+        )
+        Task.objects.create(user=self.user, title="Single")
+
+    def test_occurrences_are_merged_in_date_order(self):
+        occurrences = list_occurrences(
+            None,
+            user_id=self.user.id,
+            window_start=date(2024, 8, 1),
+            window_end=date(2024, 8, 14),
+        )
+
+        assert [(o["date"], o["title"]) for o in occurrences] == [
+            (date(2024, 8, 5), "Leg day"),
+            (date(2024, 8, 5), "Rent"),
+            (date(2024, 8, 12), "Leg day"),
+        ]
+
+    def test_window_is_validated(self):
+        with self.assertRaises(HttpError):
+            list_occurrences(
+                None,
+                user_id=self.user.id,
+                window_start=date(2024, 8, 2),
+                window_end=date(2024, 8, 1),
+            )
+
+        with self.assertRaises(HttpError):
+            list_occurrences(
+                None,
+                user_id=self.user.id,
+                window_start=date(2024, 1, 1),
+                window_end=date(2026, 1, 1),
+            )
+
+
+class TestMaterializedOccurrences(QueryBudgetMixin, TestCase):
+    query_budgets = {"list_occurrences": 2}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+        self.today = timezone.localdate()
+        self.task = Task.objects.create(user=self.user, title="Daily")
+        self.rule = RecurringTask.objects.create(
+            task=self.task,
+            frequency=RecurringTask.DAILY,
+            start_date=self.today,
+            end_date=self.today + timedelta(days=9),
+        )
+        call_command("refresh_occurrences", stdout=StringIO())
+
+    def occurrence_dates(self):
+        return list(
+            TaskOccurrence.objects.filter(task=self.task)
+            .order_by("occurrence_date")
+            .values_list("occurrence_date", flat=True)
+        )
+
+    def test_saving_a_rule_materializes_its_occurrences(self):
+        assert self.occurrence_dates() == [
+            self.today + timedelta(days=offset) for offset in range(10)
+        ]
+
+    def test_editing_a_rule_keeps_completion_of_surviving_occurrences(self):
+        TaskOccurrence.objects.filter(
+            task=self.task, occurrence_date=self.today + timedelta(days=1)
+        ).update(completed=True)
+
+        self.rule.end_date = self.today + timedelta(days=4)
+        self.rule.save()
+
+        assert self.occurrence_dates() == [
+            self.today + timedelta(days=offset) for offset in range(5)
+        ]
+        assert TaskOccurrence.objects.get(completed=True).occurrence_date == (
+            self.today + timedelta(days=1)
+        )
+
+    def agenda(self, user, days=3):
+        return list_occurrences(
+            None,
+            user_id=user.id,
+            window_start=self.today,
+            window_end=self.today + timedelta(days=days - 1),
+        )
+
+    def test_agenda_inside_the_window_is_one_range_scan(self):
+        # The materialized-through date, then the rows
+        with self.assertNumQueries(2):
+            occurrences = self.agenda(self.user)
+
+        assert [o["date"] for o in occurrences] == [
+            self.today + timedelta(days=offset) for offset in range(3)
+        ]
+        assert occurrences[0]["title"] == "Daily"
+
+    def test_agenda_past_the_materialized_date_expands_the_rules(self):
+        # As after midnight, before the command has rolled the window forward
+        OccurrenceWindow.objects.update(
+            materialized_through=self.today + timedelta(days=1)
+        )
+        TaskOccurrence.objects.filter(
+            occurrence_date=self.today + timedelta(days=2)
+        ).delete()
+
+        assert len(self.agenda(self.user)) == 3
+
+    def test_refresh_command_records_the_materialized_date(self):
+        OccurrenceWindow.objects.all().delete()
+        assert TaskOccurrence.objects.materialized_through() is None
+
+        call_command("refresh_occurrences", stdout=StringIO())
+
+        _, window_end = TaskOccurrence.objects.rolling_window()
+        assert TaskOccurrence.objects.materialized_through() == window_end
+
+    def test_reassigning_a_task_moves_its_occurrences(self):
+        other = CustomUser.objects.create(
+            username="other", email="other@example.com", password="password"
+        )
+
+        update_task(None, self.task.id, TaskInSchema(user_id=other.id, title="Daily"))
+
+        assert self.agenda(self.user) == []
+        assert len(self.agenda(other)) == 3
+        assert not TaskOccurrence.objects.filter(user=self.user).exists()
+
+    def test_bulk_reassigning_a_task_moves_its_occurrences(self):
+        other = CustomUser.objects.create(
+            username="other", email="other@example.com", password="password"
+        )
+
+        bulk_update_tasks(
+            None,
+            [TaskBulkUpdateSchema(id=self.task.id, user_id=other.id, title="Daily")],
+        )
+
+        assert self.agenda(self.user) == []
+        assert len(self.agenda(other)) == 3
+
+    def test_refresh_command_rebuilds_missing_rows(self):
+        TaskOccurrence.objects.all().delete()
+
+        call_command("refresh_occurrences", stdout=StringIO())
+
+        assert len(self.occurrence_dates()) == 10
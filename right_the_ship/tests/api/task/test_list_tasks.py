@@ -0,0 +1,104 @@
+import json
+from datetime import date, datetime, timezone
+
+from django.test import TestCase
+from ninja.errors import HttpError
+
+from right_the_ship.core.api.task import list_tasks
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestListTasks(QueryBudgetMixin, TestCase):
+    query_budgets = {"list_tasks": 1}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.other_user = CustomUser.objects.create(
+            username="otheruser", password="password", email="other@example.com"
+        )
+
+        for day in range(1, 6):
+            Task.objects.create(
+                user=self.user,
+                title=f"Task {day}",
+                due_date=datetime(2021, 1, day, tzinfo=timezone.utc),
+                completed=day % 2 == 0,
+            )
+        self.undated_task = Task.objects.create(user=self.user, title="Undated")
+        self.recurring_task = Task.objects.create(
+            user=self.user,
+            title="Recurring",
+            due_date=datetime(2021, 1, 3, tzinfo=timezone.utc),
+        )
+        RecurringTask.objects.create(
+            task=self.recurring_task,
+            frequency=RecurringTask.DAILY,
+            start_date=date(2021, 1, 1),
+        )
+        Task.objects.create(user=self.other_user, title="Someone else's task")
+        Task.objects.create(user=self.user, title="Deleted", is_deleted=True)
+
+    def list_page(self, **params):
+        return json.loads(list_tasks(None, user_id=self.user.id, **params).content)
+
+    def titles(self, page):
+        return [item["task"]["title"] for item in page["items"]]
+
+    def test_list_orders_by_due_date_then_id_with_undated_last(self):
+        page = self.list_page()
+
+        assert self.titles(page) == [
+            "Task 1",
+            "Task 2",
+            "Task 3",
+            "Recurring",
+            "Task 4",
+            "Task 5",
+            "Undated",
+        ]
+        assert page["next_cursor"] is None
+
+    def test_list_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            page = self.list_page()
+
+        assert any(item["is_recurring"] for item in page["items"])
+
+    def test_cursor_walks_every_task_exactly_once(self):
+        seen = []
+        cursor = None
+        while True:
+            page = self.list_page(cursor=cursor, limit=2)
+            seen.extend(self.titles(page))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == self.titles(self.list_page())
+
+    def test_filter_completed(self):
+        page = self.list_page(completed=True)
+
+        assert self.titles(page) == ["Task 2", "Task 4"]
+
+    def test_filter_due_date_range(self):
+        page = self.list_page(due_from=date(2021, 1, 2), due_to=date(2021, 1, 3))
+
+        assert self.titles(page) == ["Task 2", "Task 3", "Recurring"]
+
+    def test_filter_recurring(self):
+        recurring = self.list_page(is_recurring=True)
+        single = self.list_page(is_recurring=False)
+
+        assert self.titles(recurring) == ["Recurring"]
+        assert "Recurring" not in self.titles(single)
+        assert recurring["items"][0]["frequency"] == RecurringTask.DAILY
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(HttpError) as excinfo:
+            list_tasks(None, user_id=self.user.id, cursor="not-a-cursor")
+
+        assert excinfo.exception.status_code == 400
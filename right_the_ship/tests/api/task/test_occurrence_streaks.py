@@ -0,0 +1,122 @@
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from right_the_ship.core.api.task import list_occurrences, update_task
+from right_the_ship.core.models import CustomUser, RecurringTask, Task, TaskOccurrence
+from right_the_ship.core.schemas import TaskInSchema
+
+
+class TestOccurrenceStreaks(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+        self.today = timezone.localdate()
+        self.task = Task.objects.create(user=self.user, title="Meditate")
+        self.rule = RecurringTask.objects.create(
+            task=self.task,
+            frequency=RecurringTask.DAILY,
+            start_date=self.today - timedelta(days=9),
+        )
+
+    def complete(self, days_ago, completed=True, task_id=None):
+        occurrence = self.today - timedelta(days=days_ago)
+        return self.client.put(
+            f"/api/tasks/{task_id or self.task.id}/occurrences/{occurrence}/",
+            {"completed": completed},
+            content_type="application/json",
+        )
+
+    def streak(self):
+        response = self.client.get(f"/api/tasks/{self.task.id}/streak/")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_completing_occurrences_builds_streaks(self):
+        for days_ago in (9, 8, 7, 5, 4, 2, 1):
+            assert self.complete(days_ago).status_code == 200
+
+        # Today is still open, so the streak runs to yesterday
+        assert self.streak() == {
+            "task_id": self.task.id,
+            "current_streak": 2,
+            "longest_streak": 3,
+            "completed": 7,
+            "due": 10,
+            "completion_rate": 0.7,
+        }
+
+        response = self.complete(0)
+        assert response.json()["current_streak"] == 3
+
+        response = self.complete(8, completed=False)
+        assert response.json()["longest_streak"] == 3
+        assert response.json()["completed"] == 7
+
+    def test_completion_reaches_the_materialized_agenda(self):
+        self.complete(0)
+
+        assert TaskOccurrence.objects.get(
+            task=self.task, occurrence_date=self.today
+        ).completed
+        occurrences = list_occurrences(
+            None, user_id=self.user.id, window_start=self.today, window_end=self.today
+        )
+        assert occurrences[0]["completed"] is True
+
+    def test_agenda_history_reads_completion_from_the_bits(self):
+        self.complete(5)
+
+        with self.assertNumQueries(1):
+            occurrences = list_occurrences(
+                None,
+                user_id=self.user.id,
+                window_start=self.today - timedelta(days=6),
+                window_end=self.today - timedelta(days=4),
+            )
+
+        assert [o["completed"] for o in occurrences] == [False, True, False]
+
+    def test_editing_the_rule_keeps_completions_on_their_dates(self):
+        self.complete(3)
+        self.complete(1)
+
+        # Every other day from the start no longer falls on 3 days ago
+        update_task(
+            None,
+            self.task.id,
+            TaskInSchema(
+                user_id=self.user.id,
+                title="Meditate",
+                frequency=RecurringTask.DAILY,
+                start_date=self.today - timedelta(days=2),
+            ),
+        )
+
+        streak = self.streak()
+        assert (streak["completed"], streak["due"]) == (1, 3)
+        self.rule.refresh_from_db()
+        assert self.rule.occurrence_index(self.today - timedelta(days=1)) == 1
+
+    def test_rejects_dates_the_task_does_not_recur_on(self):
+        weekly = Task.objects.create(user=self.user, title="Weekly")
+        RecurringTask.objects.create(
+            task=weekly,
+            frequency=RecurringTask.WEEKLY,
+            start_date=date(2024, 1, 1),
+            # Stored weekdays count from Sunday, so this is tomorrow's
+            day=(self.today.weekday() + 2) % 7,
+        )
+
+        assert self.complete(0, task_id=weekly.id).status_code == 400
+        assert self.complete(10).status_code == 400
+
+    def test_rejects_future_occurrences(self):
+        assert self.complete(-1).status_code == 400
+
+    def test_single_tasks_have_no_streak(self):
+        single = Task.objects.create(user=self.user, title="Single")
+
+        assert self.complete(0, task_id=single.id).status_code == 404
+        response = self.client.get(f"/api/tasks/{single.id}/streak/")
+        assert response.status_code == 404
@@ -0,0 +1,68 @@
+import json
+from datetime import date
+
+from django.test import TestCase
+from django.utils import timezone
+
+from right_the_ship.core.api import async_task
+from right_the_ship.core.api.task import get_task
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.core.utils.task_cache import task_cache, task_cache_stats
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestTaskCache(QueryBudgetMixin, TestCase):
+    query_budgets = {"get_task": 2}
+
+    def setUp(self):
+        task_cache().clear()
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+        self.task = Task.objects.create(user=self.user, title="Cached")
+
+    def read(self):
+        return json.loads(get_task(None, self.task.id).content)
+
+    def test_second_read_is_served_from_cache(self):
+        get_task(None, self.task.id)
+        before = task_cache_stats()
+
+        with self.assertNumQueries(1):
+            detail = self.read()
+
+        after = task_cache_stats()
+        assert detail["task"]["title"] == "Cached"
+        assert after["hits"] == before["hits"] + 1
+        assert after["misses"] == before["misses"]
+
+    def test_writes_are_visible_on_next_read(self):
+        get_task(None, self.task.id)
+
+        self.task.title = "Renamed"
+        self.task.save()
+        assert self.read()["task"]["title"] == "Renamed"
+
+        RecurringTask.objects.create(
+            task=self.task, frequency=RecurringTask.DAILY, start_date=date(2021, 1, 1)
+        )
+        assert self.read()["is_recurring"] is True
+
+    def test_stale_entry_is_a_miss_even_without_invalidation(self):
+        get_task(None, self.task.id)
+        before = task_cache_stats()
+
+        # A queryset update skips every invalidation hook
+        Task.objects.filter(id=self.task.id).update(
+            title="Changed", updated_at=timezone.now()
+        )
+
+        assert self.read()["task"]["title"] == "Changed"
+        assert task_cache_stats()["misses"] == before["misses"] + 1
+
+    async def test_async_reads_are_served_from_cache(self):
+        await async_task.get_task(None, self.task.id)
+        before = task_cache_stats()
+
+        response = await async_task.get_task(None, self.task.id)
+
+        assert json.loads(response.content)["task"]["title"] == "Cached"
+        assert task_cache_stats()["hits"] == before["hits"] + 1
@@ -0,0 +1,69 @@
+import json
+from datetime import date
+
+from django.test import TestCase
+
+from right_the_ship.core.api.task import generate_task_detail_schemas, list_tasks
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.core.schemas import TaskDetailSchema
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestTaskDetailSerialization(QueryBudgetMixin, TestCase):
+    query_budgets = {"generate_task_detail_schemas": (1, 2.0)}
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+
+    def create_tasks(self, count):
+        tasks = Task.objects.bulk_create(
+            Task(user=self.user, title=f"Task {i}") for i in range(count)
+        )
+        # Every other task is recurring so both join outcomes are exercised
+        RecurringTask.objects.bulk_create(
+            RecurringTask(
+                task=task, frequency=RecurringTask.DAILY, start_date=date(2021, 1, 1)
+            )
+            for task in tasks[::2]
+        )
+
+    def test_query_count_is_constant(self):
+        created = 0
+        for count in (1, 100, 10_000):
+            self.create_tasks(count - created)
+            created = count
+
+            with self.assertNumQueries(1):
+                details = generate_task_detail_schemas(
+                    Task.objects.filter(user=self.user)
+                )
+
+            assert len(details) == count
+
+    def test_output_matches_single_task_schema(self):
+        self.create_tasks(2)
+
+        details = generate_task_detail_schemas(
+            Task.objects.filter(user=self.user).order_by("id")
+        )
+        recurring, single = (TaskDetailSchema(**detail) for detail in details)
+
+        assert recurring.is_recurring is True
+        assert recurring.frequency == RecurringTask.DAILY
+        assert recurring.start_date == date(2021, 1, 1)
+        assert single.is_recurring is False
+        assert single.frequency is None
+        assert single.task.title == "Task 1"
+
+    def test_output_matches_the_list_route(self):
+        self.create_tasks(3)
+
+        details = generate_task_detail_schemas(
+            Task.objects.filter(user=self.user).order_by("id")
+        )
+        response = list_tasks(None, user_id=self.user.id)
+
+        # Both go through the schema's JSON encoding, as served
+        assert json.loads(response.content)["items"] == [
+            json.loads(TaskDetailSchema(**detail).json()) for detail in details
+        ]
@@ -5,9 +5,12 @@ from django.core.exceptions import ValidationError
 
 from right_the_ship.core.models import CustomUser, Task, RecurringTask
 from right_the_ship.core.schemas import TaskInSchema
+from right_the_ship.tests.query_budget import QueryBudgetMixin
 
 
-class TestUpdateTask(TestCase):
+class TestUpdateTask(QueryBudgetMixin, TestCase):
+    query_budgets = {"update_task": 11, "create_task": 7}
+
     single_task = {
         "title": "Single Task",
         "description": "Single Task Description",
@@ -0,0 +1,93 @@
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser, Task
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestAsyncRoutes(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.task = Task.objects.create(user=self.user, title="Async")
+
+    async def test_task_routes_match_sync_stack(self):
+        url = f"/api/tasks/{self.task.id}/"
+        sync_response = await self.async_client.get(url)
+        async with self.assertQueryBudget(2):
+            async_response = await self.async_client.get(
+                f"/api/async/tasks/{self.task.id}/"
+            )
+
+        assert async_response.status_code == 200
+        assert async_response.json() == sync_response.json()
+
+        async with self.assertQueryBudget(1):
+            response = await self.async_client.get(
+                f"/api/async/tasks/?user_id={self.user.id}"
+            )
+        assert [item["task"]["id"] for item in response.json()["items"]] == [
+            self.task.id
+        ]
+
+    async def test_create_update_and_delete_task(self):
+        payload = {
+            "user_id": self.user.id,
+            "title": "Stretch",
+            "frequency": "daily",
+            "start_date": "2024-08-01",
+        }
+        response = await self.async_client.post(
+            "/api/async/tasks/", payload, content_type="application/json"
+        )
+        task_id = response.json()["task"]["id"]
+
+        assert response.json()["frequency"] == "daily"
+
+        payload["title"] = "Stretch more"
+        response = await self.async_client.patch(
+            f"/api/async/tasks/{task_id}/", payload, content_type="application/json"
+        )
+
+        assert response.json()["task"]["title"] == "Stretch more"
+
+        response = await self.async_client.delete(f"/api/async/tasks/{task_id}/")
+
+        assert response.json() == {"success": True}
+        assert (await Task.all_objects.aget(id=task_id)).is_deleted
+
+    async def test_user_routes(self):
+        response = await self.async_client.post(
+            "/api/async/users/",
+            {"username": "async", "password": "secret", "email": "a@example.com"},
+            content_type="application/json",
+        )
+        user = await CustomUser.objects.aget(id=response.json()["id"])
+
+        assert user.check_password("secret")
+
+        response = await self.async_client.delete(f"/api/async/users/{self.user.id}/")
+
+        assert response.json() == {"success": True}
+        assert not await Task.objects.filter(user=self.user).aexists()
+
+        response = await self.async_client.get(f"/api/async/users/{self.user.id}/")
+
+        assert response.status_code == 404
+
+    async def test_conditional_get_matches_sync_stack(self):
+        for path in (f"tasks/{self.task.id}/", f"users/{self.user.id}/"):
+            sync_response = await self.async_client.get(f"/api/{path}")
+            etag = sync_response["ETag"]
+
+            response = await self.async_client.get(f"/api/async/{path}")
+
+            assert response["ETag"] == etag
+
+            async with self.assertQueryBudget(1):
+                response = await self.async_client.get(
+                    f"/api/async/{path}", headers={"If-None-Match": etag}
+                )
+
+            assert response.status_code == 304
+            assert response.content == b""
@@ -0,0 +1,52 @@
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser, Task
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestConditionalGet(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.task = Task.objects.create(user=self.user, title="Polled")
+
+    def assert_conditional(self, url, max_queries):
+        with self.assertQueryBudget(max_queries):
+            response = self.client.get(url)
+        etag = response["ETag"]
+
+        assert response.status_code == 200
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b""
+        return etag
+
+    def test_unchanged_task_returns_304(self):
+        # ETag, version and, on a cache miss, the task itself
+        etag = self.assert_conditional(f"/api/tasks/{self.task.id}/", 3)
+
+        self.task.title = "Changed"
+        self.task.save()
+        response = self.client.get(
+            f"/api/tasks/{self.task.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert response.json()["task"]["title"] == "Changed"
+
+    def test_unchanged_user_returns_304(self):
+        etag = self.assert_conditional(f"/api/users/{self.user.id}/", 2)
+
+        self.user.username = "renamed"
+        self.user.save()
+        response = self.client.get(
+            f"/api/users/{self.user.id}/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == 200
+        assert response.json()["username"] == "renamed"
@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from right_the_ship.core.leaderboard.boards import leaderboards
+from right_the_ship.core.models import (
+    CustomUser,
+    RecurringTask,
+    Task,
+    UserRewardSummary,
+)
+
+
+@override_settings(REWARD_ON_TIME_POINTS=10, LEADERBOARD_SYNC_SECONDS=3600)
+class TestLeaderboard(TestCase):
+    def setUp(self):
+        leaderboards.reset()
+        self.addCleanup(leaderboards.reset)
+        self.users = [
+            CustomUser.objects.create(
+                username=f"user{i}", password="password", email=f"user{i}@example.com"
+            )
+            for i in range(5)
+        ]
+        for user, points in zip(self.users, (30, 50, 10, 30, 0)):
+            UserRewardSummary.objects.create(user=user, points=points)
+
+    def leaderboard(self, **params):
+        response = self.client.get("/api/leaderboard/", params)
+        assert response.status_code == 200
+        return response.json()
+
+    def ranking(self, **params):
+        return [
+            (entry["rank"], entry["username"], entry["score"])
+            for entry in self.leaderboard(**params)["entries"]
+        ]
+
+    def complete_on_time(self, user):
+        task = Task.objects.create(user=user, title="Task", due_date=timezone.now())
+        task.completed = True
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+
+    def test_top_of_the_board(self):
+        leaderboard = self.leaderboard()
+
+        assert leaderboard["board"] == "points"
+        # Users without points aren't ranked
+        assert leaderboard["total"] == 4
+        assert self.ranking(limit=3) == [
+            (1, "user1", 50),
+            (2, "user0", 30),
+            (3, "user3", 30),
+        ]
+
+    def test_around_a_user(self):
+        assert self.ranking(around=self.users[3].id, limit=3) == [
+            (2, "user0", 30),
+            (3, "user3", 30),
+            (4, "user2", 10),
+        ]
+
+        response = self.client.get("/api/leaderboard/", {"around": self.users[4].id})
+        assert response.status_code == 404
+
+    def test_unknown_board(self):
+        response = self.client.get("/api/leaderboard/", {"board": "karma"})
+
+        assert response.status_code == 400
+
+    def test_reads_after_the_first_only_query_usernames(self):
+        self.leaderboard()
+
+        with self.assertNumQueries(1):
+            self.leaderboard(around=self.users[2].id)
+
+    def test_reward_events_update_ranks_in_place(self):
+        self.leaderboard()
+
+        self.complete_on_time(self.users[2])
+        self.complete_on_time(self.users[2])
+        self.complete_on_time(self.users[4])
+
+        assert self.ranking() == [
+            (1, "user1", 50),
+            (2, "user0", 30),
+            (3, "user2", 30),
+            (4, "user3", 30),
+            (5, "user4", 10),
+        ]
+
+    def test_picks_up_changes_from_other_processes(self):
+        self.leaderboard()
+        # Written without this process hearing about it
+        UserRewardSummary.objects.filter(user=self.users[2]).update(
+            points=99, updated_at=timezone.now()
+        )
+        assert self.ranking(limit=1) == [(1, "user1", 50)]
+
+        with override_settings(LEADERBOARD_SYNC_SECONDS=0):
+            assert self.ranking(limit=1) == [(1, "user2", 99)]
+
+    def test_deleted_users_drop_off(self):
+        self.leaderboard()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/users/{self.users[1].id}/")
+
+        assert self.leaderboard()["total"] == 3
+        assert self.ranking(limit=1) == [(1, "user0", 30)]
+
+    def test_streak_board(self):
+        today = timezone.localdate()
+        task = Task.objects.create(user=self.users[0], title="Daily")
+        RecurringTask.objects.create(
+            task=task,
+            frequency=RecurringTask.DAILY,
+            start_date=today - timedelta(days=3),
+        )
+        self.leaderboard(board="streak")
+
+        for days_ago in (3, 2, 1):
+            occurrence = today - timedelta(days=days_ago)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.put(
+                    f"/api/tasks/{task.id}/occurrences/{occurrence}/",
+                    {"completed": True},
+                    content_type="application/json",
+                )
+
+        assert self.ranking(board="streak") == [(1, "user0", 3)]
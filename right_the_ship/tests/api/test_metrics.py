@@ -0,0 +1,76 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from right_the_ship.core.models import CustomUser, Task
+from right_the_ship.core.utils.request_metrics import reset_request_metrics
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+TASK_ROUTE = 'route="api/tasks/<task_id>/"'
+
+
+class TestRequestMetrics(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        reset_request_metrics()
+        self.addCleanup(reset_request_metrics)
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.task = Task.objects.create(user=self.user, title="Measured")
+        # Admin accounts are Django auth users, not CustomUsers
+        self.staff = User.objects.create(username="staff", is_staff=True)
+
+    def scrape(self):
+        self.client.force_login(self.staff)
+        # Just the session and admin user lookups
+        with self.assertQueryBudget(2):
+            response = self.client.get("/api/metrics/")
+        self.client.logout()
+        assert response.status_code == 200
+        return response.content.decode().splitlines()
+
+    def metric(self, lines, name, *labels):
+        for line in lines:
+            if line.startswith(name + "{") and all(label in line for label in labels):
+                return float(line.rsplit(" ", 1)[1])
+
+    def test_records_route_latency_queries_and_serialization(self):
+        self.client.get(f"/api/tasks/{self.task.id}/")
+        self.client.get(f"/api/tasks/{self.task.id}/")
+
+        lines = self.scrape()
+        prefix = "right_the_ship_request"
+
+        assert self.metric(lines, f"{prefix}_duration_seconds_count", TASK_ROUTE) == 2
+        assert self.metric(lines, f"{prefix}_duration_seconds_bucket", 'le="+Inf"') == 2
+        assert self.metric(lines, "right_the_ship_requests_total", 'status="200"') == 2
+        # ETag and version reads on both requests, plus the load on the miss
+        assert self.metric(lines, f"{prefix}_queries_total", TASK_ROUTE) == 5
+        assert self.metric(lines, f"{prefix}_serialization_seconds_total", TASK_ROUTE)
+        assert any(
+            line.startswith("right_the_ship_task_cache_hits_total ") for line in lines
+        )
+
+    async def test_records_async_routes(self):
+        await self.async_client.get(f"/api/async/tasks/{self.task.id}/")
+
+        lines = await self.async_scrape()
+
+        assert self.metric(
+            lines, "right_the_ship_request_queries_total", "api/async/tasks/"
+        )
+
+    async def async_scrape(self):
+        from asgiref.sync import sync_to_async
+
+        return await sync_to_async(self.scrape)()
+
+    def test_metrics_are_staff_only(self):
+        assert self.client.get("/api/metrics/").status_code == 403
+
+    @override_settings(REQUEST_METRICS_SLOW_SECONDS=0)
+    def test_logs_slow_requests_with_sql(self):
+        with self.assertLogs("right_the_ship.requests", "WARNING") as logs:
+            self.client.get(f"/api/tasks/{self.task.id}/")
+
+        assert "1 queries" not in logs.output[0]
+        assert 'FROM "core_task"' in logs.output[0]
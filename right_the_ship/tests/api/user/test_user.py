@@ -2,6 +2,7 @@ import json
 from unittest.mock import patch, MagicMock
 
 import pytest
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import User
 from django.db import IntegrityError
 from django.http import Http404
@@ -10,10 +11,19 @@ from ninja.errors import HttpError
 from pydantic import ValidationError
 
 from right_the_ship.core.api.user import update_user, create_user, get_user, delete_user
+from right_the_ship.core.models import CustomUser
 from right_the_ship.core.schemas import UserUpdateIn, UserIn
+from right_the_ship.tests.query_budget import QueryBudgetMixin
 
 
-class TestUser(TestCase):
+class TestUser(QueryBudgetMixin, TestCase):
+    # update_user and get_user are budgeted in TestUserQueries, since these
+    # tests mock out their lookup
+    query_budgets = {
+        "create_user": 1,
+        "delete_user": 5,
+    }
+
     old_username = "old_username"
     old_email = "old@example.com"
     old_password = "old_password"
@@ -29,20 +39,15 @@ class TestUser(TestCase):
         self.patcher_user_save = patch(
             "django.contrib.auth.models.User.save", autospec=True
         )
-        self.patcher_create_user = patch(
-            "right_the_ship.core.api.user.User.objects.create_user"
-        )
 
         self.mock_get_object_or_404 = self.patcher_get_object_or_404.start()
         self.mock_user_save = self.patcher_user_save.start()
-        self.mock_create_user = self.patcher_create_user.start()
 
         self.addCleanup(self.patcher_get_object_or_404.stop)
         self.addCleanup(self.patcher_user_save.stop)
-        self.addCleanup(self.patcher_create_user.stop)
 
     def create_mock_user(self):
-        self.mock_user = MagicMock(spec=User)
+        self.mock_user = MagicMock(spec=CustomUser)
         self.mock_user.id = 1
         self.mock_user.username = self.old_username
         self.mock_user.email = self.old_email
@@ -70,6 +75,8 @@ class TestUser(TestCase):
 
         assert response_data["username"] == self.new_username
         assert "password" not in response_data
+        assert self.mock_user.password != self.new_password
+        assert check_password(self.new_password, self.mock_user.password)
         self.mock_user.save.assert_called_once_with()
 
     def test_cannot_update_email(self):
@@ -90,8 +97,22 @@ class TestUser(TestCase):
         with pytest.raises(Http404):
             update_user(None, 5, UserUpdateIn(username=self.new_username))
 
+    def test_create_user_hashes_password(self):
+        self.patcher_user_save.stop()
+
+        response = create_user(
+            None,
+            UserIn(
+                username=self.old_username,
+                password=self.old_password,
+                email=self.old_email,
+            ),
+        )
+        user = CustomUser.objects.get(id=json.loads(response.content)["id"])
+
+        assert user.check_password(self.old_password)
+
     def test_cannot_create_user_with_existing_username(self):
-        self.patcher_create_user.stop()
         self.patcher_user_save.stop()
 
         data = UserIn(
@@ -107,7 +128,6 @@ class TestUser(TestCase):
         assert "username" in excinfo.value.message.lower()
 
     def test_cannot_create_user_with_existing_email(self):
-        self.patcher_create_user.stop()
         self.patcher_user_save.stop()
 
         data = UserIn(
@@ -204,7 +224,8 @@ class TestUser(TestCase):
 
         assert response.status_code == 200
         assert response_data["success"] is True
-        self.mock_user.delete.assert_called_once()
+        self.mock_user.soft_delete.assert_called_once()
+        self.mock_user.delete.assert_not_called()
 
     def test_delete_user_not_found(self):
         self.mock_get_object_or_404.side_effect = Http404
@@ -220,3 +241,29 @@ class TestUser(TestCase):
 
         with pytest.raises(HttpError):
             update_user(None, 1, UserUpdateIn(username=self.new_username))
+
+
+class TestUserQueries(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.url = f"/api/users/{self.user.id}/"
+
+    def test_get_user_query_budget(self):
+        # The ETag, then the user
+        with self.assertQueryBudget(2):
+            response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert response.json()["username"] == "testuser"
+
+    def test_update_user_query_budget(self):
+        # The lookup, then the update
+        with self.assertQueryBudget(2):
+            response = self.client.patch(
+                self.url, {"username": "renamed"}, content_type="application/json"
+            )
+
+        assert response.status_code == 200
+        assert CustomUser.objects.get(id=self.user.id).username == "renamed"
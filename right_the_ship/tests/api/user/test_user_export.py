@@ -0,0 +1,59 @@
+import json
+from datetime import date, datetime, timezone
+
+from django.test import TestCase
+
+from right_the_ship.core.api.task import task_detail_dict
+from right_the_ship.core.models import CustomUser, RecurringTask, Task
+from right_the_ship.core.schemas import TaskDetailSchema
+from right_the_ship.core.utils.task_export import export_tasks_ndjson
+from right_the_ship.tests.query_budget import QueryBudgetMixin
+
+
+class TestUserExport(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.tasks = [
+            Task.objects.create(
+                user=self.user,
+                title=f"Task {i}",
+                due_date=datetime(2024, 5, i + 1, tzinfo=timezone.utc),
+            )
+            for i in range(5)
+        ]
+        RecurringTask.objects.create(
+            task=self.tasks[0],
+            frequency=RecurringTask.WEEKLY,
+            start_date=date(2024, 5, 1),
+            day=3,
+        )
+        Task.objects.create(user=self.user, title="Deleted", is_deleted=True)
+
+    def test_export_streams_task_details(self):
+        with self.assertQueryBudget(2):
+            response = self.client.get(f"/api/users/{self.user.id}/export/")
+            lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in lines] == [
+            json.loads(
+                TaskDetailSchema(
+                    **task_detail_dict(task, getattr(task, "recurringtask", None))
+                ).json()
+            )
+            for task in Task.objects.filter(user=self.user).order_by("id")
+        ]
+
+    def test_export_yields_one_chunk_per_batch(self):
+        chunks = list(export_tasks_ndjson(self.user.id, chunk_size=2))
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+    def test_export_unknown_user(self):
+        response = self.client.get("/api/users/999/export/")
+
+        assert response.status_code == 404
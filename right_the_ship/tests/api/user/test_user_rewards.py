@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from right_the_ship.core.api.task import bulk_update_tasks, update_task
+from right_the_ship.core.models import (
+    CustomUser,
+    RewardLedgerEntry,
+    Task,
+    UserRewardSummary,
+)
+from right_the_ship.core.schemas import TaskBulkUpdateSchema, TaskInSchema
+
+
+@override_settings(
+    REWARD_ON_TIME_POINTS=10, REWARD_ACHIEVEMENTS={"first": 1, "second": 2}
+)
+class TestUserRewards(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        today = timezone.localdate()
+        self.today, self.yesterday = str(today), str(today - timedelta(days=1))
+
+    def task(self, due_date, title="Task"):
+        task = Task.objects.create(user=self.user, title=title)
+        # Stored the way the API stores it, as midnight of the due day
+        update_task(None, task.id, self.data(title, due_date))
+        return Task.objects.get(id=task.id)
+
+    def data(self, title, due_date, completed=False):
+        return TaskInSchema(
+            user_id=self.user.id, title=title, due_date=due_date, completed=completed
+        )
+
+    def complete(self, task, completed=True):
+        update_task(
+            None, task.id, self.data(task.title, task.due_date.date(), completed)
+        )
+
+    def rewards(self):
+        response = self.client.get(f"/api/users/{self.user.id}/rewards/")
+        assert response.status_code == 200
+        return response.json()
+
+    def test_completing_on_the_due_date_earns_points(self):
+        self.complete(self.task(self.today))
+
+        rewards = self.rewards()
+        assert rewards["points"] == 10
+        assert rewards["on_time_completions"] == 1
+        assert rewards["achievements"] == ["first"]
+        entry = RewardLedgerEntry.objects.get()
+        assert (entry.user_id, entry.reason) == (
+            self.user.id,
+            RewardLedgerEntry.ON_TIME,
+        )
+
+    def test_late_and_undated_completions_earn_nothing(self):
+        self.complete(self.task(self.yesterday))
+        undated = Task.objects.create(user=self.user, title="Undated")
+        undated.completed = True
+        undated.save()
+
+        assert self.rewards()["points"] == 0
+        assert not RewardLedgerEntry.objects.exists()
+
+    def test_reopening_and_completing_again_rewards_once(self):
+        task = self.task(self.today)
+        self.complete(task)
+        self.complete(task, completed=False)
+        self.complete(task)
+
+        assert self.rewards()["on_time_completions"] == 1
+        assert RewardLedgerEntry.objects.count() == 1
+
+    def test_tasks_created_completed_earn_nothing(self):
+        Task.objects.create(
+            user=self.user,
+            title="Done already",
+            due_date=timezone.now(),
+            completed=True,
+        )
+
+        assert not RewardLedgerEntry.objects.exists()
+
+    def test_bulk_update_rewards_completions(self):
+        tasks = [self.task(self.today, f"Task {i}") for i in range(3)]
+        items = [
+            TaskBulkUpdateSchema(
+                id=task.id,
+                user_id=self.user.id,
+                title=task.title,
+                due_date=self.today,
+                completed=True,
+            )
+            for task in tasks
+        ]
+
+        bulk_update_tasks(None, items)
+        bulk_update_tasks(None, items)
+
+        summary = UserRewardSummary.objects.get(user=self.user)
+        assert (summary.points, summary.on_time_completions) == (30, 3)
+        assert summary.achievements() == ["first", "second"]
+
+    def test_profile_reads_one_row(self):
+        self.complete(self.task(self.today))
+
+        with self.assertNumQueries(1):
+            self.rewards()
+
+    def test_user_without_rewards(self):
+        rewards = self.rewards()
+
+        assert rewards["points"] == 0
+        assert rewards["achievements"] == []
+        assert rewards["updated_at"] is None
+
+    def test_unknown_user(self):
+        response = self.client.get("/api/users/999/rewards/")
+
+        assert response.status_code == 404
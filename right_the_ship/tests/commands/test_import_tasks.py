@@ -0,0 +1,55 @@
+import tempfile
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser, Task
+
+
+class TestImportTasksCommand(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+
+    def write_file(self, suffix, content):
+        f = tempfile.NamedTemporaryFile("w", suffix=suffix, delete=False)
+        self.addCleanup(f.close)
+        f.write(content)
+        f.flush()
+        return f.name
+
+    def test_imports_file_and_reports_failures(self):
+        path = self.write_file(
+            ".ndjson",
+            '{"title": "Pay rent", "due_date": "2024-08-01"}\n{"title": "X"}\n',
+        )
+        stdout, stderr = StringIO(), StringIO()
+
+        call_command(
+            "import_tasks", path, user_id=self.user.id, stdout=stdout, stderr=stderr
+        )
+
+        assert Task.objects.get().title == "Pay rent"
+        assert "Imported 1 tasks" in stdout.getvalue()
+        assert "1 rows failed" in stdout.getvalue()
+        assert stderr.getvalue().startswith("line 2: title:")
+
+    def test_requires_a_known_format(self):
+        path = self.write_file(".txt", "title\nPay rent\n")
+
+        with pytest.raises(CommandError):
+            call_command("import_tasks", path, user_id=self.user.id)
+
+        call_command(
+            "import_tasks", path, user_id=self.user.id, format="csv", stdout=StringIO()
+        )
+        assert Task.objects.count() == 1
+
+    def test_unknown_user(self):
+        path = self.write_file(".csv", "title\nPay rent\n")
+
+        with pytest.raises(CommandError):
+            call_command("import_tasks", path, user_id=999)
@@ -0,0 +1,70 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from right_the_ship.core.models import CustomUser, Task, TaskTransfer
+
+
+class TestPurgeTombstones(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(username="testuser", password="password")
+        self.live = Task.objects.create(user=self.user, title="Live")
+        self.recent = Task.objects.create(
+            user=self.user, title="Recent", is_deleted=True
+        )
+        self.old = Task.objects.create(user=self.user, title="Old", is_deleted=True)
+        Task.all_objects.filter(id=self.old.id).update(
+            updated_at=timezone.now() - timedelta(days=31)
+        )
+
+    @override_settings(TOMBSTONE_RETENTION_DAYS=30)
+    def test_days_may_not_undercut_the_sync_retention(self):
+        with self.assertRaises(CommandError):
+            call_command("purge_tombstones", days=7, stdout=StringIO())
+
+        assert Task.all_objects.filter(id=self.old.id).exists()
+
+    def test_only_old_tombstones_are_purged(self):
+        call_command("purge_tombstones", days=30, batch_size=1, stdout=StringIO())
+
+        assert set(Task.all_objects.values_list("title", flat=True)) == {
+            "Live",
+            "Recent",
+        }
+
+    def test_old_task_transfers_are_purged(self):
+        other = CustomUser.objects.create(
+            username="other", password="password", email="other@example.com"
+        )
+        now = timezone.now()
+        for days in (31, 1):
+            TaskTransfer.objects.create(
+                task=self.live,
+                from_user=other,
+                transferred_at=now - timedelta(days=days),
+            )
+
+        call_command("purge_tombstones", days=30, batch_size=1, stdout=StringIO())
+
+        assert TaskTransfer.objects.get().transferred_at > now - timedelta(days=30)
+
+    def test_purging_a_user_removes_their_tasks(self):
+        CustomUser.objects.filter(id=self.user.id).update(
+            is_deleted=True, updated_at=timezone.now() - timedelta(days=31)
+        )
+
+        call_command("purge_tombstones", days=30, stdout=StringIO())
+
+        assert not CustomUser.all_objects.exists()
+        assert not Task.all_objects.exists()
+
+    def test_default_managers_hide_tombstones(self):
+        self.user.soft_delete()
+
+        assert list(Task.objects.values_list("title", flat=True)) == ["Live"]
+        assert Task.all_objects.count() == 3
+        assert not CustomUser.objects.exists()
+        assert CustomUser.all_objects.get().is_deleted is True
@@ -0,0 +1,72 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from right_the_ship.core.models import (
+    CustomUser,
+    RecurringTask,
+    RewardLedgerEntry,
+    Task,
+    UserRewardSummary,
+)
+
+
+class TestRebuildRewards(TestCase):
+    def setUp(self):
+        self.users = [
+            CustomUser.objects.create(
+                username=f"user{i}", password="password", email=f"user{i}@example.com"
+            )
+            for i in range(3)
+        ]
+
+    def entry(self, user, points):
+        task = Task.objects.create(user=user, title="Task")
+        return RewardLedgerEntry.objects.create(
+            user=user, task=task, reason=RewardLedgerEntry.ON_TIME, points=points
+        )
+
+    def test_rebuilds_summaries_from_the_ledger(self):
+        self.entry(self.users[0], 10)
+        self.entry(self.users[0], 5)
+        self.entry(self.users[2], 10)
+        # Drifted totals, and a summary with nothing in the ledger behind it
+        UserRewardSummary.objects.create(
+            user=self.users[0], points=999, on_time_completions=99
+        )
+        UserRewardSummary.objects.create(user=self.users[1], points=10)
+        stdout = StringIO()
+
+        call_command("rebuild_rewards", batch_size=2, stdout=stdout)
+
+        assert sorted(
+            UserRewardSummary.objects.values_list(
+                "user_id", "points", "on_time_completions"
+            )
+        ) == [
+            (self.users[0].id, 15, 2),
+            (self.users[1].id, 0, 0),
+            (self.users[2].id, 10, 1),
+        ]
+        assert "Rebuilt reward summaries for 2 users" in stdout.getvalue()
+
+    def test_rebuilds_longest_streaks(self):
+        today = timezone.localdate()
+        task = Task.objects.create(user=self.users[1], title="Daily")
+        rule = RecurringTask.objects.create(
+            task=task,
+            frequency=RecurringTask.DAILY,
+            start_date=today - timedelta(days=4),
+        )
+        for days_ago in (4, 3, 1):
+            rule.set_completed(today - timedelta(days=days_ago))
+        RecurringTask.objects.filter(pk=rule.pk).update(
+            completion_bits=rule.completion_bits
+        )
+
+        call_command("rebuild_rewards", stdout=StringIO())
+
+        assert UserRewardSummary.objects.get(user=self.users[1]).longest_streak == 2
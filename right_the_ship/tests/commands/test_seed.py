@@ -0,0 +1,47 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser, RecurringTask, SingleTask, Task
+
+
+class TestSeed(TestCase):
+    def test_seeds_users_and_tasks(self):
+        stdout = StringIO()
+        call_command(
+            "seed",
+            users=5,
+            tasks=200,
+            recurring_ratio=0.5,
+            single_tasks=True,
+            batch_size=30,
+            stdout=stdout,
+        )
+
+        recurring = RecurringTask.objects.count()
+
+        assert CustomUser.objects.count() == 5
+        assert Task.objects.count() == 200
+        assert 50 < recurring < 150
+        assert SingleTask.objects.count() == 200 - recurring
+        assert f"({recurring} recurring)" in stdout.getvalue()
+        # One shared hash, and it is a real one
+        assert CustomUser.objects.values("password").distinct().count() == 1
+        assert CustomUser.objects.first().check_password("password")
+
+    def test_recurrences_pass_validation(self):
+        call_command("seed", users=2, tasks=300, recurring_ratio=1, stdout=StringIO())
+
+        for recurring_task in RecurringTask.objects.all():
+            recurring_task.clean()
+
+    def test_refuses_to_reuse_a_prefix(self):
+        call_command("seed", users=1, tasks=1, stdout=StringIO())
+
+        with pytest.raises(CommandError):
+            call_command("seed", users=1, tasks=1, stdout=StringIO())
+
+        call_command("seed", users=1, tasks=1, seed=1, stdout=StringIO())
+        assert CustomUser.objects.count() == 2
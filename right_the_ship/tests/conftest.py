@@ -1,6 +1,7 @@
 import os
 import sys
 import django
+import pytest
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
@@ -8,3 +9,11 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 def pytest_configure():
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "right_the_ship.settings")
     django.setup()
+
+
+@pytest.fixture
+def query_budget():
+    """QueryBudget, for `with query_budget(max_queries, max_seconds):` blocks."""
+    from right_the_ship.tests.query_budget import QueryBudget
+
+    return QueryBudget
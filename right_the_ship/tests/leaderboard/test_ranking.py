@@ -0,0 +1,78 @@
+import bisect
+import random
+
+from django.test import SimpleTestCase
+
+from right_the_ship.core.leaderboard.boards import Entry, Leaderboard
+from right_the_ship.core.leaderboard.ranking import RankTree
+
+
+class TestRankTree(SimpleTestCase):
+    def assert_matches(self, tree, keys):
+        assert len(tree) == len(keys)
+        for rank, key in enumerate(keys):
+            assert tree.rank(key) == rank
+            assert tree.at(rank) == key
+        for start in range(len(keys) + 1):
+            assert tree.keys(start, 5) == keys[start : start + 5]
+
+    def test_matches_a_sorted_list_through_inserts_and_removes(self):
+        rng = random.Random(0)
+        keys = sorted(rng.sample(range(1000), 100))
+        tree = RankTree.from_sorted(keys, seed=0)
+        self.assert_matches(tree, keys)
+
+        for _ in range(300):
+            key = rng.randrange(1000)
+            if key in keys:
+                tree.remove(key)
+                keys.remove(key)
+            else:
+                tree.insert(key)
+                bisect.insort(keys, key)
+        self.assert_matches(tree, keys)
+
+    def test_from_sorted_keeps_treap_order(self):
+        tree = RankTree.from_sorted(list(range(100)), seed=1)
+
+        def check(node):
+            for child in (node.left, node.right):
+                if child:
+                    assert child.priority <= node.priority
+                    check(child)
+
+        check(tree.root)
+
+    def test_empty(self):
+        tree = RankTree()
+
+        assert len(tree) == 0
+        assert tree.keys(0, 10) == []
+        with self.assertRaises(IndexError):
+            tree.at(0)
+
+
+class TestLeaderboard(SimpleTestCase):
+    def test_ranks_by_score_then_user_id(self):
+        board = Leaderboard({1: 10, 2: 30, 3: 10, 4: 0})
+
+        assert board.page(0, 10) == [Entry(0, 2, 30), Entry(1, 1, 10), Entry(2, 3, 10)]
+        assert board.rank(4) is None
+
+    def test_set_moves_users(self):
+        board = Leaderboard({1: 10, 2: 30})
+        board.set(1, 40)
+        board.set(3, 20)
+        board.set(2, 0)
+
+        assert board.page(0, 10) == [Entry(0, 1, 40), Entry(1, 3, 20)]
+        assert len(board) == 2
+
+    def test_around_centers_on_the_user_and_stays_on_the_board(self):
+        board = Leaderboard({user_id: 100 - user_id for user_id in range(1, 11)})
+
+        assert [e.user_id for e in board.around(5, 3)] == [4, 5, 6]
+        assert [e.user_id for e in board.around(1, 3)] == [1, 2, 3]
+        assert [e.user_id for e in board.around(10, 3)] == [8, 9, 10]
+        assert len(board.around(5, 50)) == 10
+        assert board.around(99, 3) is None
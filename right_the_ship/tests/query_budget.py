@@ -0,0 +1,128 @@
+"""
+Query and wall-time budgets for calls to the API routes.
+
+    class TestCreateTask(QueryBudgetMixin, TestCase):
+        # Every call to `create_task` made by these tests (through the name
+        # imported into the test module) may issue at most 3 queries
+        query_budgets = {"create_task": 3}
+
+        def test_something(self):
+            with self.assertQueryBudget(2):
+                self.client.get("/api/tasks/1/")
+
+Budgets are a query count, or a (query count, seconds) pair. The time
+budget defaults to DEFAULT_MAX_SECONDS and every time budget is multiplied by
+the QUERY_BUDGET_TIME_SCALE environment variable, for slow CI machines.
+Under pytest, the `query_budget` fixture returns QueryBudget.
+"""
+
+import functools
+import os
+import sys
+import time
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+DEFAULT_MAX_SECONDS = 1.0
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryBudget:
+    """
+    Fails the block if it issues more than `max_queries` queries or runs
+    longer than `max_seconds`, listing the SQL it issued. Use `async with`
+    in async tests so queries are captured on the thread that runs them.
+    """
+
+    def __init__(
+        self,
+        max_queries=None,
+        max_seconds=DEFAULT_MAX_SECONDS,
+        label="block",
+        using=DEFAULT_DB_ALIAS,
+    ):
+        self.max_queries = max_queries
+        self.max_seconds = (
+            max_seconds * float(os.environ.get("QUERY_BUDGET_TIME_SCALE", 1))
+            if max_seconds is not None
+            else None
+        )
+        self.label = label
+        self.using = using
+
+    def __enter__(self):
+        self.context = CaptureQueriesContext(connections[self.using])
+        self.context.__enter__()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.started
+        self.context.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None:
+            self.check(elapsed)
+
+    async def __aenter__(self):
+        return await sync_to_async(self.__enter__)()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await sync_to_async(self.__exit__)(exc_type, exc_value, traceback)
+
+    def check(self, elapsed: float):
+        queries = self.context.captured_queries
+        problems = []
+        if self.max_queries is not None and len(queries) > self.max_queries:
+            problems.append(f"{len(queries)} queries (budget {self.max_queries})")
+        if self.max_seconds is not None and elapsed > self.max_seconds:
+            problems.append(f"{elapsed:.3f}s (budget {self.max_seconds:.3f}s)")
+
+        if problems:
+            statements = "\n".join(
+                f"  {number}. {query['sql']}"
+                for number, query in enumerate(queries, start=1)
+            )
+            raise QueryBudgetExceeded(
+                f"{self.label} took {' and '.join(problems)}:\n{statements}"
+            )
+
+
+def budgeted(view, budget, label=None):
+    """Wraps `view` so every call runs inside its budget."""
+    max_queries, max_seconds = (
+        budget if isinstance(budget, tuple) else (budget, DEFAULT_MAX_SECONDS)
+    )
+
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        with QueryBudget(max_queries, max_seconds, label=label or view.__name__):
+            return view(*args, **kwargs)
+
+    return wrapper
+
+
+class QueryBudgetMixin:
+    """
+    Puts the routes named in `query_budgets` under budget for the whole test
+    class, by swapping them in the test module's namespace.
+    """
+
+    query_budgets = {}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        module = sys.modules[cls.__module__]
+        for name, budget in cls.query_budgets.items():
+            view = budgeted(getattr(module, name), budget, f"{cls.__name__}.{name}")
+            patcher = patch.object(module, name, view)
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    def assertQueryBudget(self, max_queries=None, max_seconds=DEFAULT_MAX_SECONDS):
+        return QueryBudget(max_queries, max_seconds, label=self.id())
@@ -0,0 +1,208 @@
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from right_the_ship.core.models import CustomUser, RecurringTask, Task, TaskOccurrence
+from right_the_ship.core.reminders.backends import FileBackend, get_reminder_backend
+from right_the_ship.core.reminders.scheduler import (
+    Reminder,
+    ReminderHeap,
+    ReminderScheduler,
+    start_of_day,
+)
+
+
+class TestReminderHeap(SimpleTestCase):
+    def reminder(self, minutes, task_id, occurrence_date=None):
+        now = timezone.now()
+        fire_at = now + timedelta(minutes=minutes)
+        return Reminder(fire_at, task_id, 1, "Task", fire_at, occurrence_date)
+
+    def test_pops_in_fire_order(self):
+        heap = ReminderHeap()
+        late, early = self.reminder(10, 1), self.reminder(5, 2)
+        heap.push(late)
+        heap.push(early)
+
+        assert heap.next_fire_at() == early.fire_at
+        assert heap.pop_due(late.fire_at) == [early, late]
+        assert len(heap) == 0
+
+    def test_replaced_and_discarded_reminders_never_fire(self):
+        heap = ReminderHeap()
+        heap.push(self.reminder(5, 1))
+        moved = self.reminder(20, 1)
+        heap.push(moved)
+        heap.push(self.reminder(5, 2))
+        heap.discard_task(2)
+
+        assert heap.pop_due(moved.fire_at - timedelta(minutes=1)) == []
+        assert heap.pop_due(moved.fire_at) == [moved]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = timezone.now()
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **delta):
+        self.now += timedelta(**delta)
+
+
+class TestReminderScheduler(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            username="testuser", password="password", email="test@example.com"
+        )
+        self.clock = FakeClock()
+        self.delivered = []
+        self.scheduler = ReminderScheduler(
+            self.delivered.extend,
+            horizon=timedelta(days=2),
+            lead=timedelta(minutes=30),
+            poll_interval=timedelta(seconds=30),
+            clock=self.clock,
+        )
+
+    def task(self, title, due_in, **fields):
+        return Task.objects.create(
+            user=self.user, title=title, due_date=self.clock.now + due_in, **fields
+        )
+
+    def titles(self):
+        return [reminder.title for reminder in self.delivered]
+
+    def test_fires_open_tasks_in_the_window_before_their_due_date(self):
+        self.task("Soon", timedelta(hours=1))
+        self.task("Later", timedelta(hours=3))
+        self.task("Done", timedelta(hours=1), completed=True)
+        self.task("Next week", timedelta(days=7))
+        self.scheduler.start()
+
+        self.clock.advance(minutes=29)
+        self.scheduler.tick()
+        assert self.delivered == []
+
+        self.clock.advance(minutes=2)
+        self.scheduler.tick()
+        assert self.titles() == ["Soon"]
+        assert self.delivered[0].fire_at == self.delivered[0].due - timedelta(
+            minutes=30
+        )
+
+        self.clock.advance(hours=3)
+        self.scheduler.tick()
+        assert self.titles() == ["Soon", "Later"]
+
+    def test_picks_up_changes_incrementally(self):
+        moved = self.task("Moved", timedelta(hours=1))
+        completed = self.task("Completed", timedelta(hours=1))
+        self.scheduler.start()
+
+        moved.due_date += timedelta(hours=2)
+        moved.save()
+        Task.objects.filter(id=completed.id).update(
+            completed=True, updated_at=timezone.now()
+        )
+        self.task("Created", timedelta(hours=1))
+
+        # Poll, slide the window and re-check what fires; the poll reads only
+        # tasks written since the last one
+        self.clock.advance(minutes=31)
+        with self.assertNumQueries(6):
+            self.scheduler.tick()
+        assert self.titles() == ["Created"]
+
+        self.clock.advance(hours=2)
+        self.scheduler.tick()
+        assert self.titles() == ["Created", "Moved"]
+
+    def test_fires_recurring_occurrences(self):
+        daily = Task.objects.create(user=self.user, title="Daily")
+        RecurringTask.objects.create(
+            task=daily,
+            frequency=RecurringTask.DAILY,
+            start_date=timezone.localdate(),
+        )
+        self.scheduler.start()
+        tomorrow = timezone.localdate() + timedelta(days=1)
+
+        self.clock.now = start_of_day(tomorrow) - timedelta(minutes=30)
+        self.scheduler.tick()
+
+        assert [(r.title, r.occurrence_date) for r in self.delivered] == [
+            ("Daily", tomorrow)
+        ]
+
+    def test_occurrences_completed_after_scheduling_do_not_fire(self):
+        daily = Task.objects.create(user=self.user, title="Daily")
+        RecurringTask.objects.create(
+            task=daily,
+            frequency=RecurringTask.DAILY,
+            start_date=timezone.localdate(),
+        )
+        self.scheduler.start()
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        TaskOccurrence.objects.filter(task=daily, occurrence_date=tomorrow).update(
+            completed=True
+        )
+
+        self.clock.now = start_of_day(tomorrow)
+        self.scheduler.tick()
+
+        assert self.delivered == []
+
+
+class TestReminderBackends(TestCase):
+    def test_file_backend_appends_ndjson(self):
+        now = timezone.now()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "reminders.ndjson"
+            backend = FileBackend(path)
+            backend.deliver([Reminder(now, 1, 2, "Pay rent", now)])
+            backend.close()
+
+            line = json.loads(path.read_text())
+
+        assert line["task_id"] == 1
+        assert line["title"] == "Pay rent"
+        assert line["occurrence_date"] is None
+
+    def test_backend_by_name_or_path(self):
+        assert type(get_reminder_backend("log")).__name__ == "LogBackend"
+        assert (
+            type(
+                get_reminder_backend(
+                    "right_the_ship.core.reminders.backends.LogBackend"
+                )
+            ).__name__
+            == "LogBackend"
+        )
+
+    def test_run_reminders_command(self):
+        user = CustomUser.objects.create(username="testuser", password="password")
+        Task.objects.create(
+            user=user, title="Soon", due_date=timezone.now() + timedelta(hours=2)
+        )
+        stdout = StringIO()
+
+        with tempfile.TemporaryDirectory() as directory, override_settings(
+            REMINDER_FILE=Path(directory) / "reminders.ndjson"
+        ):
+            call_command(
+                "run_reminders",
+                backend="file",
+                lead_minutes=60,
+                duration=0.01,
+                stdout=stdout,
+            )
+
+        assert "1 reminders scheduled" in stdout.getvalue()
@@ -0,0 +1,63 @@
+from django.test import SimpleTestCase
+
+from right_the_ship.core.utils.completion_bits import (
+    is_completed,
+    longest_run,
+    set_completed,
+    streak,
+    to_bytes,
+)
+
+
+def bits_of(pattern: str) -> bytes:
+    """Occurrence 0 first, e.g. "1101" completes occurrences 0, 1 and 3."""
+    return to_bytes(int(pattern[::-1], 2)) if pattern else b""
+
+
+def longest_run_by_scan(pattern: str) -> int:
+    return max((len(run) for run in pattern.split("0")), default=0)
+
+
+class TestCompletionBits(SimpleTestCase):
+    def test_set_and_clear(self):
+        bits = set_completed(b"", 9)
+        bits = set_completed(bits, 2)
+
+        assert [i for i in range(12) if is_completed(bits, i)] == [2, 9]
+        assert set_completed(set_completed(bits, 9, False), 2, False) == b""
+
+    def test_longest_run_across_byte_boundaries(self):
+        patterns = [
+            "",
+            "0",
+            "1",
+            "1" * 8,
+            "0111111110",
+            "1" * 17 + "0" + "1" * 30,
+            "10" * 40 + "1" * 9,
+            "0000000" + "1" * 16 + "0001",
+        ]
+        for pattern in patterns:
+            value = int(pattern[::-1], 2) if pattern else 0
+            assert longest_run(value, len(pattern)) == longest_run_by_scan(pattern)
+
+    def test_streaks(self):
+        summary = streak(bits_of("1101110111"), 10)
+
+        assert summary.current == 3
+        assert summary.longest == 3
+        assert summary.completed == 8
+        assert summary.completion_rate == 0.8
+
+    def test_bits_past_the_due_count_are_ignored(self):
+        summary = streak(bits_of("11111"), 3)
+
+        assert (summary.current, summary.longest, summary.completed) == (3, 3, 3)
+
+    def test_an_open_occurrence_today_does_not_break_the_streak(self):
+        assert streak(bits_of("1110"), 4, last_is_today=True).current == 3
+        assert streak(bits_of("1110"), 4).current == 0
+
+    def test_nothing_due(self):
+        assert streak(b"", 0) == (0, 0, 0, 0)
+        assert streak(b"", 0).completion_rate == 0.0
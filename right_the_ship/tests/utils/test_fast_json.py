@@ -0,0 +1,57 @@
+import importlib
+import json
+import sys
+from datetime import date
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+
+from right_the_ship.core.schemas.task import TaskSchema
+from right_the_ship.core.utils import fast_json
+
+DATA = {
+    "task": TaskSchema(
+        id=1, title="Rent", description=None, due_date=date(2024, 8, 1), completed=False
+    ),
+    "start_date": date(2024, 8, 1),
+    "day": None,
+}
+
+EXPECTED = {
+    "task": {
+        "id": 1,
+        "title": "Rent",
+        "description": None,
+        "due_date": "2024-08-01",
+        "completed": False,
+    },
+    "start_date": "2024-08-01",
+    "day": None,
+}
+
+
+class TestFastJson(SimpleTestCase):
+    def test_dumps_dates_and_schemas(self):
+        assert json.loads(fast_json.dumps(DATA)) == EXPECTED
+
+    def test_standard_library_fallback(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = importlib.reload(fast_json)
+        self.addCleanup(importlib.reload, fast_json)
+
+        assert fallback.orjson is None
+        assert json.loads(fallback.dumps(DATA)) == EXPECTED
+
+    def test_decorator_wraps_sync_and_async_views(self):
+        @fast_json.fast_json
+        def view(request):
+            return {"day": 3}
+
+        @fast_json.fast_json
+        async def async_view(request):
+            return {"day": 3}
+
+        for response in (view(None), async_to_sync(async_view)(None)):
+            assert response["Content-Type"] == "application/json"
+            assert json.loads(response.content) == {"day": 3}
@@ -0,0 +1,54 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.hashers import check_password
+from django.test import SimpleTestCase, override_settings
+from ninja.errors import HttpError
+
+from right_the_ship.core.utils.password_pool import (
+    hash_password,
+    shutdown_password_pool,
+    submit_password_hash,
+)
+
+
+@override_settings(
+    PASSWORD_HASH_EXECUTOR="thread", PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_QUEUE=1
+)
+class TestPasswordPool(SimpleTestCase):
+    def setUp(self):
+        shutdown_password_pool()
+        self.addCleanup(shutdown_password_pool)
+
+    def test_hash_password(self):
+        hashed = hash_password("hunter22")
+
+        assert hashed != "hunter22"
+        assert check_password("hunter22", hashed)
+
+    def test_full_pool_returns_429(self):
+        release = threading.Event()
+
+        def slow_hash(raw_password):
+            release.wait(5)
+            return raw_password
+
+        with patch("right_the_ship.core.utils.password_pool.make_password", slow_hash):
+            running = submit_password_hash("one")
+            queued = submit_password_hash("two")
+
+            with pytest.raises(HttpError) as excinfo:
+                submit_password_hash("three")
+
+            # Callbacks run in order, so these fire after the slots are freed
+            freed = [threading.Event(), threading.Event()]
+            running.add_done_callback(lambda _: freed[0].set())
+            queued.add_done_callback(lambda _: freed[1].set())
+            release.set()
+
+            assert (running.result(), queued.result()) == ("one", "two")
+            assert all(event.wait(5) for event in freed)
+
+        assert excinfo.value.status_code == 429
+        assert check_password("three", hash_password("three"))
@@ -0,0 +1,26 @@
+import pytest
+from django.test import TestCase
+
+from right_the_ship.core.models import CustomUser
+from right_the_ship.tests.query_budget import QueryBudget, QueryBudgetExceeded
+
+
+class TestQueryBudget(TestCase):
+    def test_within_budget(self):
+        with QueryBudget(1):
+            CustomUser.objects.count()
+
+    def test_over_budget_lists_the_sql(self):
+        with pytest.raises(QueryBudgetExceeded) as excinfo:
+            with QueryBudget(1, label="two counts"):
+                CustomUser.objects.count()
+                CustomUser.objects.filter(is_staff=True).count()
+
+        message = str(excinfo.value)
+        assert message.startswith("two counts took 2 queries (budget 1)")
+        assert '2. SELECT COUNT(*) AS "__count" FROM "core_customuser"' in message
+
+    def test_over_time_budget(self):
+        with pytest.raises(QueryBudgetExceeded, match="budget 0.000s"):
+            with QueryBudget(max_seconds=0):
+                CustomUser.objects.count()
@@ -0,0 +1,126 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from right_the_ship.core.utils.recurrence import (
+    expand_occurrences,
+    occurrence_at,
+    occurrence_index,
+    occurrences_through,
+)
+
+
+class TestExpandOccurrences(SimpleTestCase):
+    def expand(self, frequency, day, window_start, window_end, **rule):
+        return list(
+            expand_occurrences(
+                frequency,
+                rule.get("start_date", date(2020, 1, 1)),
+                rule.get("end_date"),
+                day,
+                window_start,
+                window_end,
+            )
+        )
+
+    def test_daily_is_clipped_to_rule_and_window(self):
+        occurrences = self.expand(
+            "daily",
+            None,
+            date(2021, 1, 1),
+            date(2021, 1, 31),
+            start_date=date(2021, 1, 10),
+            end_date=date(2021, 1, 12),
+        )
+
+        assert occurrences == [date(2021, 1, 10), date(2021, 1, 11), date(2021, 1, 12)]
+
+    def test_weekly_days_count_from_sunday(self):
+        sundays = self.expand("weekly", 0, date(2024, 8, 1), date(2024, 8, 31))
+        mondays = self.expand("weekly", 1, date(2024, 8, 1), date(2024, 8, 31))
+
+        assert sundays == [date(2024, 8, d) for d in (4, 11, 18, 25)]
+        assert mondays == [date(2024, 8, d) for d in (5, 12, 19, 26)]
+
+    def test_monthly_day_31_clamps_to_month_end(self):
+        occurrences = self.expand("monthly", 31, date(2023, 1, 1), date(2024, 4, 30))
+
+        assert occurrences[:4] == [
+            date(2023, 1, 31),
+            date(2023, 2, 28),
+            date(2023, 3, 31),
+            date(2023, 4, 30),
+        ]
+        assert date(2024, 2, 29) in occurrences
+        assert len(occurrences) == 16
+
+    def test_yearly_day_366_clamps_to_december_31st(self):
+        occurrences = self.expand("yearly", 366, date(2023, 1, 1), date(2025, 12, 31))
+
+        assert occurrences == [
+            date(2023, 12, 31),
+            date(2024, 12, 31),
+            date(2025, 12, 31),
+        ]
+
+    def test_yearly_day_60_is_february_29th_in_leap_years(self):
+        occurrences = self.expand("yearly", 60, date(2023, 1, 1), date(2024, 12, 31))
+
+        assert occurrences == [date(2023, 3, 1), date(2024, 2, 29)]
+
+    def test_missing_day_falls_back_to_start_date(self):
+        occurrences = self.expand(
+            "monthly",
+            None,
+            date(2021, 1, 1),
+            date(2021, 3, 31),
+            start_date=date(2020, 12, 15),
+        )
+
+        assert occurrences == [date(2021, 1, 15), date(2021, 2, 15), date(2021, 3, 15)]
+
+    def test_rule_outside_window_yields_nothing(self):
+        occurrences = self.expand(
+            "daily",
+            None,
+            date(2021, 1, 1),
+            date(2021, 1, 31),
+            end_date=date(2020, 12, 31),
+        )
+
+        assert occurrences == []
+
+
+class TestOccurrenceIndex(SimpleTestCase):
+    rules = [
+        ("daily", date(2021, 1, 10), None),
+        ("weekly", date(2021, 1, 10), 3),
+        ("monthly", date(2021, 1, 10), 31),
+        ("yearly", date(2020, 3, 1), 366),
+    ]
+
+    def test_indexes_match_expansion_order(self):
+        for frequency, start_date, day in self.rules:
+            occurrences = list(
+                expand_occurrences(
+                    frequency, start_date, None, day, start_date, date(2028, 12, 31)
+                )
+            )
+            for index, occurrence in enumerate(occurrences):
+                assert occurrence_index(frequency, start_date, day, occurrence) == index
+                assert occurrence_at(frequency, start_date, day, index) == occurrence
+            assert occurrences_through(
+                frequency, start_date, day, date(2028, 12, 31)
+            ) == len(occurrences)
+
+    def test_dates_the_rule_skips_have_no_index(self):
+        assert occurrence_index("weekly", date(2021, 1, 10), 3, date(2021, 1, 13)) == 0
+        assert (
+            occurrence_index("weekly", date(2021, 1, 10), 3, date(2021, 1, 14)) is None
+        )
+        assert (
+            occurrence_index("monthly", date(2021, 1, 10), 5, date(2021, 1, 5)) is None
+        )
+        assert (
+            occurrence_index("daily", date(2021, 1, 10), None, date(2021, 1, 9)) is None
+        )
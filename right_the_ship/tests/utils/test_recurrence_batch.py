@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from right_the_ship.core.models import CustomUser, Task, RecurringTask
+from right_the_ship.core.utils.recurrence_batch import (
+    build_rule_arrays,
+    due_on,
+    due_on_per_row,
+)
+
+
+class TestDueOn(SimpleTestCase):
+    rows = [
+        (1, 1, "daily", date(2024, 1, 1), None, None),
+        (2, 1, "weekly", date(2024, 1, 1), None, 4),
+        (3, 1, "weekly", date(2024, 1, 4), None, None),
+        (4, 2, "monthly", date(2023, 1, 1), None, 31),
+        (5, 2, "monthly", date(2023, 1, 15), date(2024, 3, 31), None),
+        (6, 2, "yearly", date(2020, 1, 1), None, 366),
+        (7, 3, "yearly", date(2020, 2, 29), None, None),
+        (8, 3, "daily", date(2024, 6, 1), date(2024, 6, 30), None),
+    ]
+
+    def test_matches_per_row_expansion_for_every_day_of_a_leap_year(self):
+        rules = build_rule_arrays(self.rows)
+
+        target = date(2024, 1, 1)
+        while target.year == 2024:
+            task_ids, _ = due_on(rules, target)
+            expected = [task_id for task_id, _ in due_on_per_row(self.rows, target)]
+            assert sorted(task_ids.tolist()) == expected, target
+            target += timedelta(days=1)
+
+    def test_empty_rule_set(self):
+        task_ids, user_ids = due_on(build_rule_arrays([]), date(2024, 1, 1))
+
+        assert len(task_ids) == 0
+        assert len(user_ids) == 0
+
+
+class TestDueOccurrencesCommand(TestCase):
+    def test_prints_user_and_task_of_each_occurrence(self):
+        user = CustomUser.objects.create(username="testuser", password="password")
+        task = Task.objects.create(user=user, title="Daily")
+        RecurringTask.objects.create(
+            task=task, frequency=RecurringTask.DAILY, start_date=date(2024, 1, 1)
+        )
+
+        stdout = StringIO()
+        call_command(
+            "due_occurrences", date=date(2024, 5, 1), stdout=stdout, stderr=StringIO()
+        )
+
+        assert stdout.getvalue() == f"{user.id}\t{task.id}\n"
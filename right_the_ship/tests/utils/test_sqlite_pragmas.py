@@ -0,0 +1,27 @@
+import tempfile
+from pathlib import Path
+
+from django.db import connections
+from django.test import SimpleTestCase
+
+
+class TestSqlitePragmas(SimpleTestCase):
+    def test_new_connections_use_wal(self):
+        with tempfile.TemporaryDirectory() as directory:
+            default = connections["default"]
+            wrapper = default.__class__(
+                {**default.settings_dict, "NAME": Path(directory) / "db.sqlite3"},
+                alias="pragmas",
+            )
+            try:
+                with wrapper.cursor() as cursor:
+                    cursor.execute("PRAGMA journal_mode")
+                    journal_mode = cursor.fetchone()[0]
+                    cursor.execute("PRAGMA synchronous")
+                    synchronous = cursor.fetchone()[0]
+            finally:
+                wrapper.close()
+
+        assert journal_mode == "wal"
+        # 1 is NORMAL
+        assert synchronous == 1